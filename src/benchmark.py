@@ -0,0 +1,222 @@
+"""
+Benchmarks für die Vigenere-Verschlüsselung
+Vergleicht die tabellenbasierte Implementierung mit der bisherigen
+zeichenweisen Referenzimplementierung.
+"""
+
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from vigenere_cipher import VigenereCipher
+
+
+# -------------------------------------------------
+# Referenz (bisherige zeichenweise Implementierung)
+# -------------------------------------------------
+
+def legacy_encrypt(key: str, plaintext: str) -> str:
+    """Zeichenweise Verschlüsselung wie vor der Tabellen-Engine"""
+    key = key.upper()
+    plaintext = plaintext.upper()
+
+    key_index = 0
+    ciphertext = []
+    for char in plaintext:
+        if char.isalpha():
+            shift = ord(key[key_index % len(key)]) - ord('A')
+            ciphertext.append(chr((ord(char) - ord('A') + shift) % 26 + ord('A')))
+            key_index += 1
+        else:
+            ciphertext.append(char)
+
+    return ''.join(ciphertext)
+
+
+def legacy_encrypt_lowercase(key: str, plaintext: str) -> str:
+    """upper() + Verschlüsselung + zeichenweise Wiederherstellung der Kleinschreibung"""
+    encrypted = legacy_encrypt(key, plaintext.upper())
+
+    result = []
+    for original, encrypted_char in zip(plaintext, encrypted):
+        if original.islower() and encrypted_char.isalpha():
+            result.append(encrypted_char.lower())
+        else:
+            result.append(encrypted_char)
+
+    return ''.join(result)
+
+
+def legacy_apply_fake_bits(ciphertext: str) -> str:
+    """Ein random.choice-Aufruf pro Zeichen wie vor dem Bulk-Verfahren"""
+    result = []
+    for char in ciphertext:
+        result.append(random.choice(string.ascii_lowercase))
+        result.append(char)
+    return ''.join(result)
+
+
+# -------------------------------------------------
+# Hilfsfunktionen
+# -------------------------------------------------
+
+def make_text(size: int, seed: int = 42) -> str:
+    """Erzeugt einen zufälligen Text mit Buchstaben, Leerzeichen und Satzzeichen"""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters * 4 + "     ,.!\n"
+    return ''.join(rng.choice(alphabet) for _ in range(size))
+
+
+def measure(func, *args, repeat: int = 3) -> float:
+    """Gibt die beste Laufzeit (Sekunden) aus `repeat` Durchläufen zurück"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# -------------------------------------------------
+# Benchmarks
+# -------------------------------------------------
+
+def bench_encrypt(size: int = 1_000_000, key: str = "SCHLUESSEL"):
+    """Verschlüsselt `size` Zeichen mit alter und neuer Implementierung"""
+    text = make_text(size)
+    cipher = VigenereCipher(key)
+
+    assert cipher.encrypt(text) == legacy_encrypt(key, text)
+
+    legacy = measure(legacy_encrypt, key, text)
+    table = measure(cipher.encrypt, text)
+
+    print(f"--- encrypt ({size:,} Zeichen, Schlüssel {key}) ---")
+    print(f"Zeichenweise:   {legacy * 1000:>9.1f} ms")
+    print(f"Tabellen:       {table * 1000:>9.1f} ms")
+    print(f"Beschleunigung: {legacy / table:>9.1f}x\n")
+
+
+def bench_short_texts(count: int = 20_000, key: str = "px"):
+    """encrypt_lowercase auf vielen kurzen Texten (wie im Brute-Force-Worker)"""
+    rng = random.Random(7)
+    texts = [''.join(rng.choices(string.ascii_lowercase, k=24)) for _ in range(count)]
+    cipher = VigenereCipher(key)
+
+    def run_legacy():
+        for text in texts:
+            legacy_encrypt_lowercase(key, text)
+
+    def run_fused():
+        for text in texts:
+            cipher.encrypt_lowercase(text)
+
+    legacy = measure(run_legacy)
+    fused = measure(run_fused)
+
+    print(f"--- encrypt_lowercase ({count:,} Texte à 24 Zeichen) ---")
+    print(f"Zeichenweise:   {legacy * 1000:>9.1f} ms")
+    print(f"Einzeldurchlauf:{fused * 1000:>9.1f} ms")
+    print(f"Beschleunigung: {legacy / fused:>9.1f}x\n")
+
+
+def bench_chaff(size: int = 1_000_000):
+    """Fake-Zeichen einfügen: pro Zeichen vs. Bulk-Zufallsbytes"""
+    from cli import apply_fake_bits
+
+    text = make_text(size).lower()
+    legacy = measure(legacy_apply_fake_bits, text, repeat=1)
+    bulk = measure(apply_fake_bits, text)
+
+    print(f"--- Fake-Zeichen ({size:,} Zeichen) ---")
+    print(f"Pro Zeichen:    {legacy * 1000:>9.1f} ms")
+    print(f"Bulk:           {bulk * 1000:>9.1f} ms")
+    print(f"Beschleunigung: {legacy / bulk:>9.1f}x\n")
+
+
+def bench_file_modes(size: int = 4_000_000, key: str = "schluessel", code: str = "312"):
+    """Vergleicht zeilenweisen TXT-Modus, Streaming und mmap auf einer Datei"""
+    from cli import process_lines, process_lines_parallel, encrypt_stream, mmap_process_file
+
+    cipher = VigenereCipher(key)
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.txt"
+        output_path = Path(tmp) / "output.txt"
+        input_path.write_text(make_text(size), encoding="utf-8")
+
+        def run_stream():
+            with input_path.open("r", encoding="utf-8", newline="") as reader, \
+                    output_path.open("w", encoding="utf-8", newline="") as writer:
+                encrypt_stream(reader, writer, cipher, code)
+
+        modes = [
+            ("TXT (zeilenweise)", lambda: process_lines(input_path, output_path, cipher, code, "1")),
+            ("TXT (parallel)", lambda: process_lines_parallel(input_path, output_path, cipher, code, "1")),
+            ("Streaming", run_stream),
+            ("mmap (Vigenère)", lambda: mmap_process_file(input_path, output_path, cipher, "1")),
+        ]
+
+        print(f"--- Dateimodi ({size / 1e6:.0f} MB) ---")
+        for name, run in modes:
+            elapsed = measure(run, repeat=1)
+            print(f"{name:<18} {elapsed * 1000:>9.1f} ms  {size / elapsed / 1e6:>7.1f} MB/s")
+        print()
+
+
+def bench_mmap(size: int = 64_000_000, key: str = "schluessel"):
+    """mmap-Modus: translate-Abschnitte vs. vektorisiert (NumPy), Vigenère-Streaming als Vergleich"""
+    import cli
+    from cli import mmap_process_file
+
+    if cli.vigenere_numpy is None:
+        print("--- mmap: NumPy nicht installiert, übersprungen ---\n")
+        return
+
+    cipher = VigenereCipher(key)
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.txt"
+        output_path = Path(tmp) / "output.txt"
+        block = make_text(1_000_000).encode("ascii")
+        input_path.write_bytes(block * (size // len(block)))
+
+        def run_stream():
+            with input_path.open("r", encoding="utf-8", newline="") as reader, \
+                    output_path.open("w", encoding="utf-8", newline="") as writer:
+                cipher.stream_encrypt(reader, writer)
+
+        def run_translate():
+            numpy_module, cli.vigenere_numpy = cli.vigenere_numpy, None
+            try:
+                mmap_process_file(input_path, output_path, cipher, "1")
+            finally:
+                cli.vigenere_numpy = numpy_module
+
+        streaming = measure(run_stream, repeat=1)
+        translate = measure(run_translate, repeat=1)
+        expected = output_path.read_bytes()
+        vectorized = measure(lambda: mmap_process_file(input_path, output_path, cipher, "1"), repeat=1)
+        assert output_path.read_bytes() == expected
+
+        print(f"--- mmap ({size / 1e6:.0f} MB, nur Vigenère) ---")
+        for name, elapsed in (("Streaming", streaming), ("mmap (translate)", translate),
+                              ("mmap (NumPy)", vectorized)):
+            print(f"{name:<18} {elapsed * 1000:>9.1f} ms  {size / elapsed / 1e6:>7.1f} MB/s")
+        print(f"Beschleunigung: {translate / vectorized:>9.1f}x\n")
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("VIGENERE CIPHER - Benchmarks")
+    print("=" * 60 + "\n")
+
+    bench_encrypt()
+    bench_short_texts()
+    bench_chaff()
+    bench_file_modes()
+    bench_mmap()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,79 +1,26 @@
 import itertools
 import string
 import time
+from collections import defaultdict
 from math import factorial
-from pathlib import Path
 from vigenere_cipher import VigenereCipher
-
-# ==============================
-# PERMUTATION (aus deinem Code)
-# ==============================
-
-def inverse_permute_text(text: str, code: str) -> str:
-    code_indices = [int(c) - 1 for c in code]
-    n = len(code_indices)
-    result = []
-
-    for i in range(0, len(text), n):
-        block = list(text[i:i+n])
-        orig = [''] * len(block)
-        used = [0] * len(block)
-
-        for idx, code_idx in enumerate(code_indices):
-            if idx >= len(block):
-                continue
-            pos = code_idx
-            while pos < len(block) and used[pos]:
-                pos += 1
-            if pos >= len(block):
-                pos = 0
-                while used[pos]:
-                    pos += 1
-            orig[idx] = block[pos]
-            used[pos] = 1
-
-        result.extend(orig)
-
-    return ''.join(result)
-
+from transposition import get_plan
+from scoring import TextScorer, load_wordlist
+from progress import Progress
 
 # ==============================
 # SCORE FUNKTION
 # ==============================
 
-def load_wordlist():
-    """
-    Lädt die Wörter aus lists/wordlist-german.txt relativ zum Base-Verzeichnis
-    """
-    base_dir = Path(__file__).resolve().parent.parent
-    wordlist_path = base_dir / "lists" / "wordlist-german.txt"
-
-    words = set()
-    with open(wordlist_path, "r", encoding="utf-8") as f:
-        for line in f:
-            word = line.strip().lower()
-            if word:
-                words.add(word)
-    return words
-
-
 COMMON_WORDS = load_wordlist()
+SCORER = TextScorer(COMMON_WORDS)
 
 def score_text(text):
     """
     Bewertet, wie wahrscheinlich der Text Deutsch ist.
     Je höher, desto wahrscheinlicher.
     """
-    text = text.lower()
-    score = 0
-
-    for word in COMMON_WORDS:
-        score += text.count(word) * 10
-
-    for letter in "etaoinshrdlu":
-        score += text.count(letter)
-
-    return score
+    return SCORER.score(text)
 
 
 # ==============================
@@ -97,7 +44,10 @@ def generate_codes(max_len):
 # BRUTE FORCE
 # ==============================
 
-def brute_force(ciphertext, max_key_len, max_code_len):
+# Kandidaten zwischen zwei Meldungen an die Fortschrittsanzeige
+PROGRESS_BATCH = 1000
+
+def brute_force(ciphertext, max_key_len, max_code_len, metrics_path=None):
 
     total_keys = sum(26 ** i for i in range(1, max_key_len + 1))
     total_codes = sum(factorial(i) for i in range(2, max_code_len + 1))
@@ -109,21 +59,33 @@ def brute_force(ciphertext, max_key_len, max_code_len):
     best_result = None
     tested = 0
 
-    start_time = time.time()
+    progress = Progress(total_keys * total_codes, json_path=metrics_path)
+    timings = defaultdict(float)
 
     for code in generate_codes(max_code_len):
+        plan = get_plan(code)
         for key in generate_keys(max_key_len):
 
             tested += 1
+            if tested % PROGRESS_BATCH == 0:
+                progress.update(PROGRESS_BATCH, timings)
+                timings.clear()
 
             cipher = VigenereCipher(key)
 
             try:
+                t0 = time.perf_counter()
                 decrypted = cipher.decrypt_lowercase(ciphertext)
-                plaintext = inverse_permute_text(decrypted, code)
+                t1 = time.perf_counter()
+                plaintext = plan.inverse(decrypted)
+                t2 = time.perf_counter()
 
                 score = score_text(plaintext)
 
+                timings["decrypt"] += t1 - t0
+                timings["permute"] += t2 - t1
+                timings["score"] += time.perf_counter() - t2
+
                 if score > best_score:
                     best_score = score
                     best_result = (key, code, plaintext)
@@ -138,9 +100,8 @@ def brute_force(ciphertext, max_key_len, max_code_len):
             except:
                 continue
 
-            if tested % 100000 == 0:
-                elapsed = time.time() - start_time
-                print(f"{tested} Kombinationen getestet | {round(elapsed,2)} Sekunden")
+    progress.update(tested % PROGRESS_BATCH, timings)
+    progress.report()
 
     print("\n\n===== FERTIG =====")
     if best_result:
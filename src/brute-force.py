@@ -1,50 +1,60 @@
+import heapq
 import itertools
+import json
+import math
+import os
 import string
 import time
+from collections import defaultdict
 from math import factorial
 from pathlib import Path
 from multiprocessing import Pool, cpu_count
 from vigenere_cipher import VigenereCipher
+from transposition import get_plan
+from scoring import TextScorer, load_wordlist
+from ngram import get_model
+from vigenere_analysis import AnalysisContext, VigenereAnalysis, GERMAN_FREQUENCY
+from progress import Progress, timed
+
+try:
+    import numpy as np
+    import vigenere_numpy
+except ImportError:  # NumPy ist optional
+    np = vigenere_numpy = None
 
 # ==============================
-# PERMUTATION
+# WORDLIST LADEN
 # ==============================
 
-def inverse_permute_text(text: str, code: str) -> str:
-    code_indices = [int(c) - 1 for c in code]
-    n = len(code_indices)
-    result = []
-
-    for i in range(0, len(text), n):
-        block = text[i:i+n]
-        block_len = len(block)
-        orig = [''] * block_len
-
-        for idx, code_idx in enumerate(code_indices):
-            if idx < block_len and code_idx < block_len:
-                orig[idx] = block[code_idx]
-
-        result.extend(orig)
+_SCORER = None
 
-    return ''.join(result)
-
-# ==============================
-# WORDLIST LADEN
-# ==============================
+def get_scorer():
+    """
+    Lädt die Wordlist und kompiliert den Matcher beim ersten Aufruf.
 
-def load_wordlist():
-    base_dir = Path(__file__).resolve().parent.parent
-    wordlist_path = base_dir / "lists" / "wordlist-german.txt"
+    Der Elternprozess ruft dies vor dem Start des Pools auf; bei fork erben
+    die Worker den fertigen Matcher (copy-on-write), sonst lädt ihn
+    init_worker genau einmal pro Prozess.
+    """
+    global _SCORER
+    if _SCORER is None:
+        _SCORER = TextScorer(load_wordlist())
+    return _SCORER
 
-    words = set()
-    with open(wordlist_path, "r", encoding="utf-8") as f:
-        for line in f:
-            w = line.strip().lower()
-            if w:
-                words.add(w)
-    return words
+# Zustand eines Worker-Prozesses (gesetzt von init_worker)
+_WORKER = {}
 
-COMMON_WORDS = load_wordlist()
+def init_worker(ciphertext, prefilter=None, top_k=None):
+    """
+    Initializer für den Pool: übernimmt Geheimtext und Einstellungen einmal
+    pro Prozess, damit die einzelnen Tasks nur kleine Deskriptoren sind.
+    """
+    _WORKER["ciphertext"] = ciphertext
+    _WORKER["prefilter"] = prefilter
+    _WORKER["top_k"] = RESULTS_TOP_K if top_k is None else top_k
+    get_scorer()
+    if prefilter is not None and prefilter < 1:
+        get_model()
 
 # ==============================
 # SCORE / WORT-PRÜFUNG
@@ -56,25 +66,7 @@ def analyze_text(text):
     Berechnet Score = Summe der Wortlängen + 100*Abdeckung.
     Ignoriert alles ohne echte Wörter.
     """
-    text = text.lower()
-    found_words = [w for w in COMMON_WORDS if w in text]
-
-    if not found_words:
-        return 0, []
-
-    # Abdeckung: wie viele Buchstaben des Textes gehören zu Wordlist-Wörtern
-    covered_letters = 0
-    for w in found_words:
-        # Zähle, wie oft Wort im Text vorkommt
-        covered_letters += text.count(w) * len(w)
-
-    coverage_ratio = covered_letters / len(text)
-
-    if coverage_ratio < 0.85:
-        return 0, []
-
-    score = int(coverage_ratio * 100) + sum(len(w) for w in found_words)
-    return score, found_words
+    return get_scorer().analyze(text)
 
 # ==============================
 # GENERATOREN
@@ -86,65 +78,417 @@ def generate_keys(max_len):
         for key in itertools.product(letters, repeat=length):
             yield ''.join(key)
 
+def key_from_index(index, length):
+    """Schlüssel Nummer `index` in der Reihenfolge von generate_keys (für eine Länge)"""
+    letters = []
+    for _ in range(length):
+        index, digit = divmod(index, 26)
+        letters.append(string.ascii_lowercase[digit])
+    return ''.join(reversed(letters))
+
+def generate_key_range(length, start, stop):
+    """Die Schlüssel Nummer start bis stop - 1 einer Länge"""
+    if start >= stop:
+        return
+    # Erster Schlüssel direkt berechnen, danach wie itertools.product weiterzählen
+    key = [ord(c) - 97 for c in key_from_index(start, length)]
+    for _ in range(stop - start):
+        yield ''.join(string.ascii_lowercase[i] for i in key)
+        position = length - 1
+        while position >= 0:
+            key[position] = (key[position] + 1) % 26
+            if key[position]:
+                break
+            position -= 1
+
 def generate_codes(max_len):
     for length in range(2, max_len + 1):
         for perm in itertools.permutations(range(1, length + 1)):
             yield ''.join(str(x) for x in perm)
 
+# ==============================
+# ENTSCHLÜSSELUNG ALLER SCHLÜSSEL
+# ==============================
+
+def decrypt_range(text, key_length, start, stop):
+    """
+    Liefert (key, plaintext) für die Schlüssel Nummer start bis stop - 1 einer Länge.
+    Mit NumPy werden tausende Schlüssel pro Aufruf vektorisiert entschlüsselt.
+    """
+    if vigenere_numpy is None or not text.isascii():
+        for key in generate_key_range(key_length, start, stop):
+            yield key, VigenereCipher(key).decrypt_lowercase(text)
+        return
+
+    for keys in vigenere_numpy.iter_key_batches(key_length, start=start, stop=stop):
+        plaintexts = vigenere_numpy.decrypt_batch(text, keys)
+        yield from zip(vigenere_numpy.keys_to_strings(keys), plaintexts)
+
+# ==============================
+# N-GRAMM-VORFILTER
+# ==============================
+
+# Anteil der Kandidaten je Block, die die Wordlist-Prüfung erreichen
+PREFILTER_FRACTION = 0.05
+# ... aber mindestens so viele (kleine Suchräume bleiben vollständig)
+PREFILTER_MIN_KEEP = 32
+PREFILTER_BATCH_SIZE = 4096
+
+def _keep_count(total, fraction):
+    return min(total, max(PREFILTER_MIN_KEEP, math.ceil(total * fraction)))
+
+def prefiltered_candidates(ciphertext, plan, key_length, start, stop, fraction=PREFILTER_FRACTION,
+                           language="de", timings=None):
+    """
+    Liefert (key, plaintext) für die im N-Gramm-Score besten Kandidaten
+    unter den Schlüsseln Nummer start bis stop - 1 der Länge key_length.
+
+    Die Schlüssel werden blockweise entschlüsselt und per N-Gramm-Tabelle
+    bewertet; nur der beste Anteil `fraction` jedes Blocks wird
+    zurückgegeben (fraction None oder >= 1 = kein Filter).
+
+    Ist `timings` ein Dict, werden darin die Sekunden für "decrypt",
+    "permute" und "prefilter" aufaddiert.
+    """
+    timings = defaultdict(float) if timings is None else timings
+
+    if fraction is None or fraction >= 1:
+        for key, decrypted in timed(decrypt_range(ciphertext, key_length, start, stop), timings, "decrypt"):
+            t0 = time.perf_counter()
+            plaintext = plan.inverse(decrypted)
+            timings["permute"] += time.perf_counter() - t0
+            yield key, plaintext
+        return
+
+    model = get_model(language)
+
+    def best(batch):
+        t0 = time.perf_counter()
+        selected = heapq.nlargest(_keep_count(len(batch), fraction), batch,
+                                  key=lambda item: model.score(item[1]))
+        timings["prefilter"] += time.perf_counter() - t0
+        return selected
+
+    if vigenere_numpy is None or not ciphertext.isascii():
+        batch = []
+        for key, decrypted in timed(decrypt_range(ciphertext, key_length, start, stop), timings, "decrypt"):
+            t0 = time.perf_counter()
+            batch.append((key, plan.inverse(decrypted)))
+            timings["permute"] += time.perf_counter() - t0
+            if len(batch) == PREFILTER_BATCH_SIZE:
+                yield from best(batch)
+                batch = []
+        if batch:
+            yield from best(batch)
+        return
+
+    # Buchstabenpositionen des Klartexts -> Index im Buchstaben-Array des Geheimtexts
+    letter_number = {}
+    for pos, char in enumerate(ciphertext):
+        if char.isascii() and char.isalpha():
+            letter_number[pos] = len(letter_number)
+    letter_order = [letter_number[pos] for pos in plan.inverse_order(len(ciphertext)) if pos in letter_number]
+    letters = vigenere_numpy.text_to_indices(ciphertext)
+
+    for keys in vigenere_numpy.iter_key_batches(key_length, PREFILTER_BATCH_SIZE, start, stop):
+        t0 = time.perf_counter()
+        decrypted = vigenere_numpy.decrypt_array(letters, keys)
+        t1 = time.perf_counter()
+        # Ein vektorisierter Lookup für alle Schlüssel des Blocks
+        scores = model.score_indices(decrypted[:, letter_order])
+        keep = _keep_count(len(keys), fraction)
+        if keep < len(keys):
+            keys = keys[np.argpartition(scores, -keep)[-keep:]]
+        t2 = time.perf_counter()
+        plaintexts = vigenere_numpy.decrypt_batch(ciphertext, keys)
+        t3 = time.perf_counter()
+        plaintexts = [plan.inverse(decrypted) for decrypted in plaintexts]
+        t4 = time.perf_counter()
+
+        timings["decrypt"] += (t1 - t0) + (t3 - t2)
+        timings["prefilter"] += t2 - t1
+        timings["permute"] += t4 - t3
+        yield from zip(vigenere_numpy.keys_to_strings(keys), plaintexts)
+
+# ==============================
+# BESTE TREFFER (BEGRENZT)
+# ==============================
+
+# Anzahl der besten Treffer, die behalten werden (pro Worker-Einheit und insgesamt)
+RESULTS_TOP_K = 1000
+
+def push_result(heap, result, top_k):
+    """
+    Fügt einen Treffer (score, key, code, plaintext) in einen Min-Heap ein,
+    der höchstens top_k Einträge hält; der schlechteste liegt an heap[0].
+    """
+    if len(heap) < top_k:
+        heapq.heappush(heap, result)
+    elif result > heap[0]:
+        heapq.heapreplace(heap, result)
+
 # ==============================
 # WORKER
 # ==============================
 
-def worker(args):
-    ciphertext, code, max_key_len = args
-    results = []
+# Standardgröße einer Arbeitseinheit: 26^3 Schlüssel (alle Schlüssel mit
+# demselben Präfix bis auf die letzten drei Buchstaben)
+DEFAULT_UNIT_SIZE = 26 ** 3
 
-    permuted = inverse_permute_text(ciphertext, code)
+def generate_units(max_code_len, max_key_len, unit_size=DEFAULT_UNIT_SIZE):
+    """
+    Zerlegt den Suchraum (Code x Schlüssellänge x Schlüsselbereich) in
+    gleich große Arbeitseinheiten (code, key_length, start, stop) mit
+    höchstens unit_size Schlüsseln, damit auch bei wenigen Codes alle
+    Kerne ausgelastet sind.
+    """
+    if unit_size < 1:
+        raise ValueError(f"unit_size muss mindestens 1 sein, nicht {unit_size}")
+    for code in generate_codes(max_code_len):
+        for key_length in range(1, max_key_len + 1):
+            total = 26 ** key_length
+            for start in range(0, total, unit_size):
+                yield code, key_length, start, min(start + unit_size, total)
+
+def worker(unit):
+    code, key_length, start, stop = unit
+    results = []
+    timings = defaultdict(float)
 
-    for key in generate_keys(max_key_len):
-        cipher = VigenereCipher(key)
-        plaintext = cipher.decrypt_lowercase(permuted)
+    plan = get_plan(code)
 
+    # N-Gramm-Vorfilter vor der teuren Wordlist-Prüfung
+    for key, plaintext in prefiltered_candidates(_WORKER["ciphertext"], plan, key_length, start, stop,
+                                                 _WORKER["prefilter"], timings=timings):
+        t0 = time.perf_counter()
         score, words = analyze_text(plaintext)
+        timings["score"] += time.perf_counter() - t0
         if score > 0:
-            results.append((score, key, code, plaintext))
+            push_result(results, (score, key, code, plaintext), _WORKER["top_k"])
+
+    stats = {"candidates": stop - start, "seconds": dict(timings), "worker": os.getpid()}
+    return unit_id(code, key_length, start), results, stats
+
+# ==============================
+# CHECKPOINT / FORTSETZEN
+# ==============================
+
+DEFAULT_STATE_PATH = Path(__file__).resolve().parent.parent / "data" / "bruteforce_state.json"
+# Mindestabstand zwischen zwei Checkpoints in Sekunden
+CHECKPOINT_INTERVAL = 30
+
+def unit_id(code, key_length, start):
+    """Kennung einer Arbeitseinheit (Code, Schlüssellänge, erster Schlüssel)"""
+    return f"{code}:{key_length}:{start}"
+
+class Checkpoint:
+    """
+    Zustand eines Brute-Force-Laufs: erledigte Arbeitseinheiten und die
+    bisher besten Treffer. Wird regelmäßig atomar in eine JSON-Datei
+    geschrieben, damit ein abgebrochener Lauf fortgesetzt werden kann.
+    """
+
+    def __init__(self, path, params, top_k=RESULTS_TOP_K):
+        self.path = Path(path)
+        self.params = params
+        self.top_k = top_k
+        self.done = set()
+        # Min-Heap der besten top_k Treffer
+        self.results = []
+        self.last_save = time.time()
+
+    @classmethod
+    def load(cls, path, params, top_k=RESULTS_TOP_K):
+        """
+        Lädt einen gespeicherten Zustand.
+
+        Raises:
+            ValueError: Wenn der Zustand zu einem anderen Lauf gehört
+        """
+        checkpoint = cls(path, params, top_k)
+        with open(checkpoint.path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        if state["params"] != params:
+            raise ValueError(f"Der Zustand in {checkpoint.path} gehört zu einem anderen Lauf "
+                             f"(Geheimtext oder Parameter weichen ab)")
+
+        checkpoint.done = set(state["done"])
+        for result in state["results"]:
+            push_result(checkpoint.results, tuple(result), top_k)
+        return checkpoint
+
+    def mark_done(self, unit, results):
+        """Markiert eine Einheit als erledigt und übernimmt ihre (begrenzten) Treffer"""
+        self.done.add(unit)
+        for result in results:
+            push_result(self.results, result, self.top_k)
+
+    def save(self):
+        """Schreibt den Zustand (erst in eine temporäre Datei, dann umbenennen)"""
+        state = {
+            "params": self.params,
+            "done": sorted(self.done),
+            "results": self.results,
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+        self.last_save = time.time()
+
+    def maybe_save(self):
+        if time.time() - self.last_save >= CHECKPOINT_INTERVAL:
+            self.save()
+
+    def remove(self):
+        if self.path.exists():
+            self.path.unlink()
+
+# ==============================
+# ERGEBNIS-STREAM (JSON LINES)
+# ==============================
+
+DEFAULT_STREAM_PATH = Path(__file__).resolve().parent.parent / "data" / "results.jsonl"
+# Höchstens so viele Sekunden liegen Treffer ungeschrieben im Puffer
+STREAM_FLUSH_INTERVAL = 2
 
-    return results
+class ResultStream:
+    """
+    Schreibt Treffer sofort beim Eintreffen als JSON Lines (ein Objekt pro
+    Zeile: score, key, code, plaintext, unit) in eine Datei, die nur
+    angehängt wird. So lässt sich der Fortschritt live mit `tail -f`
+    verfolgen und die Datei ohne Textparser weiterverarbeiten.
+    """
+
+    def __init__(self, path=DEFAULT_STREAM_PATH, append=False, flush_interval=STREAM_FLUSH_INTERVAL):
+        """
+        Args:
+            path: Zieldatei
+            append: An eine bestehende Datei anhängen (beim Fortsetzen),
+                    sonst wird sie neu angelegt
+            flush_interval: Sekunden zwischen zwei Flushes
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.count = 0
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+        self._last_flush = time.time()
+
+    def write(self, results, unit=None):
+        for score, key, code, plaintext in results:
+            record = {"score": score, "key": key, "code": code, "plaintext": plaintext, "unit": unit}
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.count += 1
+
+        if time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        self._last_flush = time.time()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 # ==============================
 # BRUTE FORCE
 # ==============================
 
-def brute_force(ciphertext, max_key_len, max_code_len):
+def brute_force(ciphertext, max_key_len, max_code_len, jobs=None, prefilter=PREFILTER_FRACTION,
+                state_path=DEFAULT_STATE_PATH, resume=False, unit_size=DEFAULT_UNIT_SIZE,
+                top_k=RESULTS_TOP_K, stream_path=DEFAULT_STREAM_PATH, metrics_path=None):
+    if top_k < 1:
+        raise ValueError(f"top_k muss mindestens 1 sein, nicht {top_k}")
+    if unit_size < 1:
+        raise ValueError(f"unit_size muss mindestens 1 sein, nicht {unit_size}")
     total_keys = sum(26 ** i for i in range(1, max_key_len + 1))
     total_codes = sum(factorial(i) for i in range(2, max_code_len + 1))
 
+    params = {
+        "ciphertext": ciphertext,
+        "max_key_len": max_key_len,
+        "max_code_len": max_code_len,
+        "prefilter": prefilter,
+        "unit_size": unit_size,
+    }
+    resume = resume and Path(state_path).exists()
+    if resume:
+        checkpoint = Checkpoint.load(state_path, params, top_k)
+        print(f"\nSetze fort: {len(checkpoint.done)} Arbeitseinheiten bereits erledigt")
+    else:
+        checkpoint = Checkpoint(state_path, params, top_k)
+
     print("\nGeschätzte Kombinationen:", total_keys * total_codes)
-    print("CPU-Kerne:", cpu_count())
+    jobs = jobs or cpu_count()
+    print("CPU-Kerne:", jobs)
     print("Startet Brute Force...\n")
 
     start_time = time.time()
 
-    tasks = [(ciphertext, code, max_key_len) for code in generate_codes(max_code_len)]
-
-    all_results = []
+    tasks = (
+        unit for unit in generate_units(max_code_len, max_key_len, unit_size)
+        if unit_id(*unit[:3]) not in checkpoint.done
+    )
+
+    # Beim Fortsetzen zählen die bereits erledigten Einheiten zum Fortschritt
+    done = sum(
+        stop - start
+        for code, key_length, start, stop in generate_units(max_code_len, max_key_len, unit_size)
+        if unit_id(code, key_length, start) in checkpoint.done
+    ) if checkpoint.done else 0
+    progress = Progress(total_keys * total_codes, done=done, json_path=metrics_path)
+
+    # Vor dem Pool laden, damit Worker Matcher und N-Gramm-Tabelle bei fork erben
+    init_worker(ciphertext, prefilter, top_k)
+
+    # Beim Fortsetzen anhängen; Einheiten nach dem letzten Checkpoint
+    # können dabei doppelt erscheinen (erkennbar am Feld "unit")
+    try:
+        with ResultStream(stream_path, append=resume) as stream, \
+                Pool(jobs, initializer=init_worker, initargs=(ciphertext, prefilter, top_k)) as pool:
+            print(f"Treffer werden live geschrieben nach: {stream.path.resolve()}\n")
+            for unit, result, stats in pool.imap_unordered(worker, tasks):
+                stream.write(result, unit)
+                checkpoint.mark_done(unit, result)
+                checkpoint.maybe_save()
+                progress.update(stats["candidates"], stats["seconds"], stats["worker"])
+    except KeyboardInterrupt:
+        progress.report()
+        checkpoint.save()
+        print(f"\nAbgebrochen. Zustand gespeichert in: {checkpoint.path.resolve()}")
+        print("Mit --resume wird der Lauf fortgesetzt.")
+        return
 
-    with Pool(cpu_count()) as pool:
-        for result in pool.imap_unordered(worker, tasks):
-            if result:
-                all_results.extend(result)
+    progress.report()
+    checkpoint.remove()
+    report_results(checkpoint.results, start_time)
 
+def report_results(top_results, start_time):
+    """
+    Gibt die Laufzeit aus und speichert die Treffer sortiert in data/results.txt.
+    top_results ist ein begrenzter Heap (höchstens top_k Einträge).
+    """
     elapsed = round(time.time() - start_time, 2)
 
     print("\n===== FERTIG =====")
     print("Zeit:", elapsed, "Sekunden")
 
-    if not all_results:
+    if not top_results:
         print("Keine passenden Ergebnisse gefunden.")
         return
 
-    # Sortiere nach Score absteigend
-    all_results.sort(reverse=True, key=lambda x: x[0])
+    # Nach Score absteigend (nur die top_k Einträge des Heaps)
+    all_results = sorted(top_results, reverse=True)
 
     # In data/results.txt speichern
     output_path = Path(__file__).resolve().parent.parent / "data" / "results.txt"
@@ -159,6 +503,133 @@ def brute_force(ciphertext, max_key_len, max_code_len):
 
     print(f"\nErgebnisse gespeichert in: {output_path.resolve()}")
 
+# ==============================
+# FREQUENZANALYSE STATT ALLER SCHLÜSSEL
+# ==============================
+
+# Anzahl der wahrscheinlichsten Schlüssellängen (IC, Kasiski, Friedman), die probiert werden
+FREQUENCY_KEY_LENGTHS = 3
+# Anzahl der besten Buchstaben (Chi-Quadrat) pro Schlüsselposition
+FREQUENCY_TOP_LETTERS = 2
+# Obergrenzen pro Arbeitseinheit (Codes x Schlüssel)
+FREQUENCY_CODES_PER_TASK = 64
+FREQUENCY_KEYS_PER_TASK = 256
+
+def recover_keys(ciphertext, max_key_len, key_lengths=FREQUENCY_KEY_LENGTHS,
+                 top_letters=FREQUENCY_TOP_LETTERS, expected_freq=GERMAN_FREQUENCY):
+    """
+    Liefert Schlüsselkandidaten aus der Häufigkeitsanalyse.
+
+    Die Transposition ändert die Buchstabenhäufigkeiten nicht, und
+    Vigenère wird erst nach ihr angewendet. Schlüssellänge (rank_key_lengths) und jede
+    Schlüsselspalte (Chi-Quadrat) lassen sich daher direkt am Geheimtext
+    bestimmen, unabhängig vom Code. Aufgezählt werden nur die Kombinationen
+    der `top_letters` besten Buchstaben pro Spalte.
+    """
+    context = AnalysisContext.of(ciphertext)
+    seen = set()
+    for length, score in VigenereAnalysis.rank_key_lengths(context, max_key_len, expected_freq)[:key_lengths]:
+        columns = VigenereAnalysis.rank_key_letters(context, length, expected_freq)
+        choices = [[letter.lower() for letter, chi_sq in column[:top_letters]] for column in columns]
+        for letters in itertools.product(*choices):
+            key = ''.join(letters)
+            if key not in seen:
+                seen.add(key)
+                yield key
+
+def generate_frequency_units(codes, keys, jobs, codes_per_task=FREQUENCY_CODES_PER_TASK,
+                             keys_per_task=FREQUENCY_KEYS_PER_TASK):
+    """
+    Teilt die Arbeit in Einheiten (Code-Abschnitt, Schlüsselabschnitt).
+
+    Die Code-Abschnitte sind höchstens ceil(len(codes) / jobs) groß, damit
+    auch bei wenigen Codes (max_code_len <= 4) jeder Prozess Arbeit bekommt.
+
+    Yields:
+        (codes, keys) als Tupel
+    """
+    codes, keys = list(codes), list(keys)
+    code_size = max(1, min(codes_per_task, math.ceil(len(codes) / max(jobs, 1))))
+    key_size = max(1, keys_per_task)
+    for key_start in range(0, len(keys), key_size):
+        key_slice = tuple(keys[key_start:key_start + key_size])
+        for code_start in range(0, len(codes), code_size):
+            yield tuple(codes[code_start:code_start + code_size]), key_slice
+
+def frequency_worker(unit):
+    """
+    Prüft alle Kombinationen einer Einheit. Nur die Schlüssel dieser Einheit
+    werden (einmal, unabhängig vom Code) entschlüsselt.
+    """
+    codes, keys = unit
+    ciphertext = _WORKER["ciphertext"]
+    results = []
+    timings = defaultdict(float)
+
+    t0 = time.perf_counter()
+    decrypted = [(key, VigenereCipher(key).decrypt_lowercase(ciphertext)) for key in keys]
+    timings["decrypt"] += time.perf_counter() - t0
+
+    for code in codes:
+        plan = get_plan(code)
+        for key, text in decrypted:
+            t0 = time.perf_counter()
+            plaintext = plan.inverse(text)
+            t1 = time.perf_counter()
+            score, words = analyze_text(plaintext)
+            timings["permute"] += t1 - t0
+            timings["score"] += time.perf_counter() - t1
+            if score > 0:
+                push_result(results, (score, key, code, plaintext), _WORKER["top_k"])
+
+    stats = {"candidates": len(codes) * len(decrypted), "seconds": dict(timings), "worker": os.getpid()}
+    return results, stats
+
+def frequency_attack(ciphertext, max_key_len, max_code_len, jobs=None,
+                     top_letters=FREQUENCY_TOP_LETTERS, key_lengths=FREQUENCY_KEY_LENGTHS,
+                     top_k=RESULTS_TOP_K, stream_path=DEFAULT_STREAM_PATH, metrics_path=None):
+    """
+    Wie brute_force, probiert aber statt aller 26^n Schlüssel nur die
+    Kandidaten aus recover_keys.
+    """
+    if top_k < 1:
+        raise ValueError(f"top_k muss mindestens 1 sein, nicht {top_k}")
+    context = AnalysisContext(ciphertext)
+    ranking = VigenereAnalysis.rank_key_lengths(context, max_key_len)
+    print("\nWahrscheinliche Schlüssellängen:",
+          ", ".join(f"{length} ({score:.2f})" for length, score in ranking[:key_lengths]))
+
+    keys = list(recover_keys(context, max_key_len, key_lengths, top_letters))
+    total_codes = sum(factorial(i) for i in range(2, max_code_len + 1))
+
+    print("Schlüsselkandidaten:", len(keys))
+    print("Geschätzte Kombinationen:", len(keys) * total_codes)
+    jobs = jobs or cpu_count()
+    print("CPU-Kerne:", jobs)
+    print("Startet Frequenzanalyse...\n")
+
+    start_time = time.time()
+
+    tasks = generate_frequency_units(generate_codes(max_code_len), keys, jobs)
+
+    top_results = []
+
+    get_scorer()
+
+    progress = Progress(len(keys) * total_codes, json_path=metrics_path)
+
+    with ResultStream(stream_path) as stream, \
+            Pool(jobs, initializer=init_worker, initargs=(ciphertext, None, top_k)) as pool:
+        for result, stats in pool.imap_unordered(frequency_worker, tasks):
+            stream.write(result)
+            for item in result:
+                push_result(top_results, item, top_k)
+            progress.update(stats["candidates"], stats["seconds"], stats["worker"])
+
+    progress.report()
+
+    report_results(top_results, start_time)
+
 # ==============================
 # TERMINAL INTERFACE
 # ==============================
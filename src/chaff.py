@@ -0,0 +1,158 @@
+"""
+Chaff-Generator für das Fake-Bit-System
+Erzeugt die zufälligen Fake-Zeichen mit eigenem (optional geseedetem) Zufallsgenerator
+"""
+
+import datetime
+import hashlib
+import random
+import string
+import threading
+
+ALPHABET = string.ascii_lowercase
+
+# Zufallsbytes 0..233 (= 9 * 26) werden gleichverteilt auf a-z abgebildet,
+# 234..255 werden verworfen (kein Modulo-Bias)
+_FILLER_LIMIT = 256 - 256 % len(ALPHABET)
+_FILLER_TABLE = bytes.maketrans(
+    bytes(range(_FILLER_LIMIT)),
+    ALPHABET.encode("ascii") * (_FILLER_LIMIT // len(ALPHABET))
+)
+_FILLER_REJECT = bytes(range(_FILLER_LIMIT, 256))
+
+
+class CounterRandom:
+    """
+    Zählerbasierter Zufallsgenerator.
+
+    Jeder Aufruf von randbytes liefert SHAKE-128(seed, stream, zähler) und
+    erhöht den Zähler. Dadurch ist die Ausgabe vollständig reproduzierbar,
+    und unabhängige Teilströme (z.B. pro Datei-Block) lassen sich ohne
+    gemeinsamen Zustand über `stream` ableiten.
+    """
+
+    def __init__(self, seed, stream: int = 0):
+        """
+        Args:
+            seed: Beliebiger Seed (str, bytes oder int)
+            stream: Nummer des Teilstroms
+        """
+        if isinstance(seed, int):
+            seed = seed.to_bytes((seed.bit_length() + 8) // 8, "little", signed=True)
+        elif isinstance(seed, str):
+            seed = seed.encode("utf-8")
+        self.seed = bytes(seed)
+        self.stream = stream
+        self.counter = 0
+
+    def randbytes(self, n: int) -> bytes:
+        """Liefert n Zufallsbytes"""
+        block = hashlib.shake_128(
+            self.seed
+            + self.stream.to_bytes(8, "little")
+            + self.counter.to_bytes(8, "little")
+        )
+        self.counter += 1
+        return block.digest(n)
+
+
+class ChaffGenerator:
+    """
+    Erzeugt Fake-Zeichen (a-z) blockweise.
+
+    Jede Instanz besitzt ihren eigenen Zufallsgenerator; es wird kein
+    globaler Zustand des random-Moduls verwendet.
+    """
+
+    def __init__(self, seed=None, rng=None):
+        """
+        Args:
+            seed: Seed für einen reproduzierbaren CounterRandom-Generator
+                  (None = zufällig initialisiertes random.Random)
+            rng: Eigener Generator mit randbytes(n) oder getrandbits(k);
+                 hat Vorrang vor `seed`
+        """
+        self.seed = seed
+        if rng is None:
+            rng = CounterRandom(seed) if seed is not None else random.Random()
+        self.rng = rng
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_date(cls, day: datetime.date = None) -> "ChaffGenerator":
+        """
+        Generator mit dem Datum als Seed (Standard: heute).
+
+        Args:
+            day: Das Datum
+
+        Returns:
+            Der Generator
+        """
+        day = day or datetime.date.today()
+        return cls(seed=day.isoformat())
+
+    def spawn(self, stream: int) -> "ChaffGenerator":
+        """
+        Leitet einen unabhängigen, reproduzierbaren Teilgenerator ab
+        (z.B. einen pro Block bei paralleler Verarbeitung).
+
+        Args:
+            stream: Nummer des Teilstroms
+
+        Returns:
+            Der neue Generator (ohne Seed: ein unabhängig initialisierter)
+        """
+        if self.seed is None:
+            return ChaffGenerator()
+        return ChaffGenerator(rng=CounterRandom(self.seed, stream))
+
+    def _randbytes(self, n: int) -> bytes:
+        with self._lock:
+            if hasattr(self.rng, "randbytes"):
+                return self.rng.randbytes(n)
+            return self.rng.getrandbits(8 * n).to_bytes(n, "little")
+
+    def filler(self, n: int) -> bytes:
+        """
+        Erzeugt n zufällige Kleinbuchstaben.
+
+        Args:
+            n: Anzahl der Fake-Zeichen
+
+        Returns:
+            Die Fake-Zeichen als ASCII-Bytes
+        """
+        filler = b""
+        while len(filler) < n:
+            # etwas mehr ziehen, da ca. 9 % der Bytes verworfen werden
+            count = (n - len(filler)) * 9 // 8 + 8
+            filler += self._randbytes(count).translate(_FILLER_TABLE, _FILLER_REJECT)
+        return filler[:n]
+
+    def apply(self, ciphertext):
+        """
+        Setzt vor jedes Zeichen ein Fake-Zeichen.
+
+        Args:
+            ciphertext: Der Geheimtext (str oder bytes)
+
+        Returns:
+            Der Geheimtext mit Fake-Zeichen (gleicher Typ wie die Eingabe)
+        """
+        filler = self.filler(len(ciphertext))
+
+        if isinstance(ciphertext, str):
+            if not ciphertext.isascii():
+                result = [None] * (2 * len(ciphertext))
+                result[0::2] = filler.decode("ascii")
+                result[1::2] = ciphertext
+                return ''.join(result)
+            data = ciphertext.encode("ascii")
+        else:
+            data = ciphertext
+
+        result = bytearray(2 * len(data))
+        result[0::2] = filler
+        result[1::2] = data
+        return result.decode("ascii") if isinstance(ciphertext, str) else bytes(result)
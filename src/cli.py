@@ -1,15 +1,25 @@
 import sys
-import random
+import os
+import mmap
+import argparse
+import importlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from vigenere_cipher import VigenereCipher
-import string
+from vigenere_cipher import VigenereCipher, read_chunks, DEFAULT_CHUNK_SIZE
+from chaff import ChaffGenerator
+from transposition import validate_code, get_plan
+
+try:
+    import vigenere_numpy
+except ImportError:  # NumPy ist optional
+    vigenere_numpy = None
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
-ALPHABET = string.ascii_lowercase
-
 
 # -------------------------------------------------
 # UI
@@ -31,113 +41,186 @@ def print_menu():
     print("-" * 40)
 
 
-# -------------------------------------------------
-# Code-Validierung
-# -------------------------------------------------
-
-def validate_code(code: str) -> bool:
-    if not code.isdigit():
-        return False
-    digits = [int(c) for c in code]
-    n = max(digits)
-    return all(i in digits for i in range(1, n + 1))
-
-
 # -------------------------------------------------
 # Transposition (angepasst für dein System)
 # -------------------------------------------------
 
 def permute_text(text: str, code: str) -> str:
-    text = text.replace(" ", "")
-    code_indices = [int(c) - 1 for c in code]
-    block_size = max(code_indices) + 1
-
-    result = []
-    for i in range(0, len(text), block_size):
-        block = list(text[i:i + block_size])
-        for idx in code_indices:
-            if idx < len(block):
-                result.append(block[idx])
-    return ''.join(result)
+    return get_plan(code).permute(text)
 
 
 def inverse_permute_text(text: str, code: str) -> str:
     """
     Inverse der oben definierten permute_text-Funktion.
-    Vorgehen:
-      - Für alle *vollen* Originalblöcke (Länge = block_size) ist die produzierte
-        Länge konstant (equal to number of indices in code_indices that < block_size,
-        typischerweise len(code_indices) wenn alle idx < block_size).
-      - Verarbeite so viele volle Blöcke wie möglich.
-      - Bestimme für den letzten (kürzeren) Block die Original-Länge durch
-        Probieren: suche b in 1..block_size mit produced(b) == verbleibende Zeichen.
+    Die Indexmuster für volle Blöcke und alle möglichen Restblöcke werden
+    einmal pro Code in einem TranspositionPlan vorberechnet (siehe transposition.py).
     """
-    code_indices = [int(c) - 1 for c in code]
-    block_size = max(code_indices) + 1
-
-    produced_full = sum(1 for idx in code_indices if idx < block_size)
-
-    result = []
-    i = 0
-    n = len(text)
-
-    while n - i >= produced_full and produced_full > 0:
-        block = text[i:i + produced_full]
-        original = [''] * block_size
-        positions = [idx for idx in code_indices if idx < block_size]
-        for pos, idx in enumerate(positions):
-            original[idx] = block[pos]
-        result.extend(original)
-        i += produced_full
-
-    remaining = n - i
-    if remaining > 0:
-        found = False
-        for b in range(1, block_size + 1):
-            produced_b = sum(1 for idx in code_indices if idx < b)
-            if produced_b == remaining:
-                block = text[i:i + produced_b]
-                original = [''] * b
-                positions = [idx for idx in code_indices if idx < b]
-                for pos, idx in enumerate(positions):
-                    original[idx] = block[pos]
-                result.extend(original)
-                i += produced_b
-                found = True
-                break
-        if not found:
-            b = min(block_size, remaining)
-            block = text[i:i + remaining]
-            original = [''] * b
-            positions = [idx for idx in code_indices if idx < b]
-            pos = 0
-            for idx in positions:
-                if pos < len(block) and idx < b:
-                    original[idx] = block[pos]
-                    pos += 1
-            result.extend(original)
-            i = n
-
-    return ''.join(result)
+    return get_plan(code).inverse(text)
 
 
 # -------------------------------------------------
 # Fake-Bit-System
 # -------------------------------------------------
 
-def apply_fake_bits(ciphertext: str) -> str:
-    result = []
-    for char in ciphertext:
-        fake_char = random.choice(ALPHABET)
-        result.append(fake_char)
-        result.append(char)
-    return ''.join(result)
+_DEFAULT_CHAFF = ChaffGenerator()
+
+
+def apply_fake_bits(ciphertext, generator: ChaffGenerator = None):
+    """
+    Setzt vor jedes Zeichen ein zufälliges Fake-Zeichen (a-z).
+    Akzeptiert str und bytes und gibt denselben Typ zurück.
+    Mit einem geseedeten ChaffGenerator ist das Ergebnis reproduzierbar.
+    """
+    return (generator or _DEFAULT_CHAFF).apply(ciphertext)
 
 
-def remove_fake_bits(fake_text: str) -> str:
+def remove_fake_bits(fake_text):
+    """
+    Entfernt die Fake-Zeichen. Für ein memoryview ist das Ergebnis eine
+    Sicht auf denselben Speicher (keine Kopie).
+    """
     return fake_text[1::2]
 
 
+# -------------------------------------------------
+# Gesamtverfahren: Transposition -> Vigenère -> Fake-Zeichen
+# -------------------------------------------------
+
+def encrypt_text(text: str, cipher: VigenereCipher, code: str, chaff: bool = True,
+                 generator: ChaffGenerator = None) -> str:
+    ciphertext = cipher.encrypt_lowercase(permute_text(text, code))
+    return apply_fake_bits(ciphertext, generator) if chaff else ciphertext
+
+
+def decrypt_text(text: str, cipher: VigenereCipher, code: str, chaff: bool = True) -> str:
+    cleaned = remove_fake_bits(text) if chaff else text
+    return inverse_permute_text(cipher.decrypt_lowercase(cleaned), code)
+
+
+# -------------------------------------------------
+# Streaming (große Dateien, konstanter Speicher)
+# -------------------------------------------------
+
+def permute_chunks(chunks, code: str):
+    """
+    Wendet permute_text abschnittsweise an. Unvollständige Blöcke werden
+    in den nächsten Abschnitt übernommen, sodass das Ergebnis identisch zu
+    permute_text auf dem gesamten Text ist.
+    """
+    plan = get_plan(code)
+    pending = ""
+    for chunk in chunks:
+        pending += chunk.replace(" ", "")
+        usable = len(pending) - len(pending) % plan.block_size
+        if usable:
+            yield plan.permute(pending[:usable])
+            pending = pending[usable:]
+    if pending:
+        yield plan.permute(pending)
+
+
+def inverse_permute_chunks(chunks, code: str):
+    """
+    Wendet inverse_permute_text abschnittsweise an (Gegenstück zu permute_chunks).
+    """
+    plan = get_plan(code)
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        usable = len(pending) - len(pending) % plan.produced_full
+        if usable:
+            yield plan.inverse(pending[:usable])
+            pending = pending[usable:]
+    if pending:
+        yield plan.inverse(pending)
+
+
+def apply_fake_bits_chunks(chunks, generator: ChaffGenerator = None):
+    for chunk in chunks:
+        yield apply_fake_bits(chunk, generator)
+
+
+def remove_fake_bits_chunks(chunks):
+    """
+    Entfernt die Fake-Zeichen abschnittsweise; die Position (gerade/ungerade)
+    wird über die Abschnittsgrenzen hinweg fortgeführt.
+    """
+    consumed = 0
+    for chunk in chunks:
+        yield chunk[(consumed + 1) % 2::2]
+        consumed += len(chunk)
+
+
+def encrypt_stream(reader, writer, cipher: VigenereCipher, code: str,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, generator: ChaffGenerator = None):
+    """
+    Transposition -> Vigenère -> Fake-Zeichen für einen ganzen Textstrom.
+    Der Schlüssel läuft über Zeilen- und Abschnittsgrenzen hinweg weiter.
+    """
+    chunks = read_chunks(reader, chunk_size)
+    permuted = permute_chunks(chunks, code)
+    encrypted = cipher.encrypt_chunks(permuted)
+    for chunk in apply_fake_bits_chunks(encrypted, generator):
+        writer.write(chunk)
+
+
+def decrypt_stream(reader, writer, cipher: VigenereCipher, code: str,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Gegenstück zu encrypt_stream.
+    """
+    chunks = read_chunks(reader, chunk_size)
+    cleaned = remove_fake_bits_chunks(chunks)
+    decrypted = cipher.decrypt_chunks(cleaned)
+    for chunk in inverse_permute_chunks(decrypted, code):
+        writer.write(chunk)
+
+
+# -------------------------------------------------
+# Memory-Mapped (sehr große Dateien, nur Vigenère)
+# -------------------------------------------------
+
+MMAP_CHUNK_SIZE = 1 << 22
+
+
+def mmap_process_file(input_path: Path, output_path: Path, cipher: VigenereCipher, mode: str,
+                      chunk_size: int = MMAP_CHUNK_SIZE):
+    """
+    Ver- (mode "1") oder entschlüsselt eine Datei byteweise über mmap.
+    Die Ausgabedatei wird vorab auf die Eingabegröße angelegt und
+    abschnittsweise beschrieben; der Inhalt wird nie als Text dekodiert.
+
+    Mit NumPy wird jeder Abschnitt vektorisiert direkt von der Eingabe- in
+    die Ausgabe-mmap geschrieben, ohne NumPy über die translate-Tabellen.
+    """
+    with input_path.open("rb") as f_in, output_path.open("w+b") as f_out:
+        size = os.fstat(f_in.fileno()).st_size
+        f_out.truncate(size)
+        if size == 0:
+            return
+
+        with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as source, \
+                mmap.mmap(f_out.fileno(), size) as target:
+            if vigenere_numpy is not None and cipher.key.isascii():
+                shift = vigenere_numpy.encrypt_buffer if mode == "1" else vigenere_numpy.decrypt_buffer
+                offset = 0
+                for start in range(0, size, chunk_size):
+                    end = min(start + chunk_size, size)
+                    with memoryview(source)[start:end] as chunk, memoryview(target)[start:end] as out:
+                        offset += shift(chunk, out, cipher.key, offset)
+                target.flush()
+                return
+
+            process = cipher.encrypt_chunks if mode == "1" else cipher.decrypt_chunks
+            chunks = (source[start:start + chunk_size] for start in range(0, size, chunk_size))
+
+            position = 0
+            for chunk in process(chunks):
+                target[position:position + len(chunk)] = chunk
+                position += len(chunk)
+            target.flush()
+
+
 # -------------------------------------------------
 # Eingabe-Funktionen
 # -------------------------------------------------
@@ -175,9 +258,7 @@ def encrypt_mode():
 
     code = get_code()
 
-    plaintext_perm = permute_text(plaintext, code)
-    ciphertext = cipher.encrypt_lowercase(plaintext_perm)
-    ciphertext_fake = apply_fake_bits(ciphertext)
+    ciphertext_fake = encrypt_text(plaintext, cipher, code)
 
     print("\n" + "-" * 40)
     print(f"Klartext:    {plaintext}")
@@ -204,9 +285,7 @@ def decrypt_mode():
 
     code = get_code()
 
-    cleaned = remove_fake_bits(ciphertext)
-    decrypted = cipher.decrypt_lowercase(cleaned)
-    plaintext = inverse_permute_text(decrypted, code)
+    plaintext = decrypt_text(ciphertext, cipher, code)
 
     print("\n" + "-" * 40)
     print(f"Geheimtext:  {ciphertext}")
@@ -232,28 +311,105 @@ def txt_mode():
 
     code = get_code()
     mode = input("Verschlüsseln (1) oder Entschlüsseln (2)? ").strip()
+    processing = input(
+        "Zeilenweise (1), Streaming für große Dateien (2) oder Memory-Mapped, nur Vigenère (3)? "
+    ).strip()
+
+    if processing == "3":
+        mmap_process_file(input_path, output_path, cipher, mode)
+    elif processing == "2":
+        process = encrypt_stream if mode == "1" else decrypt_stream
+        # newline="" -> Zeilenumbrüche werden als normale Zeichen durchgereicht
+        with input_path.open("r", encoding="utf-8", newline="") as reader, \
+                output_path.open("w", encoding="utf-8", newline="") as writer:
+            process(reader, writer, cipher, code)
+    else:
+        jobs = input("Anzahl paralleler Prozesse (Enter = 1): ").strip()
+        if jobs.isdigit() and int(jobs) > 1:
+            process_lines_parallel(input_path, output_path, cipher, code, mode, int(jobs))
+        else:
+            process_lines(input_path, output_path, cipher, code, mode)
 
-    with input_path.open("r", encoding="utf-8") as f:
-        lines = f.readlines()
+    print(f"\nErgebnis in '{output_path}' gespeichert!")
 
-    with output_path.open("w", encoding="utf-8") as f:
-        for line in lines:
-            text = line.strip().lower()
-            if not text:
-                continue
 
-            if mode == "1":
-                text_perm = permute_text(text, code)
-                encrypted = cipher.encrypt_lowercase(text_perm)
-                result = apply_fake_bits(encrypted)
-            else:
-                cleaned = remove_fake_bits(text)
-                decrypted = cipher.decrypt_lowercase(cleaned)
-                result = inverse_permute_text(decrypted, code)
+def process_line(line: str, cipher: VigenereCipher, code: str, mode: str,
+                 generator: ChaffGenerator = None):
+    """
+    Verarbeitet eine Zeile wie im TXT-Modus.
+    Gibt None für leere Zeilen zurück.
+    """
+    text = line.strip().lower()
+    if not text:
+        return None
 
-            f.write(result + "\n")
+    if mode == "1":
+        return encrypt_text(text, cipher, code, generator=generator)
+    return decrypt_text(text, cipher, code)
 
-    print(f"\nErgebnis in '{output_path}' gespeichert!")
+
+def process_lines(input_path: Path, output_path: Path, cipher: VigenereCipher, code: str, mode: str,
+                  generator: ChaffGenerator = None):
+    with input_path.open("r", encoding="utf-8") as f_in, \
+            output_path.open("w", encoding="utf-8") as f:
+        for line in f_in:
+            result = process_line(line, cipher, code, mode, generator)
+            if result is not None:
+                f.write(result + "\n")
+
+
+# -------------------------------------------------
+# Parallele Verarbeitung (mehrere Prozesse)
+# -------------------------------------------------
+
+PARALLEL_BATCH_LINES = 5000
+
+
+def _process_line_batch(args) -> str:
+    """Worker: verarbeitet einen Block von Zeilen und liefert die Ausgabe als Text"""
+    key, code, mode, seed, batch_index, lines = args
+    cipher = VigenereCipher(key)
+    # Eigener Teilstrom pro Block: reproduzierbar und ohne gemeinsamen Zustand
+    generator = ChaffGenerator(seed).spawn(batch_index)
+    results = (process_line(line, cipher, code, mode, generator) for line in lines)
+    return ''.join(result + "\n" for result in results if result is not None)
+
+
+def process_lines_parallel(input_path: Path, output_path: Path, cipher: VigenereCipher, code: str,
+                           mode: str, jobs: int = None, batch_lines: int = PARALLEL_BATCH_LINES,
+                           seed=None):
+    """
+    Wie process_lines, verteilt aber zeilenweise Blöcke auf `jobs` Prozesse.
+    Die Ausgabe erfolgt in der ursprünglichen Reihenfolge; es sind höchstens
+    2 * jobs Blöcke gleichzeitig unterwegs, der Speicherbedarf bleibt also
+    unabhängig von der Dateigröße.
+
+    Mit `seed` erhält jeder Block einen eigenen Chaff-Teilstrom
+    (ChaffGenerator(seed).spawn(blocknummer)); die Ausgabe ist dann
+    unabhängig von der Anzahl der Prozesse reproduzierbar. Mit jobs=1
+    laufen dieselben Blöcke ohne Prozesspool im eigenen Prozess.
+    """
+    jobs = jobs or os.cpu_count() or 1
+
+    with input_path.open("r", encoding="utf-8") as f_in, \
+            output_path.open("w", encoding="utf-8") as f_out:
+        batches = (
+            (cipher.key, code, mode, seed, batch_index, lines)
+            for batch_index, lines in enumerate(iter(lambda: list(islice(f_in, batch_lines)), []))
+        )
+        if jobs == 1:
+            for args in batches:
+                f_out.write(_process_line_batch(args))
+            return
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending = deque()
+            for args in batches:
+                pending.append(executor.submit(_process_line_batch, args))
+                if len(pending) >= 2 * jobs:
+                    f_out.write(pending.popleft().result())
+            while pending:
+                f_out.write(pending.popleft().result())
 
 
 # -------------------------------------------------
@@ -274,11 +430,214 @@ ERGÄNZUNG FÜR SCHULPROJEKT:
 """)
 
 
+# -------------------------------------------------
+# Kommandozeile (nicht-interaktiv, für Skripte und Pipelines)
+# -------------------------------------------------
+
+def _code_arg(value: str) -> str:
+    if not validate_code(value):
+        raise argparse.ArgumentTypeError(
+            "Ungültiger Code! Er muss alle Zahlen von 1 bis zur größten Ziffer mindestens einmal enthalten."
+        )
+    return value
+
+
+def _key_arg(value: str) -> str:
+    try:
+        VigenereCipher(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value.lower()
+
+
+def _int_at_least(value: str, minimum: int) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Keine ganze Zahl: {value}")
+    if number < minimum:
+        raise argparse.ArgumentTypeError(f"Der Wert muss mindestens {minimum} sein, nicht {number}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    return _int_at_least(value, 1)
+
+
+def _jobs_arg(value: str) -> int:
+    # 0 = alle Kerne
+    return _int_at_least(value, 0)
+
+
+def _input_lines(args):
+    """Text aus den Argumenten oder zeilenweise von stdin"""
+    if args.text:
+        yield ' '.join(args.text)
+    else:
+        yield from sys.stdin
+
+
+def cmd_text(args):
+    cipher = VigenereCipher(args.key)
+    generator = ChaffGenerator(args.seed) if args.seed is not None else None
+    for line in _input_lines(args):
+        text = line.strip().lower()
+        if not text:
+            continue
+        if args.command == "encrypt":
+            result = encrypt_text(text, cipher, args.code, chaff=not args.no_chaff, generator=generator)
+        else:
+            result = decrypt_text(text, cipher, args.code, chaff=not args.no_chaff)
+        sys.stdout.write(result + "\n")
+
+
+def cmd_file(args):
+    cipher = VigenereCipher(args.key)
+    input_path = Path(args.input)
+    output_path = Path(args.output) if args.output else input_path.with_name(f"{input_path.stem}_output.txt")
+    mode = "1" if args.mode == "encrypt" else "2"
+    generator = ChaffGenerator(args.seed) if args.seed is not None else None
+
+    if args.processing == "mmap":
+        mmap_process_file(input_path, output_path, cipher, mode)
+    elif args.processing == "stream":
+        with input_path.open("r", encoding="utf-8", newline="") as reader, \
+                output_path.open("w", encoding="utf-8", newline="") as writer:
+            if mode == "1":
+                encrypt_stream(reader, writer, cipher, args.code, generator=generator)
+            else:
+                decrypt_stream(reader, writer, cipher, args.code)
+    elif args.jobs != 1 or args.seed is not None:
+        # Mit Seed immer blockweise, damit -j 1 und -j N dasselbe Chiffrat liefern
+        process_lines_parallel(input_path, output_path, cipher, args.code, mode, args.jobs, seed=args.seed)
+    else:
+        process_lines(input_path, output_path, cipher, args.code, mode, generator)
+
+    print(output_path)
+
+
+def cmd_crack(args):
+    # Lädt die Wortliste erst bei Bedarf
+    brute_force_module = importlib.import_module("brute-force")
+    ciphertext = ' '.join(args.text) if args.text else sys.stdin.read()
+    ciphertext = ciphertext.strip().lower()
+    stream_path = args.jsonl or brute_force_module.DEFAULT_STREAM_PATH
+    try:
+        if args.frequency:
+            brute_force_module.frequency_attack(ciphertext, args.max_key_len, args.max_code_len,
+                                                jobs=args.jobs, top_letters=args.top_letters, top_k=args.top_k,
+                                                stream_path=stream_path, metrics_path=args.metrics)
+        else:
+            brute_force_module.brute_force(ciphertext, args.max_key_len, args.max_code_len,
+                                           jobs=args.jobs, prefilter=args.prefilter,
+                                           state_path=args.state or brute_force_module.DEFAULT_STATE_PATH,
+                                           resume=args.resume, unit_size=args.unit_size, top_k=args.top_k,
+                                           stream_path=stream_path, metrics_path=args.metrics)
+    except ValueError as e:
+        sys.exit(f"Fehler: {e}")
+
+
+def cmd_analyze(args):
+    from vigenere_analysis import VigenereAnalysis
+
+    text = ' '.join(args.text) if args.text else sys.stdin.read()
+    VigenereAnalysis.analyze_text(text)
+
+
+def cmd_solve(args):
+    from vigenere_analysis import VigenereAnalysis
+
+    # Ein Geheimtext aus den Argumenten oder einer pro Zeile von stdin (Batch)
+    texts = [' '.join(args.text)] if args.text else (line.rstrip("\n") for line in sys.stdin)
+    for text in texts:
+        if not text.strip():
+            continue
+        try:
+            candidates = VigenereAnalysis.solve(text, language=args.language, max_key_length=args.max_key_len,
+                                                time_budget=args.time_budget, top=args.top)
+        except ValueError as e:
+            sys.exit(f"Fehler: {e}")
+        for key, plaintext, score in candidates:
+            print(f"{key}\t{score:.1f}\t{plaintext}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="JikCrypt - Vigenère, Transposition und Fake-Zeichen ohne interaktive Eingaben. "
+                    "Ohne Argumente startet das interaktive Menü."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (("encrypt", "Text verschlüsseln"), ("decrypt", "Text entschlüsseln")):
+        sub = subparsers.add_parser(name, help=help_text,
+                                    description=f"{help_text} (Argumente oder zeilenweise von stdin).")
+        sub.add_argument("-k", "--key", required=True, type=_key_arg, help="Vigenère-Schlüssel")
+        sub.add_argument("-c", "--code", required=True, type=_code_arg, help="Transpositions-Code (1-n)")
+        sub.add_argument("--no-chaff", action="store_true", help="Keine Fake-Zeichen einfügen/entfernen")
+        sub.add_argument("--seed", help="Seed für reproduzierbare Fake-Zeichen")
+        sub.add_argument("text", nargs="*", help="Text (Standard: stdin)")
+        sub.set_defaults(func=cmd_text)
+
+    sub = subparsers.add_parser("file", help="Datei verarbeiten")
+    sub.add_argument("input", help="Eingabedatei")
+    sub.add_argument("-o", "--output", help="Ausgabedatei (Standard: <name>_output.txt)")
+    sub.add_argument("-k", "--key", required=True, type=_key_arg, help="Vigenère-Schlüssel")
+    sub.add_argument("-c", "--code", type=_code_arg, default="1", help="Transpositions-Code (1-n)")
+    sub.add_argument("-m", "--mode", choices=("encrypt", "decrypt"), default="encrypt")
+    sub.add_argument("-p", "--processing", choices=("lines", "stream", "mmap"), default="lines",
+                     help="zeilenweise, Streaming oder Memory-Mapped (nur Vigenère)")
+    sub.add_argument("-j", "--jobs", type=_jobs_arg, default=1,
+                     help="Anzahl Prozesse für die zeilenweise Verarbeitung (0 = alle Kerne)")
+    sub.add_argument("--seed", help="Seed für reproduzierbare Fake-Zeichen")
+    sub.set_defaults(func=cmd_file)
+
+    sub = subparsers.add_parser("crack", help="Brute Force auf Schlüssel und Code")
+    sub.add_argument("--max-key-len", type=_positive_int, default=3)
+    sub.add_argument("--max-code-len", type=_positive_int, default=3)
+    sub.add_argument("-j", "--jobs", type=_jobs_arg, default=0, help="Anzahl Prozesse (0 = alle Kerne)")
+    sub.add_argument("--prefilter", type=float, default=0.05, metavar="ANTEIL",
+                     help="Anteil der Kandidaten, die nach dem N-Gramm-Vorfilter geprüft werden (1 = kein Filter)")
+    sub.add_argument("--frequency", action="store_true",
+                     help="Schlüssel per IC und Chi-Quadrat bestimmen statt alle 26^n zu probieren")
+    sub.add_argument("--top-letters", type=_positive_int, default=2, metavar="N",
+                     help="Mit --frequency: beste Buchstaben pro Schlüsselposition, die kombiniert werden")
+    sub.add_argument("--top-k", type=_positive_int, default=1000, metavar="K",
+                     help="Anzahl der besten Treffer, die behalten und gespeichert werden")
+    sub.add_argument("--jsonl", metavar="DATEI",
+                     help="Treffer live als JSON Lines schreiben (Standard: data/results.jsonl)")
+    sub.add_argument("--metrics", metavar="DATEI",
+                     help="Messwerte (Rate, ETA, Zeitanteile, Worker) regelmäßig als JSON schreiben")
+    sub.add_argument("--unit-size", type=_positive_int, default=26 ** 3, metavar="N",
+                     help="Schlüssel pro Arbeitseinheit (Standard: 17576 = 26^3)")
+    sub.add_argument("--resume", action="store_true",
+                     help="Abgebrochenen Lauf aus der Zustandsdatei fortsetzen")
+    sub.add_argument("--state", metavar="DATEI",
+                     help="Zustandsdatei für Checkpoints (Standard: data/bruteforce_state.json)")
+    sub.add_argument("text", nargs="*", help="Geheimtext (Standard: stdin)")
+    sub.set_defaults(func=cmd_crack)
+
+    sub = subparsers.add_parser("analyze", help="Häufigkeits-, IC- und Kasiski-Analyse")
+    sub.add_argument("text", nargs="*", help="Text (Standard: stdin)")
+    sub.set_defaults(func=cmd_analyze)
+
+    sub = subparsers.add_parser("solve", help="Vigenère-Schlüssel ohne Brute Force bestimmen (nur Vigenère)")
+    sub.add_argument("-l", "--language", choices=("de", "en"), default="de", help="Sprache des Klartexts")
+    sub.add_argument("--max-key-len", type=_positive_int, default=20)
+    sub.add_argument("--time-budget", type=float, metavar="SEKUNDEN",
+                     help="Maximale Rechenzeit pro Geheimtext")
+    sub.add_argument("--top", type=int, default=1, metavar="N", help="Anzahl der ausgegebenen Kandidaten")
+    sub.add_argument("text", nargs="*", help="Geheimtext (Standard: ein Geheimtext pro Zeile von stdin)")
+    sub.set_defaults(func=cmd_solve)
+
+    return parser
+
+
 # -------------------------------------------------
 # Main
 # -------------------------------------------------
 
-def main():
+def interactive_main():
     print_banner()
 
     while True:
@@ -300,5 +659,15 @@ def main():
             print("Ungültige Eingabe! Bitte wählen Sie 1-5.")
 
 
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        interactive_main()
+        return
+
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
 if __name__ == "__main__":
     main()
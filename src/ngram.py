@@ -0,0 +1,150 @@
+"""
+N-Gramm-Fitness für Kandidaten-Klartexte
+Log-Wahrscheinlichkeiten von Trigrammen/Quadgrammen für Deutsch und Englisch,
+gespeichert als kompakte Tabellen mit 26^n Einträgen (Index = N-Gramm-Code)
+"""
+
+import math
+import string
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional
+    np = None
+
+ALPHABET = string.ascii_lowercase
+
+CORPUS_DIR = Path(__file__).resolve().parent.parent / "data" / "corpus"
+CORPORA = {
+    "de": "german.txt",
+    "en": "english.txt",
+}
+
+# Umlaute wie bei der Eingabe in A-Z-Chiffren üblich umschreiben
+_TRANSLITERATION = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+# Log-Wahrscheinlichkeit unbekannter N-Gramme relativ zur Korpusgröße
+_FLOOR_COUNT = 0.01
+
+
+def text_to_codes(text: str) -> list:
+    """
+    Wandelt die Buchstaben a-z eines Textes in Indizes 0..25 um
+    (Großbuchstaben werden klein geschrieben, alles andere ignoriert).
+    """
+    return [ord(c) - 97 for c in text.lower() if "a" <= c <= "z"]
+
+
+class NgramModel:
+    """
+    Log10-Wahrscheinlichkeiten aller N-Gramme über a-z.
+
+    Die Tabelle ist ein array('f') mit 26^n Einträgen; ein N-Gramm
+    (i_1, ..., i_n) liegt an Index i_1 * 26^(n-1) + ... + i_n. Ein Text wird
+    bewertet, indem die Tabellenwerte all seiner N-Gramme aufsummiert werden
+    (höher = sprachähnlicher).
+    """
+
+    def __init__(self, text: str, n: int = 3):
+        """
+        Args:
+            text: Trainingstext (Umlaute werden umgeschrieben)
+            n: Länge der N-Gramme (3 = Trigramme, 4 = Quadgramme)
+
+        Raises:
+            ValueError: Wenn der Text keine N-Gramme enthält
+        """
+        indices = text_to_codes(text.lower().translate(_TRANSLITERATION))
+        codes = self._codes(indices, n)
+        if not codes:
+            raise ValueError("Der Trainingstext enthält keine N-Gramme")
+
+        counts = {}
+        for code in codes:
+            counts[code] = counts.get(code, 0) + 1
+
+        total = len(codes)
+        self.n = n
+        self.floor = math.log10(_FLOOR_COUNT / total)
+        self.table = array('f', [self.floor]) * (26 ** n)
+        for code, count in counts.items():
+            self.table[code] = math.log10(count / total)
+
+        self._np_table = np.frombuffer(self.table, dtype=np.float32) if np is not None else None
+
+    @classmethod
+    def from_file(cls, path, n: int = 3) -> "NgramModel":
+        """Trainiert ein Modell aus einer UTF-8-Textdatei"""
+        return cls(Path(path).read_text(encoding="utf-8"), n)
+
+    @staticmethod
+    def _codes(indices: list, n: int) -> list:
+        """Berechnet die N-Gramm-Codes einer Indexfolge (gleitendes Fenster)"""
+        if len(indices) < n:
+            return []
+        modulus = 26 ** (n - 1)
+        code = 0
+        for index in indices[:n - 1]:
+            code = code * 26 + index
+        codes = []
+        for index in indices[n - 1:]:
+            code = (code % modulus) * 26 + index
+            codes.append(code)
+        return codes
+
+    def score(self, text: str) -> float:
+        """
+        Summe der Log-Wahrscheinlichkeiten aller N-Gramme des Textes.
+
+        Args:
+            text: Der Kandidatentext
+
+        Returns:
+            Der Score (0.0 bei Texten mit weniger als n Buchstaben)
+        """
+        table = self.table
+        return sum(map(table.__getitem__, self._codes(text_to_codes(text), self.n)))
+
+    def score_indices(self, indices):
+        """
+        Bewertet viele Kandidaten gleichzeitig (benötigt NumPy).
+
+        Args:
+            indices: Array (m,) bzw. (K, m) mit Buchstabenindizes 0..25
+
+        Returns:
+            float-Array der Form () bzw. (K,)
+        """
+        indices = np.asarray(indices, dtype=np.int32)
+        m = indices.shape[-1]
+        if m < self.n:
+            return np.zeros(indices.shape[:-1])
+
+        codes = indices[..., :m - self.n + 1].copy()
+        for offset in range(1, self.n):
+            codes *= 26
+            codes += indices[..., offset:m - self.n + 1 + offset]
+        return self._np_table[codes].sum(axis=-1, dtype=np.float64)
+
+
+@lru_cache(maxsize=None)
+def get_model(language: str = "de", n: int = 3) -> NgramModel:
+    """
+    Liefert das (zwischengespeicherte) Modell für eine Sprache.
+
+    Args:
+        language: "de" oder "en"
+        n: Länge der N-Gramme
+
+    Returns:
+        Das NgramModel
+
+    Raises:
+        ValueError: Wenn die Sprache unbekannt ist
+    """
+    if language not in CORPORA:
+        raise ValueError(f"Unbekannte Sprache: {language} (verfügbar: {', '.join(CORPORA)})")
+    return NgramModel.from_file(CORPUS_DIR / CORPORA[language], n)
@@ -0,0 +1,176 @@
+"""
+Fortschritt und Messwerte für die Brute-Force-Tools
+Kandidaten pro Sekunde (gesamt und pro Worker), Zeitanteile der einzelnen
+Schritte (Entschlüsseln, Permutation, Bewertung), ETA und optionaler
+JSON-Export
+"""
+
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Sekunden zwischen zwei Fortschrittsausgaben
+DEFAULT_REPORT_INTERVAL = 5.0
+
+# Reihenfolge der Schritte in der Ausgabe
+STAGES = ("decrypt", "permute", "prefilter", "score")
+
+
+def timed(iterable, timings: dict, stage: str):
+    """
+    Reicht die Elemente von `iterable` durch und addiert die Zeit, die das
+    Erzeugen jedes Elements kostet, auf timings[stage].
+    """
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            timings[stage] += time.perf_counter() - start
+            return
+        timings[stage] += time.perf_counter() - start
+        yield item
+
+
+def format_duration(seconds: float) -> str:
+    """Formatiert Sekunden als H:MM:SS"""
+    if seconds is None:
+        return "?"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+class Progress:
+    """
+    Sammelt Messwerte eines Laufs und gibt regelmäßig eine Fortschrittszeile aus.
+
+    Worker melden ihre Arbeit mit update(): Anzahl geprüfter Kandidaten,
+    Sekunden pro Schritt und eine Worker-Kennung (z.B. die PID).
+    """
+
+    def __init__(self, total: int, done: int = 0, report_interval: float = DEFAULT_REPORT_INTERVAL,
+                 json_path=None, output=print):
+        """
+        Args:
+            total: Gesamtzahl der Kandidaten (total_keys * total_codes)
+            done: Bereits erledigte Kandidaten (z.B. beim Fortsetzen)
+            report_interval: Sekunden zwischen zwei Ausgaben
+            json_path: Optionale Datei, in die bei jeder Ausgabe ein JSON-Snapshot geschrieben wird
+            output: Funktion für die Textausgabe (None = keine Ausgabe)
+        """
+        self.total = total
+        self.initial = done
+        self.tested = done
+        self.report_interval = report_interval
+        self.json_path = Path(json_path) if json_path else None
+        self.output = output
+
+        self.stage_seconds = defaultdict(float)
+        self.worker_candidates = defaultdict(int)
+        self.worker_seconds = defaultdict(float)
+
+        self.start_time = time.time()
+        self._last_report = self.start_time
+
+    def update(self, candidates: int, stage_seconds: dict = None, worker=None):
+        """
+        Meldet erledigte Arbeit.
+
+        Args:
+            candidates: Anzahl der geprüften Kandidaten
+            stage_seconds: Sekunden pro Schritt ({"decrypt": ..., ...})
+            worker: Kennung des Workers (Standard: dieser Prozess)
+        """
+        worker = os.getpid() if worker is None else worker
+        self.tested += candidates
+        self.worker_candidates[worker] += candidates
+        for stage, seconds in (stage_seconds or {}).items():
+            self.stage_seconds[stage] += seconds
+            self.worker_seconds[worker] += seconds
+
+        if time.time() - self._last_report >= self.report_interval:
+            self.report()
+
+    @property
+    def elapsed(self) -> float:
+        return time.time() - self.start_time
+
+    @property
+    def rate(self) -> float:
+        """Kandidaten pro Sekunde (gesamt, seit Start dieses Laufs)"""
+        elapsed = self.elapsed
+        return (self.tested - self.initial) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """Geschätzte Restzeit in Sekunden (None, solange keine Rate bekannt ist)"""
+        rate = self.rate
+        if rate <= 0:
+            return None
+        return max(self.total - self.tested, 0) / rate
+
+    def worker_rates(self) -> dict:
+        """Kandidaten pro Sekunde Rechenzeit für jeden Worker"""
+        return {
+            worker: (count / self.worker_seconds[worker] if self.worker_seconds[worker] > 0 else 0.0)
+            for worker, count in self.worker_candidates.items()
+        }
+
+    def stage_shares(self) -> dict:
+        """Anteil jedes Schritts an der gemessenen Rechenzeit"""
+        busy = sum(self.stage_seconds.values())
+        return {stage: seconds / busy for stage, seconds in self.stage_seconds.items()} if busy else {}
+
+    def snapshot(self) -> dict:
+        """Alle Messwerte als JSON-fähiges Dict"""
+        shares = self.stage_shares()
+        return {
+            "time": time.time(),
+            "elapsed": self.elapsed,
+            "tested": self.tested,
+            "total": self.total,
+            "percent": 100 * self.tested / self.total if self.total else 100.0,
+            "rate": self.rate,
+            "eta": self.eta,
+            "stages": {
+                stage: {"seconds": seconds, "share": shares[stage]}
+                for stage, seconds in self.stage_seconds.items()
+            },
+            "workers": {
+                str(worker): {"candidates": self.worker_candidates[worker], "rate": rate}
+                for worker, rate in self.worker_rates().items()
+            },
+        }
+
+    def format_line(self) -> str:
+        percent = 100 * self.tested / self.total if self.total else 100.0
+        shares = self.stage_shares()
+        stages = " ".join(
+            f"{stage} {shares[stage] * 100:.0f}%"
+            for stage in sorted(shares, key=lambda s: STAGES.index(s) if s in STAGES else len(STAGES))
+        )
+        line = (f"{self.tested:,}/{self.total:,} ({percent:.1f} %) | "
+                f"{self.rate:,.0f} Kand./s | {len(self.worker_candidates)} Worker | "
+                f"ETA {format_duration(self.eta)}")
+        return f"{line} | {stages}" if stages else line
+
+    def report(self):
+        """Gibt die Fortschrittszeile aus und schreibt ggf. den JSON-Snapshot"""
+        self._last_report = time.time()
+        if self.output is not None:
+            self.output(self.format_line())
+        if self.json_path is not None:
+            self.dump_json()
+
+    def dump_json(self, path=None):
+        """Schreibt den aktuellen Snapshot atomar als JSON-Datei"""
+        path = Path(path) if path else self.json_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,111 @@
+"""
+Bewertung von Kandidaten-Klartexten
+Gemeinsames Scoring für brf.py und brute-force.py: ein vorkompilierter
+Wortmatcher und ein Buchstaben-Histogramm pro Kandidat
+"""
+
+import string
+from collections import Counter
+from pathlib import Path
+
+from wordmatch import WordMatcher
+
+ALPHABET = string.ascii_lowercase
+
+# Häufigste Buchstaben im Deutschen (Bonus in score)
+FREQUENT_LETTERS = "etaoinshrdlu"
+
+DEFAULT_WORDLIST = Path(__file__).resolve().parent.parent / "lists" / "wordlist-german.txt"
+
+
+def load_wordlist(path=None) -> set:
+    """
+    Lädt die Wörter (kleingeschrieben) aus einer Wordlist-Datei.
+
+    Args:
+        path: Pfad zur Wordlist (Standard: lists/wordlist-german.txt)
+
+    Returns:
+        Menge der Wörter
+    """
+    words = set()
+    with open(path or DEFAULT_WORDLIST, "r", encoding="utf-8") as f:
+        for line in f:
+            word = line.strip().lower()
+            if word:
+                words.add(word)
+    return words
+
+
+def letter_histogram(text: str) -> list:
+    """
+    Zählt die Buchstaben a-z eines (kleingeschriebenen) Textes.
+
+    Args:
+        text: Der Text
+
+    Returns:
+        Liste mit 26 Häufigkeiten (Index 0 = 'a')
+    """
+    counts = Counter(text)
+    return [counts[letter] for letter in ALPHABET]
+
+
+class TextScorer:
+    """
+    Bewertet Kandidatentexte anhand einer Wortliste.
+
+    Die Wortliste wird einmal in einen WordMatcher kompiliert; jede Bewertung
+    ist danach ein linearer Durchlauf über den Text plus ein Histogramm.
+    """
+
+    _FREQUENT_INDICES = [ALPHABET.index(letter) for letter in FREQUENT_LETTERS]
+
+    def __init__(self, words):
+        """
+        Args:
+            words: Iterable mit Wörtern (kleingeschrieben)
+        """
+        self.matcher = WordMatcher(words)
+
+    def score(self, text: str) -> int:
+        """
+        Bewertet, wie wahrscheinlich der Text Deutsch ist (Score aus brf.py).
+        Je höher, desto wahrscheinlicher.
+
+        10 Punkte pro Wortvorkommen und 1 Punkt pro häufigem Buchstaben.
+        """
+        text = text.lower()
+        counts = self.matcher.count(text)
+        histogram = letter_histogram(text)
+
+        score = 10 * sum(counts.values())
+        score += sum(histogram[i] for i in self._FREQUENT_INDICES)
+        return score
+
+    def analyze(self, text: str):
+        """
+        Prüft die Wortabdeckung des Textes (Score aus brute-force.py).
+
+        Score = Summe der Längen der gefundenen Wörter + 100 * Abdeckung,
+        Texte mit weniger als 85 % Abdeckung ergeben 0.
+
+        Returns:
+            (score, gefundene Wörter)
+        """
+        text = text.lower()
+        counts = self.matcher.count(text)
+
+        if not counts:
+            return 0, []
+
+        # Abdeckung: wie viele Buchstaben des Textes gehören zu Wordlist-Wörtern
+        covered_letters = sum(n * len(w) for w, n in counts.items())
+        coverage_ratio = covered_letters / len(text)
+
+        if coverage_ratio < 0.85:
+            return 0, []
+
+        found_words = list(counts)
+        score = int(coverage_ratio * 100) + sum(len(w) for w in found_words)
+        return score, found_words
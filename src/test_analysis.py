@@ -0,0 +1,295 @@
+"""
+Unittest für die Kryptoanalyse-Werkzeuge
+"""
+
+import re
+import unittest
+from pathlib import Path
+
+import vigenere_analysis
+from vigenere_cipher import VigenereCipher
+from vigenere_analysis import AnalysisContext, VigenereAnalysis, GERMAN_FREQUENCY, ENGLISH_FREQUENCY
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional
+    np = None
+
+CORPUS = Path(__file__).resolve().parent.parent / "data" / "corpus" / "german.txt"
+
+# Nicht im Korpus enthalten: solve und die Längenbewertung dürfen ihr
+# N-Gramm-Modell nicht am eigenen Trainingstext prüfen
+HELD_OUT_TEXT = (
+    "Der Leuchtturmwaerter hatte sein ganzes Leben auf der Insel verbracht und kannte jeden Stein am Ufer. "
+    "Jeden Abend stieg er die einhundertzwanzig Stufen hinauf, putzte die Glaeser und wartete darauf, "
+    "dass die Sonne im Meer versank. Im Herbst kamen die Stuerme, und manchmal schlugen die Wellen so "
+    "hoch, dass das Wasser bis an die Fenster der kleinen Kueche spritzte. Seine Tochter lebte laengst "
+    "auf dem Festland und schrieb ihm jeden Monat einen langen Brief, den der Postbote mit der Faehre "
+    "brachte. Er las die Briefe immer zweimal, einmal sofort am Tisch und einmal spaet in der Nacht, "
+    "wenn das Licht oben gleichmaessig ueber das dunkle Wasser wanderte. Im Fruehjahr reparierte er das "
+    "Dach des Schuppens, strich die Tuer neu und pflanzte Kartoffeln in dem schmalen Garten hinter dem "
+    "Haus. Die Moewen beobachteten ihn dabei mit grosser Geduld, denn sie wussten, dass am Ende immer "
+    "ein paar Brotkrumen fuer sie uebrig blieben. Eines Tages kam ein Brief, in dem stand, dass der "
+    "Leuchtturm bald automatisch betrieben werden sollte und niemand mehr auf der Insel wohnen muesse. "
+    "Der alte Mann faltete das Papier sorgfaeltig zusammen, legte es in die Schublade zu den anderen "
+    "Briefen und ging wie jeden Abend die Treppe hinauf. Er wusste nicht, wie viele Winter ihm noch "
+    "blieben, aber er wollte jeden einzelnen davon hier oben verbringen, zwischen dem Wind, dem Salz und "
+    "dem ruhigen Kreisen des Lichts. Als im naechsten Jahr die Techniker kamen, zeigte er ihnen geduldig "
+    "jede Schraube und jedes Kabel, erklaerte die Eigenheiten der alten Linse und bat sie nur um eines: "
+    "dass sie die Stufen nicht durch einen Aufzug ersetzen sollten, weil man den Weg nach oben spueren muesse."
+).lower()
+
+
+def sample_text(paragraphs: int = 2) -> str:
+    """Deutscher Beispieltext (nur a-z) aus dem mitgelieferten Korpus"""
+    text = ' '.join(CORPUS.read_text(encoding="utf-8").split("\n\n")[:paragraphs]).lower()
+    text = text.translate(str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"}))
+    return re.sub("[^a-z ]", "", text)
+
+
+class TestAnalysisContext(unittest.TestCase):
+    """Testsuite für den einmal normalisierten Analysetext"""
+    
+    def test_normalization(self):
+        """Test: Nur A-Z bleiben übrig, als Indizes 0..25"""
+        context = AnalysisContext("Hallo, Welt! 123")
+        self.assertEqual(context.letters, "HALLOWELT")
+        self.assertEqual(list(context.indices), [7, 0, 11, 11, 14, 22, 4, 11, 19])
+        self.assertEqual(len(context), 9)
+        self.assertIs(AnalysisContext.of(context), context)
+    
+    def test_column_histograms(self):
+        """Test: Spaltenhistogramme zählen jeden key_length-ten Buchstaben"""
+        context = AnalysisContext("ABAB CACA")
+        self.assertEqual(context.histogram()[:4], [4, 2, 2, 0])
+        first, second = context.histograms(2)
+        self.assertEqual(first[:3], [2, 0, 2])
+        self.assertEqual(second[:3], [2, 2, 0])
+        self.assertIs(context.histogram(2, 0), first)
+    
+    def test_matches_text_methods(self):
+        """Test: IC und Häufigkeiten stimmen mit den Textmethoden überein"""
+        context = AnalysisContext(sample_text())
+        self.assertEqual(context.frequencies(), VigenereAnalysis.frequency_analysis(sample_text()))
+        self.assertAlmostEqual(context.index_of_coincidence(), VigenereAnalysis.index_of_coincidence(sample_text()))
+        self.assertAlmostEqual(context.mean_index_of_coincidence(1), context.index_of_coincidence())
+    
+    def test_ioc_profile(self):
+        """Test: Das IC-Profil entspricht dem mittleren Spalten-IC, mit und ohne NumPy"""
+        context = AnalysisContext(VigenereCipher("ZAHL").encrypt(sample_text()))
+        profile = context.ioc_profile(10)
+        self.assertEqual([length for length, _ in profile], list(range(1, 11)))
+        for length, ic in profile:
+            self.assertAlmostEqual(ic, AnalysisContext(context.letters).mean_index_of_coincidence(length))
+        
+        numpy_module, vigenere_analysis.np = vigenere_analysis.np, None
+        try:
+            fallback = AnalysisContext(context.letters).ioc_profile(10)
+        finally:
+            vigenere_analysis.np = numpy_module
+        for (length, ic), (_, expected) in zip(profile, fallback):
+            self.assertAlmostEqual(ic, expected)
+    
+    def test_ioc_profile_blocks(self):
+        """Test: Lange Texte werden blockweise gezählt, ohne die Spalten zu verschieben"""
+        text = VigenereCipher("SCHLUESSEL").encrypt(sample_text(50) * 4)
+        context = AnalysisContext(text)
+        self.assertGreater(len(context), vigenere_analysis._PROFILE_BLOCK)
+        for length, ic in context.ioc_profile(12):
+            self.assertAlmostEqual(ic, AnalysisContext(text).mean_index_of_coincidence(length))
+        self.assertEqual(context.histogram(7, 3), AnalysisContext(text).histogram(7, 3))
+    
+    def test_chi_squared_shifts(self):
+        """Test: Jeder Shift entspricht dem Chi-Quadrat-Test des entschlüsselten Textes"""
+        ciphertext = VigenereCipher("K").encrypt(sample_text())
+        chi_squared = AnalysisContext(ciphertext).chi_squared_shifts(1, 0, GERMAN_FREQUENCY)
+        for shift in (0, 10, 25):
+            plaintext = VigenereCipher(chr(ord('A') + shift)).decrypt(ciphertext)
+            expected = VigenereAnalysis.chi_squared_test(
+                VigenereAnalysis.frequency_analysis(plaintext), GERMAN_FREQUENCY)
+            self.assertAlmostEqual(chi_squared[shift], expected)
+        self.assertEqual(VigenereAnalysis.attack_single_char(ciphertext, 0, GERMAN_FREQUENCY), "K")
+
+
+@unittest.skipUnless(np, "NumPy nicht installiert")
+class TestChiSquaredMatrix(unittest.TestCase):
+    """Testsuite für den zirkulanten Chi-Quadrat-Test mit NumPy"""
+    
+    def test_matches_python(self):
+        """Test: Die Matrixoperation liefert dieselben Werte wie chi_squared_shifts"""
+        context = AnalysisContext(VigenereCipher("ZAHL").encrypt(sample_text()))
+        for expected_freq in (GERMAN_FREQUENCY, ENGLISH_FREQUENCY, {"E": 50.0, "N": 50.0}):
+            matrix = vigenere_analysis.chi_squared_matrix(context.histograms(4), expected_freq)
+            self.assertEqual(matrix.shape, (4, 26))
+            for column in range(4):
+                np.testing.assert_allclose(matrix[column], context.chi_squared_shifts(4, column, expected_freq))
+        single = vigenere_analysis.chi_squared_matrix(context.histogram(), GERMAN_FREQUENCY)
+        self.assertEqual(single.shape, (26,))
+    
+    def test_empty_column(self):
+        """Test: Leere Spalten ergeben endliche Werte"""
+        matrix = vigenere_analysis.chi_squared_matrix([[0] * 26], GERMAN_FREQUENCY)
+        self.assertTrue(np.isfinite(matrix).all())
+    
+    def test_rank_columns_without_numpy(self):
+        """Test: Der Python-Fallback ergibt dieselbe Rangfolge"""
+        context = AnalysisContext(VigenereCipher("ZAHL").encrypt(sample_text()))
+        ranked = context.rank_columns(4, GERMAN_FREQUENCY)
+        numpy_module, vigenere_analysis.np = vigenere_analysis.np, None
+        try:
+            fallback = context.rank_columns(4, GERMAN_FREQUENCY)
+        finally:
+            vigenere_analysis.np = numpy_module
+        self.assertEqual([[letter for letter, _ in column] for column in ranked],
+                         [[letter for letter, _ in column] for column in fallback])
+        self.assertEqual(''.join(column[0][0] for column in ranked), "ZAHL")
+
+
+class TestKasiski(unittest.TestCase):
+    """Testsuite für den indexbasierten Kasiski-Test"""
+    
+    def test_finds_key_length(self):
+        """Test: Die echte Schlüssellänge liegt trotz zufälliger Wiederholungen vorne"""
+        ciphertext = VigenereCipher("SECRET").encrypt(sample_text(4))
+        ranking = VigenereAnalysis.kasiski_examination(ciphertext, max_length=15)
+        self.assertEqual(ranking[0][0], 6)
+        self.assertEqual(VigenereAnalysis.find_key_length(ciphertext, 15)[0], 6)
+    
+    def test_factor_counts(self):
+        """Test: Jeder Abstand zählt für alle seine Teiler, lange Wiederholungen nur einmal"""
+        # "ABCDEF" wiederholt sich im Abstand 12, "XYZ" im Abstand 10
+        ranking = dict(VigenereAnalysis.kasiski_examination("ABCDEFGHIJKLABCDEFXYZMNOPQRSXYZ", max_length=12))
+        self.assertEqual(ranking, {2: 2, 3: 1, 4: 1, 5: 1, 6: 1, 10: 1, 12: 1})
+    
+    def test_no_repeats(self):
+        """Test: Ohne Wiederholungen gibt es keine Kandidaten"""
+        self.assertEqual(VigenereAnalysis.kasiski_examination("ABCDEFGHIJ"), [])
+        self.assertEqual(VigenereAnalysis.find_key_length(""), [])
+
+
+class TestKeyLength(unittest.TestCase):
+    """Testsuite für Friedman-Schätzung und kombinierte Schlüssellängen-Bewertung"""
+    
+    def test_friedman(self):
+        """Test: Die Friedman-Schätzung liegt in der Nähe der Schlüssellänge"""
+        estimate = VigenereAnalysis.friedman_test(VigenereCipher("SECRET").encrypt(sample_text(4)))
+        self.assertGreater(estimate, 3)
+        self.assertLess(estimate, 12)
+        self.assertLess(VigenereAnalysis.friedman_test(sample_text()), 1.5)
+        self.assertIsNone(VigenereAnalysis.friedman_test("A"))
+    
+    def test_rank_key_lengths(self):
+        """Test: Die richtige Länge liegt vorne, nicht ihre Vielfachen"""
+        text = HELD_OUT_TEXT
+        for key in ("ZAHL", "SECRET", "GEHEIMNIS", "KRYPTOGRAPHIE"):
+            ranking = VigenereAnalysis.rank_key_lengths(VigenereCipher(key).encrypt(text), 20)
+            self.assertEqual(ranking[0][0], len(key), key)
+            self.assertEqual(len(ranking), 20)
+    
+    def test_short_text(self):
+        """Test: Geprüft wird höchstens bis zur halben Textlänge (mindestens 1)"""
+        self.assertEqual(len(VigenereAnalysis.rank_key_lengths("ABCDEFGH", 20)), 4)
+        self.assertEqual([length for length, _ in VigenereAnalysis.rank_key_lengths("", 20)], [1])
+    
+    def test_scores_bounded_on_short_text(self):
+        """Test: Auch bei kurzen Spalten liegt kein Score über der Summe der Gewichte"""
+        limit = sum(vigenere_analysis.KEY_LENGTH_WEIGHTS.values())
+        for text in ("LXFOPVEFRNHR", "ABCABCABCAB", VigenereCipher("SONNE").encrypt(HELD_OUT_TEXT[:40])):
+            for length, score in VigenereAnalysis.rank_key_lengths(text, 20):
+                self.assertLessEqual(score, limit, (text, length))
+    
+    def test_invalid_max_length(self):
+        """Test: Eine maximale Länge unter 1 ist ein ValueError, auch ohne NumPy"""
+        context = AnalysisContext("ABCDEFGH")
+        for max_length in (0, -3):
+            with self.assertRaises(ValueError):
+                context.ioc_profile(max_length)
+            with self.assertRaises(ValueError):
+                VigenereAnalysis.rank_key_lengths("ABCDEFGH", max_length)
+            with self.assertRaises(ValueError):
+                VigenereAnalysis.solve("ABCDEFGH", max_key_length=max_length)
+        numpy_module, vigenere_analysis.np = vigenere_analysis.np, None
+        try:
+            with self.assertRaises(ValueError):
+                context.ioc_profile(0)
+        finally:
+            vigenere_analysis.np = numpy_module
+
+
+class TestKeyRecovery(unittest.TestCase):
+    """Testsuite für den spaltenweisen Chi-Quadrat-Test"""
+    
+    def test_rank_key_letters(self):
+        """Test: Der beste Buchstabe jeder Spalte ergibt den Schlüssel"""
+        key = "KRYPTOGRAPHIE"
+        ciphertext = VigenereCipher(key).encrypt(sample_text())
+        columns = VigenereAnalysis.rank_key_letters(ciphertext, len(key), GERMAN_FREQUENCY)
+        self.assertEqual(len(columns), len(key))
+        self.assertTrue(all(len(column) == 26 for column in columns))
+        self.assertEqual(''.join(column[0][0] for column in columns), key)
+    
+    def test_transposition_does_not_matter(self):
+        """Test: Die Analyse funktioniert auch auf transponiertem Klartext"""
+        from transposition import get_plan
+        ciphertext = VigenereCipher("SCHLUESSEL").encrypt(get_plan("2413").permute(sample_text()))
+        columns = VigenereAnalysis.rank_key_letters(ciphertext, 10, GERMAN_FREQUENCY)
+        self.assertEqual(''.join(column[0][0] for column in columns), "SCHLUESSEL")
+
+
+class TestSolve(unittest.TestCase):
+    """Testsuite für das automatische Brechen (Schlüssellänge, Chi-Quadrat, N-Gramme)"""
+    
+    def test_recovers_key_and_plaintext(self):
+        """Test: Schlüssel und Klartext (mit Satzzeichen) werden gefunden"""
+        text = HELD_OUT_TEXT[:900]
+        for key in ("SONNE", "GEHEIMNIS"):
+            ciphertext = VigenereCipher(key).encrypt(text)
+            candidates = VigenereAnalysis.solve(ciphertext)
+            best_key, plaintext, score = candidates[0]
+            self.assertEqual(best_key, key)
+            self.assertEqual(plaintext, text.upper())
+            self.assertEqual([c[2] for c in candidates], sorted((c[2] for c in candidates), reverse=True))
+    
+    def test_short_held_out_text(self):
+        """Test: Schon 200 Buchstaben eines fremden Textes reichen für den vollständigen Schlüssel"""
+        letters = re.sub("[^a-z]", "", HELD_OUT_TEXT)[:200]
+        for key in ("ZAHL", "SONNE", "SECRET", "GEHEIMNIS"):
+            best_key, plaintext, _ = VigenereAnalysis.solve(VigenereCipher(key).encrypt(letters))[0]
+            self.assertEqual(best_key, key)
+            self.assertEqual(plaintext, letters.upper())
+    
+    def test_partial_period_keys(self):
+        """Test: Ein Vielfaches wird trotzdem probiert, wenn die kürzere Länge nur eine Teilperiode ist"""
+        letters = re.sub("[^a-z]", "", HELD_OUT_TEXT)[:400]
+        for key in ("ABCABD", "SONNESONNF"):
+            self.assertEqual(VigenereAnalysis.solve(VigenereCipher(key).encrypt(letters))[0][0], key)
+    
+    def test_without_numpy(self):
+        """Test: Ohne NumPy liefert solve denselben Schlüssel"""
+        ciphertext = VigenereCipher("ZAHL").encrypt(HELD_OUT_TEXT)
+        numpy_module, vigenere_analysis.np = vigenere_analysis.np, None
+        try:
+            candidates = VigenereAnalysis.solve(ciphertext, top=3)
+        finally:
+            vigenere_analysis.np = numpy_module
+        self.assertEqual(candidates[0][0], "ZAHL")
+        self.assertEqual(len(candidates), 3)
+    
+    def test_keys_reduced_to_period(self):
+        """Test: Wiederholte Schlüssel erscheinen nur einmal, in kürzester Form"""
+        candidates = VigenereAnalysis.solve(VigenereCipher("ABAB").encrypt(HELD_OUT_TEXT), top=20)
+        keys = [key for key, _, _ in candidates]
+        self.assertEqual(keys[0], "AB")
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertNotIn("ABAB", keys)
+    
+    def test_time_budget_and_language(self):
+        """Test: Ein Zeitbudget von 0 liefert trotzdem einen Kandidaten, unbekannte Sprachen nicht"""
+        self.assertEqual(len(VigenereAnalysis.solve(VigenereCipher("KEY").encrypt(HELD_OUT_TEXT), time_budget=0, top=1)), 1)
+        self.assertEqual(VigenereAnalysis.solve("123 !"), [])
+        with self.assertRaises(ValueError):
+            VigenereAnalysis.solve("ABC", language="xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unittest für den parallelen Brute-Force (brute-force.py)
+"""
+
+import importlib
+import itertools
+import json
+import string
+import tempfile
+import unittest
+from pathlib import Path
+
+from vigenere_cipher import VigenereCipher
+from cli import encrypt_text
+from scoring import TextScorer
+
+brute_force = importlib.import_module("brute-force")
+
+WORDS = {"das", "ist", "ein", "geheimer", "text", "und", "der"}
+PLAINTEXT = "das ist ein geheimer text und der text ist"
+
+
+class TestBruteForce(unittest.TestCase):
+    """Testsuite für Arbeitseinheiten, Worker und Checkpoints"""
+    
+    def setUp(self):
+        """Kleine Wortliste statt lists/wordlist-german.txt"""
+        self._previous_scorer = brute_force._SCORER
+        brute_force._SCORER = TextScorer(WORDS)
+    
+    def tearDown(self):
+        brute_force._SCORER = self._previous_scorer
+    
+    def test_units_cover_key_space(self):
+        """Test: Die Arbeitseinheiten decken jeden Schlüssel genau einmal ab"""
+        units = list(brute_force.generate_units(3, 3, unit_size=100))
+        self.assertTrue(all(stop - start <= 100 for _, _, start, stop in units))
+        for code in ("12", "21", "312"):
+            for length in (1, 2, 3):
+                ranges = sorted((start, stop) for c, l, start, stop in units if (c, l) == (code, length))
+                self.assertEqual(ranges[0][0], 0)
+                self.assertEqual(ranges[-1][1], 26 ** length)
+                self.assertTrue(all(a[1] == b[0] for a, b in zip(ranges, ranges[1:])))
+    
+    def test_invalid_unit_size(self):
+        """Test: Eine Einheitengröße unter 1 wird abgelehnt statt nichts zu prüfen"""
+        for unit_size in (0, -5):
+            with self.assertRaises(ValueError):
+                list(brute_force.generate_units(2, 1, unit_size=unit_size))
+            with self.assertRaises(ValueError):
+                brute_force.brute_force("abc", 1, 2, jobs=1, unit_size=unit_size)
+    
+    def test_frequency_units_use_all_jobs(self):
+        """Test: Auch wenige Codes ergeben mindestens eine Einheit pro Prozess, jede Kombination genau einmal"""
+        codes = list(brute_force.generate_codes(3))
+        keys = ["key%d" % i for i in range(10)]
+        units = list(brute_force.generate_frequency_units(codes, keys, jobs=4, keys_per_task=4))
+        self.assertGreaterEqual(len({unit_codes for unit_codes, _ in units}), 4)
+        pairs = [(code, key) for unit_codes, unit_keys in units for code in unit_codes for key in unit_keys]
+        self.assertEqual(sorted(pairs), sorted(itertools.product(codes, keys)))
+        self.assertTrue(all(len(unit_keys) <= 4 for _, unit_keys in units))
+    
+    def test_frequency_worker_decrypts_own_keys(self):
+        """Test: Der Frequenz-Worker entschlüsselt nur die Schlüssel seiner Einheit"""
+        ciphertext = encrypt_text(PLAINTEXT, VigenereCipher("abc"), "312", chaff=False)
+        brute_force.init_worker(ciphertext)
+        results, stats = brute_force.frequency_worker((("12", "312"), ("abc", "abd")))
+        self.assertEqual(stats["candidates"], 4)
+        self.assertIn("decrypt", stats["seconds"])
+        score, key, code, plaintext = max(results)
+        self.assertEqual((key, code, plaintext), ("abc", "312", PLAINTEXT.replace(" ", "")))
+    
+    def test_key_range_matches_generate_keys(self):
+        """Test: generate_key_range entspricht einem Ausschnitt von generate_keys"""
+        everything = [''.join(k) for k in itertools.product(string.ascii_lowercase, repeat=3)]
+        self.assertEqual(list(brute_force.generate_key_range(3, 650, 730)), everything[650:730])
+        self.assertEqual(brute_force.key_from_index(27, 2), "bb")
+    
+    def test_worker_finds_key(self):
+        """Test: Der Worker findet Schlüssel und Code in seiner Arbeitseinheit"""
+        ciphertext = encrypt_text(PLAINTEXT, VigenereCipher("abc"), "312", chaff=False)
+        brute_force.init_worker(ciphertext, brute_force.PREFILTER_FRACTION)
+        results = []
+        for unit in brute_force.generate_units(3, 3, unit_size=5000):
+            if unit[0] == "312":
+                results.extend(brute_force.worker(unit)[1])
+        score, key, code, plaintext = max(results)
+        self.assertEqual((key, code, plaintext), ("abc", "312", PLAINTEXT.replace(" ", "")))
+    
+    def test_top_k_heap(self):
+        """Test: Der Heap behält nur die besten K Treffer"""
+        heap = []
+        for score in [5, 1, 9, 3, 7, 8, 2]:
+            brute_force.push_result(heap, (score, "k", "12", "t"), 3)
+        self.assertEqual(sorted(heap, reverse=True), [(9, "k", "12", "t"), (8, "k", "12", "t"), (7, "k", "12", "t")])
+        
+        checkpoint = brute_force.Checkpoint("unused.json", {}, top_k=2)
+        checkpoint.mark_done("a", heap)
+        checkpoint.mark_done("b", [(10, "x", "21", "t")])
+        self.assertEqual(sorted(checkpoint.results, reverse=True), [(10, "x", "21", "t"), (9, "k", "12", "t")])
+    
+    def test_invalid_top_k(self):
+        """Test: top_k unter 1 ist ein ValueError statt eines IndexError im Heap"""
+        for top_k in (0, -1):
+            with self.assertRaises(ValueError):
+                brute_force.brute_force("abc", 1, 2, jobs=1, top_k=top_k)
+            with self.assertRaises(ValueError):
+                brute_force.frequency_attack("abc", 1, 2, jobs=1, top_k=top_k)
+    
+    def test_result_stream(self):
+        """Test: Treffer werden als JSON Lines geschrieben und beim Fortsetzen angehängt"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "results.jsonl"
+            with brute_force.ResultStream(path) as stream:
+                stream.write([(120, "ab", "12", "täxt")], unit="12:2:0")
+            with brute_force.ResultStream(path, append=True) as stream:
+                stream.write([(99, "c", "21", "text"), (98, "d", "21", "text")])
+                self.assertEqual(stream.count, 2)
+            
+            records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual(len(records), 3)
+            self.assertEqual(records[0], {"score": 120, "key": "ab", "code": "12", "plaintext": "täxt", "unit": "12:2:0"})
+    
+    def test_checkpoint_roundtrip(self):
+        """Test: Checkpoints lassen sich laden, fremde Zustände werden abgelehnt"""
+        params = {"ciphertext": "abc", "max_key_len": 2}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            checkpoint = brute_force.Checkpoint(path, params)
+            checkpoint.mark_done(brute_force.unit_id("12", 2, 0), [(120, "ab", "12", "text")])
+            checkpoint.save()
+            
+            loaded = brute_force.Checkpoint.load(path, params)
+            self.assertEqual(loaded.done, {"12:2:0"})
+            self.assertEqual(loaded.results, [(120, "ab", "12", "text")])
+            with self.assertRaises(ValueError):
+                brute_force.Checkpoint.load(path, dict(params, max_key_len=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
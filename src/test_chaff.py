@@ -0,0 +1,72 @@
+"""
+Unittest für den Chaff-Generator
+"""
+
+import datetime
+import random
+import threading
+import unittest
+
+from chaff import ChaffGenerator, CounterRandom, ALPHABET
+
+
+class TestChaffGenerator(unittest.TestCase):
+    """Testsuite für die ChaffGenerator-Klasse"""
+    
+    def test_seed_is_reproducible(self):
+        """Test: Gleicher Seed ergibt gleiche Fake-Zeichen"""
+        first = ChaffGenerator(seed="geheim").apply("geheimtext")
+        second = ChaffGenerator(seed="geheim").apply("geheimtext")
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, ChaffGenerator(seed="anders").apply("geheimtext"))
+    
+    def test_filler_alphabet(self):
+        """Test: Fake-Zeichen bestehen nur aus a-z und nutzen das ganze Alphabet"""
+        filler = ChaffGenerator(seed=1).filler(5000).decode("ascii")
+        self.assertEqual(len(filler), 5000)
+        self.assertEqual(set(filler), set(ALPHABET))
+    
+    def test_spawn_streams_are_independent(self):
+        """Test: Teilströme sind reproduzierbar und voneinander verschieden"""
+        generator = ChaffGenerator(seed=42)
+        self.assertEqual(generator.spawn(3).filler(64), ChaffGenerator(seed=42).spawn(3).filler(64))
+        self.assertNotEqual(generator.spawn(3).filler(64), generator.spawn(4).filler(64))
+    
+    def test_custom_rng(self):
+        """Test: Eigener Zufallsgenerator (random.Random) wird verwendet"""
+        first = ChaffGenerator(rng=random.Random(7)).filler(100)
+        second = ChaffGenerator(rng=random.Random(7)).filler(100)
+        self.assertEqual(first, second)
+    
+    def test_from_date(self):
+        """Test: Datum als Seed"""
+        day = datetime.date(2024, 5, 1)
+        self.assertEqual(ChaffGenerator.from_date(day).filler(32), ChaffGenerator(seed="2024-05-01").filler(32))
+    
+    def test_counter_random_blocks(self):
+        """Test: CounterRandom liefert pro Aufruf einen neuen Block"""
+        rng = CounterRandom(b"seed")
+        self.assertNotEqual(rng.randbytes(16), rng.randbytes(16))
+        self.assertEqual(rng.counter, 2)
+    
+    def test_shared_between_threads(self):
+        """Test: Ein Generator kann von mehreren Threads genutzt werden"""
+        generator = ChaffGenerator(seed="threads")
+        results = []
+        
+        def work():
+            results.append(generator.filler(10_000))
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(results), 8)
+        self.assertEqual(len(set(results)), 8)
+        self.assertGreaterEqual(generator.rng.counter, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+"""
+Unittest für die Datei- und Stream-Verarbeitung der CLI
+"""
+
+import io
+import string
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+from cli import (
+    permute_text, remove_fake_bits, encrypt_stream, decrypt_stream, mmap_process_file,
+    process_lines, process_lines_parallel, main, apply_fake_bits, PARALLEL_BATCH_LINES,
+)
+from vigenere_cipher import VigenereCipher
+
+
+SAMPLE_TEXT = (
+    "Das ist die erste Zeile eines geheimen Textes\n"
+    "Eine zweite Zeile zum Verschluesseln\n"
+    "Dritte Zeile mit sensiblen Informationen\n"
+) * 20
+
+
+class TestFakeBits(unittest.TestCase):
+    """Testsuite für das Fake-Bit-System"""
+    
+    def test_roundtrip_str_and_bytes(self):
+        """Test: Fake-Zeichen lassen sich für str, bytes und memoryview wieder entfernen"""
+        for text in ("geheimtext", "mit €uro und Ümlaut", ""):
+            fake = apply_fake_bits(text)
+            self.assertEqual(len(fake), 2 * len(text))
+            self.assertEqual(remove_fake_bits(fake), text)
+            self.assertTrue(all(c in string.ascii_lowercase for c in fake[0::2]))
+        
+        fake = apply_fake_bits(b"geheimtext")
+        self.assertIsInstance(fake, bytes)
+        self.assertEqual(remove_fake_bits(memoryview(fake)).tobytes(), b"geheimtext")
+    
+    def test_filler_uses_whole_alphabet(self):
+        """Test: Alle 26 Buchstaben kommen als Fake-Zeichen vor"""
+        fake = apply_fake_bits("x" * 5000)
+        self.assertEqual(set(fake[0::2]), set(string.ascii_lowercase))
+
+
+class TestStreaming(unittest.TestCase):
+    """Testsuite für die abschnittsweise Verarbeitung großer Dateien"""
+    
+    def setUp(self):
+        """Bereitet jeden Test vor"""
+        self.cipher = VigenereCipher("schluessel")
+    
+    def encrypt(self, text, code, chunk_size):
+        writer = io.StringIO()
+        encrypt_stream(io.StringIO(text), writer, self.cipher, code, chunk_size=chunk_size)
+        return writer.getvalue()
+    
+    def decrypt(self, text, code, chunk_size):
+        writer = io.StringIO()
+        decrypt_stream(io.StringIO(text), writer, self.cipher, code, chunk_size=chunk_size)
+        return writer.getvalue()
+    
+    def test_chunk_stream_matches_whole_text(self):
+        """Test: Stream-Chiffre entspricht der Verschlüsselung des gesamten Textes"""
+        for chunk_size in (1, 7, 64, 10_000):
+            writer = io.StringIO()
+            self.cipher.stream_encrypt(io.StringIO(SAMPLE_TEXT), writer, chunk_size=chunk_size)
+            self.assertEqual(writer.getvalue(), self.cipher.encrypt_lowercase(SAMPLE_TEXT))
+    
+    def test_stream_pipeline_matches_whole_text(self):
+        """Test: Transposition + Vigenère unabhängig von der Abschnittsgröße"""
+        code = "3121"
+        expected = self.cipher.encrypt_lowercase(permute_text(SAMPLE_TEXT, code))
+        for chunk_size in (1, 5, 333, 10_000):
+            encrypted = self.encrypt(SAMPLE_TEXT, code, chunk_size)
+            self.assertEqual(remove_fake_bits(encrypted), expected)
+    
+    def test_stream_roundtrip(self):
+        """Test: Verschlüsseln und Entschlüsseln mit verschiedenen Abschnittsgrößen"""
+        for code in ("21", "312", "1123"):
+            encrypted = self.encrypt(SAMPLE_TEXT, code, 97)
+            for chunk_size in (1, 2, 51, 10_000):
+                decrypted = self.decrypt(encrypted, code, chunk_size)
+                self.assertEqual(decrypted, SAMPLE_TEXT.replace(" ", ""))
+
+
+class TestMemoryMapped(unittest.TestCase):
+    """Testsuite für die mmap-basierte Dateiverarbeitung"""
+    
+    def setUp(self):
+        """Bereitet jeden Test vor"""
+        self.cipher = VigenereCipher("schluessel")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_mmap_matches_text_cipher(self):
+        """Test: mmap-Verschlüsselung entspricht encrypt_lowercase auf dem ganzen Text"""
+        plain = self.dir / "plain.txt"
+        encrypted = self.dir / "encrypted.txt"
+        decrypted = self.dir / "decrypted.txt"
+        plain.write_bytes(SAMPLE_TEXT.encode("utf-8"))
+        
+        mmap_process_file(plain, encrypted, self.cipher, "1", chunk_size=100)
+        self.assertEqual(encrypted.read_bytes().decode("utf-8"), self.cipher.encrypt_lowercase(SAMPLE_TEXT))
+        
+        mmap_process_file(encrypted, decrypted, self.cipher, "2", chunk_size=77)
+        self.assertEqual(decrypted.read_bytes(), plain.read_bytes())
+    
+    def test_mmap_keeps_utf8_bytes(self):
+        """Test: Nicht-ASCII-Bytes (z.B. Umlaute) bleiben unverändert"""
+        plain = self.dir / "plain.txt"
+        encrypted = self.dir / "encrypted.txt"
+        plain.write_bytes("Grüße aus Köln".encode("utf-8"))
+        
+        mmap_process_file(plain, encrypted, self.cipher, "1")
+        result = encrypted.read_bytes().decode("utf-8")
+        self.assertEqual([c for c in result if not c.isascii()], ["ü", "ß", "ö"])
+        self.assertEqual(
+            ''.join(c for c in result if c.isascii()),
+            self.cipher.encrypt_lowercase("Gre aus Kln")
+        )
+    
+    def test_mmap_without_numpy(self):
+        """Test: Der translate-Fallback ohne NumPy liefert dieselben Bytes"""
+        import cli
+        plain = self.dir / "plain.txt"
+        vectorized = self.dir / "vectorized.txt"
+        fallback = self.dir / "fallback.txt"
+        plain.write_bytes(("Grüße aus Köln! " + SAMPLE_TEXT).encode("utf-8"))
+        
+        mmap_process_file(plain, vectorized, self.cipher, "1", chunk_size=333)
+        numpy_module, cli.vigenere_numpy = cli.vigenere_numpy, None
+        try:
+            mmap_process_file(plain, fallback, self.cipher, "1", chunk_size=333)
+        finally:
+            cli.vigenere_numpy = numpy_module
+        self.assertEqual(vectorized.read_bytes(), fallback.read_bytes())
+    
+    def test_mmap_empty_file(self):
+        """Test: Leere Dateien erzeugen eine leere Ausgabe"""
+        plain = self.dir / "empty.txt"
+        encrypted = self.dir / "encrypted.txt"
+        plain.write_bytes(b"")
+        mmap_process_file(plain, encrypted, self.cipher, "1")
+        self.assertEqual(encrypted.read_bytes(), b"")
+
+
+class TestParallelLines(unittest.TestCase):
+    """Testsuite für die parallele zeilenweise Verarbeitung"""
+    
+    def setUp(self):
+        """Bereitet jeden Test vor"""
+        self.cipher = VigenereCipher("schluessel")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.plain = self.dir / "plain.txt"
+        self.plain.write_text(SAMPLE_TEXT + "\n\n" + SAMPLE_TEXT, encoding="utf-8")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_parallel_roundtrip_keeps_order(self):
+        """Test: Parallele Verarbeitung liefert dieselben Zeilen in derselben Reihenfolge"""
+        encrypted = self.dir / "encrypted.txt"
+        serial = self.dir / "serial.txt"
+        parallel = self.dir / "parallel.txt"
+        
+        process_lines_parallel(self.plain, encrypted, self.cipher, "312", "1", jobs=2, batch_lines=7)
+        process_lines(encrypted, serial, self.cipher, "312", "2")
+        process_lines_parallel(encrypted, parallel, self.cipher, "312", "2", jobs=3, batch_lines=5)
+        
+        expected = [line.lower().replace(" ", "") for line in self.plain.read_text(encoding="utf-8").splitlines() if line]
+        self.assertEqual(serial.read_text(encoding="utf-8").splitlines(), expected)
+        self.assertEqual(parallel.read_text(encoding="utf-8"), serial.read_text(encoding="utf-8"))
+    
+    def test_parallel_seed_is_reproducible(self):
+        """Test: Mit Seed hängt das Chiffrat nicht von der Anzahl der Prozesse ab"""
+        first = self.dir / "first.txt"
+        second = self.dir / "second.txt"
+        process_lines_parallel(self.plain, first, self.cipher, "21", "1", jobs=1, batch_lines=9, seed="s")
+        process_lines_parallel(self.plain, second, self.cipher, "21", "1", jobs=3, batch_lines=9, seed="s")
+        self.assertEqual(first.read_text(encoding="utf-8"), second.read_text(encoding="utf-8"))
+    
+    def test_cli_seed_independent_of_jobs(self):
+        """Test: file --seed liefert mit -j 1 und -j 3 dasselbe Chiffrat (über mehrere Blöcke)"""
+        plain = self.dir / "long.txt"
+        plain.write_text(SAMPLE_TEXT * (PARALLEL_BATCH_LINES // SAMPLE_TEXT.count("\n") + 1), encoding="utf-8")
+        outputs = []
+        for jobs in ("1", "3"):
+            output = self.dir / f"jobs{jobs}.txt"
+            with redirect_stdout(io.StringIO()):
+                main(["file", str(plain), "-o", str(output), "-k", "schluessel", "-c", "21",
+                      "--seed", "s", "-j", jobs])
+            outputs.append(output.read_text(encoding="utf-8"))
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertNotEqual(outputs[0], "")
+
+
+class TestCommandLine(unittest.TestCase):
+    """Testsuite für die nicht-interaktive Kommandozeile"""
+    
+    def run_cli(self, argv, stdin=""):
+        stdout = io.StringIO()
+        original_stdin = sys.stdin
+        sys.stdin = io.StringIO(stdin)
+        try:
+            with redirect_stdout(stdout):
+                main(argv)
+        finally:
+            sys.stdin = original_stdin
+        return stdout.getvalue()
+    
+    def test_encrypt_decrypt_pipeline(self):
+        """Test: encrypt | decrypt über stdin liefert den Klartext (ohne Leerzeichen)"""
+        encrypted = self.run_cli(["encrypt", "-k", "geheim", "-c", "312"], "Hallo Welt\nZweite Zeile\n")
+        self.assertEqual(len(encrypted.splitlines()), 2)
+        decrypted = self.run_cli(["decrypt", "-k", "geheim", "-c", "312"], encrypted)
+        self.assertEqual(decrypted, "hallowelt\nzweitezeile\n")
+    
+    def test_no_chaff(self):
+        """Test: --no-chaff liefert das reine Chiffrat"""
+        output = self.run_cli(["encrypt", "-k", "geheim", "-c", "21", "--no-chaff", "Hallo"])
+        cipher = VigenereCipher("geheim")
+        self.assertEqual(output, cipher.encrypt_lowercase(permute_text("hallo", "21")) + "\n")
+    
+    def test_solve_batch(self):
+        """Test: solve bricht einen Geheimtext pro Zeile und gibt Schlüssel und Klartext aus"""
+        text = ("der leuchtturmwaerter stieg jeden abend die lange treppe hinauf putzte die "
+                "glaeser und wartete geduldig darauf dass die sonne langsam im meer versank")
+        lines = [VigenereCipher(key).encrypt(text) for key in ("SONNE", "MOND")]
+        output = self.run_cli(["solve"], "\n".join(lines) + "\n")
+        rows = [line.split("\t") for line in output.splitlines()]
+        self.assertEqual([row[0] for row in rows], ["SONNE", "MOND"])
+        self.assertEqual(rows[0][2], text.upper())
+    
+    def test_invalid_arguments(self):
+        """Test: Ungültiger Schlüssel, Code oder Längen unter 1 führen zu einem Argumentfehler"""
+        for argv in (["encrypt", "-k", "123", "-c", "12", "x"], ["encrypt", "-k", "abc", "-c", "13", "x"],
+                     ["encrypt", "-k", "abc", "-c", "10", "x"], ["encrypt", "-k", "abc", "-c", "0", "x"],
+                     ["solve", "--max-key-len", "0", "x"], ["crack", "--max-code-len", "-1", "x"],
+                     ["crack", "--max-key-len", "drei", "x"], ["crack", "--top-k", "0", "x"],
+                     ["crack", "--unit-size", "0", "x"], ["crack", "-j", "-2", "x"], ["crack", "--top-letters", "0", "x"],
+                     ["file", "-k", "abc", "-c", "12", "-j", "-1", "in.txt"]):
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                main(argv)
+    
+    def test_crack_reports_value_error(self):
+        """Test: Ein ValueError im Häufigkeitsangriff endet als Fehlermeldung statt Traceback"""
+        import importlib
+        from unittest import mock
+        brute_force_module = importlib.import_module("brute-force")
+        with mock.patch.object(brute_force_module, "frequency_attack", side_effect=ValueError("kaputt")):
+            with self.assertRaises(SystemExit) as raised:
+                main(["crack", "--frequency", "abc"])
+        self.assertEqual(raised.exception.code, "Fehler: kaputt")
+
+
+if __name__ == '__main__':
+    unittest.main()
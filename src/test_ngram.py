@@ -0,0 +1,69 @@
+"""
+Unittest für die N-Gramm-Fitness
+"""
+
+import random
+import string
+import unittest
+
+from ngram import NgramModel, get_model, text_to_codes
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestNgramModel(unittest.TestCase):
+    """Testsuite für NgramModel und get_model"""
+    
+    def test_german_beats_random(self):
+        """Test: Deutscher Text bewertet besser als zufällige Buchstaben"""
+        model = get_model("de")
+        rng = random.Random(1)
+        text = "dasisteingeheimertextderverschluesseltwird"
+        noise = ''.join(rng.choices(string.ascii_lowercase, k=len(text)))
+        self.assertGreater(model.score(text), model.score(noise))
+    
+    def test_language_models_differ(self):
+        """Test: Jede Sprache bevorzugt ihren eigenen Text"""
+        german = "wirhabendiealtenbriefeimmuseumgelesen"
+        english = "wehavereadtheoldlettersinthemuseum"
+        self.assertGreater(get_model("de").score(german) / len(german),
+                           get_model("en").score(german) / len(german))
+        self.assertGreater(get_model("en").score(english), get_model("de").score(english))
+    
+    def test_known_table_values(self):
+        """Test: Tabelle enthält log10 der relativen Häufigkeit"""
+        model = NgramModel("abcabc", n=3)
+        # Trigramme: abc, bca, cab, abc -> abc hat 2 von 4
+        self.assertAlmostEqual(model.table[0 * 676 + 1 * 26 + 2], -0.30103, places=4)
+        self.assertAlmostEqual(model.score("abc"), -0.30103, places=4)
+        self.assertEqual(model.score("ab"), 0.0)
+        self.assertLess(model.score("zzz"), model.score("abc"))
+    
+    def test_umlauts_are_transliterated(self):
+        """Test: Umlaute im Trainingstext werden umgeschrieben"""
+        model = NgramModel("Größe", n=2)
+        self.assertGreater(model.score("oe"), model.floor)
+        self.assertEqual(text_to_codes("Ab-z"), [0, 1, 25])
+    
+    def test_unknown_language(self):
+        """Test: Unbekannte Sprache wird abgelehnt"""
+        with self.assertRaises(ValueError):
+            get_model("xx")
+    
+    @unittest.skipUnless(np is not None, "NumPy nicht installiert")
+    def test_score_indices_matches_score(self):
+        """Test: Vektorisierte Bewertung entspricht der zeichenweisen"""
+        for n in (3, 4):
+            model = get_model("de", n)
+            rng = random.Random(n)
+            texts = [''.join(rng.choices(string.ascii_lowercase, k=30)) for _ in range(20)]
+            batch = np.array([text_to_codes(t) for t in texts], dtype=np.uint8)
+            expected = [model.score(t) for t in texts]
+            np.testing.assert_allclose(model.score_indices(batch), expected, rtol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Unittest für Fortschritt und Messwerte
+"""
+
+import json
+import tempfile
+import unittest
+from collections import defaultdict
+from pathlib import Path
+
+from progress import Progress, format_duration, timed
+
+
+class TestProgress(unittest.TestCase):
+    """Testsuite für die Progress-Klasse und die Hilfsfunktionen"""
+    
+    def test_rates_and_shares(self):
+        """Test: Zählerstände, Worker-Raten und Zeitanteile"""
+        lines = []
+        progress = Progress(1000, report_interval=3600, output=lines.append)
+        progress.update(100, {"decrypt": 1.0, "score": 3.0}, worker=1)
+        progress.update(300, {"decrypt": 1.0, "permute": 1.0}, worker=2)
+        
+        self.assertEqual(progress.tested, 400)
+        self.assertEqual(progress.worker_rates(), {1: 25.0, 2: 150.0})
+        self.assertEqual(progress.stage_shares(), {"decrypt": 1 / 3, "score": 0.5, "permute": 1 / 6})
+        self.assertEqual(lines, [])
+        
+        progress.report()
+        self.assertEqual(len(lines), 1)
+        self.assertIn("400/1,000 (40.0 %)", lines[0])
+        self.assertIn("decrypt 33% permute 17% score 50%", lines[0])
+    
+    def test_eta_with_resume(self):
+        """Test: Bereits erledigte Kandidaten zählen nicht zur Rate"""
+        progress = Progress(1000, done=600, output=None)
+        self.assertEqual(progress.rate, 0.0)
+        self.assertIsNone(progress.eta)
+        progress.start_time -= 10
+        progress.update(200)
+        self.assertAlmostEqual(progress.rate, 20.0, delta=1.0)
+        self.assertAlmostEqual(progress.eta, 10.0, delta=1.0)
+    
+    def test_json_dump(self):
+        """Test: Snapshot wird als JSON geschrieben"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "metrics.json"
+            progress = Progress(10, json_path=path, output=None)
+            progress.update(5, {"score": 0.5}, worker="a")
+            progress.report()
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.assertEqual((data["tested"], data["total"], data["percent"]), (5, 10, 50.0))
+            self.assertEqual(data["stages"]["score"], {"seconds": 0.5, "share": 1.0})
+            self.assertEqual(data["workers"]["a"]["candidates"], 5)
+    
+    def test_timed(self):
+        """Test: timed reicht alle Elemente durch und misst die Zeit"""
+        timings = defaultdict(float)
+        self.assertEqual(list(timed(range(5), timings, "decrypt")), [0, 1, 2, 3, 4])
+        self.assertGreater(timings["decrypt"], 0)
+        self.assertEqual(format_duration(3725), "1:02:05")
+        self.assertEqual(format_duration(None), "?")
+
+
+if __name__ == "__main__":
+    unittest.main()
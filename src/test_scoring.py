@@ -0,0 +1,68 @@
+"""
+Unittest für das gemeinsame Scoring
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from scoring import TextScorer, letter_histogram, load_wordlist
+
+
+class TestTextScorer(unittest.TestCase):
+    """Testsuite für TextScorer und die Hilfsfunktionen"""
+    
+    WORDS = {"der", "die", "das", "und", "ist", "ein", "test", "er"}
+    
+    @staticmethod
+    def legacy_score(words, text):
+        """Bisherige Bewertung aus brf.py (ein str.count pro Wort)"""
+        text = text.lower()
+        score = sum(text.count(w) * 10 for w in words)
+        return score + sum(text.count(letter) for letter in "etaoinshrdlu")
+    
+    @staticmethod
+    def legacy_analyze(words, text):
+        """Bisherige Bewertung aus brute-force.py"""
+        text = text.lower()
+        found = [w for w in words if w in text]
+        if not found:
+            return 0
+        ratio = sum(text.count(w) * len(w) for w in found) / len(text)
+        if ratio < 0.85:
+            return 0
+        return int(ratio * 100) + sum(len(w) for w in found)
+    
+    def test_score_matches_legacy(self):
+        """Test: score liefert dieselben Werte wie die bisherige Implementierung"""
+        scorer = TextScorer(self.WORDS)
+        rng = random.Random(11)
+        for _ in range(300):
+            text = ''.join(rng.choices("derinstaguEDR ", k=rng.randint(0, 40)))
+            self.assertEqual(scorer.score(text), self.legacy_score(self.WORDS, text))
+    
+    def test_analyze_matches_legacy(self):
+        """Test: analyze liefert dieselben Scores und Wörter wie bisher"""
+        scorer = TextScorer(self.WORDS)
+        for text in ("dasisteintest", "derunddie", "xxxxtest", "", "ERISTDER"):
+            score, words = scorer.analyze(text)
+            self.assertEqual(score, self.legacy_analyze(self.WORDS, text))
+            self.assertEqual(set(words), {w for w in self.WORDS if w in text.lower()} if score else set())
+    
+    def test_letter_histogram(self):
+        """Test: Histogramm zählt nur a-z"""
+        histogram = letter_histogram("aab z!ä")
+        self.assertEqual(len(histogram), 26)
+        self.assertEqual((histogram[0], histogram[1], histogram[25], sum(histogram)), (2, 1, 1, 4))
+    
+    def test_load_wordlist(self):
+        """Test: Wordlist wird kleingeschrieben und ohne Leerzeilen geladen"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "words.txt"
+            path.write_text("Haus\n\n  baum \nhaus\n", encoding="utf-8")
+            self.assertEqual(load_wordlist(path), {"haus", "baum"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Unittest für die vorkompilierten Transpositionspläne
+"""
+
+import random
+import string
+import unittest
+
+from transposition import TranspositionPlan, get_plan, validate_code
+
+
+class TestTranspositionPlan(unittest.TestCase):
+    """Testsuite für TranspositionPlan und get_plan"""
+    
+    def test_known_permutation(self):
+        """Test: Bekanntes Ergebnis für Code 312"""
+        plan = TranspositionPlan("312")
+        self.assertEqual(plan.permute("abc def"), "cabfde")
+        self.assertEqual(plan.inverse("cabfde"), "abcdef")
+    
+    def test_roundtrip_with_tail(self):
+        """Test: permute + inverse ergibt den Text ohne Leerzeichen (auch mit Restblock)"""
+        rng = random.Random(3)
+        for code in ("21", "312", "2413", "53142"):
+            plan = get_plan(code)
+            for length in range(0, 23):
+                text = ''.join(rng.choices(string.ascii_lowercase, k=length))
+                self.assertEqual(plan.inverse(plan.permute(text)), text)
+    
+    def test_non_ascii_text(self):
+        """Test: Nicht-ASCII-Texte werden ebenfalls umgeordnet"""
+        plan = get_plan("21")
+        self.assertEqual(plan.permute("äöüß"), "öäßü")
+        self.assertEqual(plan.inverse("öäßü"), "äöüß")
+    
+    def test_invalid_code(self):
+        """Test: Ungültige Codes werden abgelehnt"""
+        self.assertFalse(validate_code("13"))
+        self.assertFalse(validate_code("a1"))
+        self.assertFalse(validate_code("10"))
+        self.assertFalse(validate_code("0"))
+        self.assertFalse(validate_code("²1"))
+        for code in ("13", "10", "0"):
+            with self.assertRaises(ValueError):
+                TranspositionPlan(code)
+        with self.assertRaises(ValueError):
+            TranspositionPlan("")
+    
+    def test_inverse_order(self):
+        """Test: inverse_order beschreibt dieselbe Umordnung wie inverse"""
+        for code in ("312", "2413"):
+            plan = get_plan(code)
+            for length in range(0, 15):
+                text = string.ascii_letters[:length]
+                order = plan.inverse_order(length)
+                self.assertEqual(''.join(text[i] for i in order), plan.inverse(text))
+    
+    def test_plan_is_cached(self):
+        """Test: get_plan liefert für denselben Code dasselbe Objekt"""
+        self.assertIs(get_plan("312"), get_plan("312"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,16 @@
 Unittest für die Vigenere-Verschlüsselung
 """
 
+import tracemalloc
 import unittest
 from vigenere_cipher import VigenereCipher
 
+try:
+    import numpy as np
+    import vigenere_numpy
+except ImportError:  # NumPy ist optional
+    np = None
+
 
 class TestVigenereCipher(unittest.TestCase):
     """Testsuite für die VigenereCipher-Klasse"""
@@ -94,6 +101,108 @@ class TestVigenereCipher(unittest.TestCase):
         ciphertext2 = cipher2.encrypt(plaintext)
         
         self.assertEqual(ciphertext1, ciphertext2)
+    
+    def test_known_ciphertext(self):
+        """Test: Tabellen-Engine liefert dieselben Chiffrate wie die zeichenweise Version"""
+        self.assertEqual(self.cipher.encrypt("HALLO, WELT!"), "ZCSWI, AWDX!")
+        self.assertEqual(self.cipher.decrypt("HALLO, WELT!"), "PYEAU, SMTP!")
+        self.assertEqual(
+            VigenereCipher("VIGENERECIPHER").encrypt("ATTACKATDAWN"),
+            "VBZEPORXFILU"
+        )
+    
+    def test_non_ascii_letters(self):
+        """Test: Umlaute zählen als Buchstaben und werden wie bisher verschoben"""
+        self.assertEqual(self.cipher.encrypt("Grüße aus Köln, 3x!"), "YTGDMI SMW VLNU, 3I!")
+        self.assertEqual(VigenereCipher("Kä").encrypt("Abc Übel"), "KCM ALFV")
+    
+    def test_lowercase_known_ciphertext(self):
+        """Test: Einzeldurchlauf liefert dieselben Ergebnisse wie upper/encrypt/zip"""
+        plaintext = "Das ist die erste Zeile eines geheimen Textes"
+        self.assertEqual(
+            self.cipher.encrypt_lowercase(plaintext),
+            "Vcz tmx vai pjuap Tiadi papld aizwmxwp Aprxwk"
+        )
+        self.assertEqual(
+            self.cipher.decrypt_lowercase(plaintext),
+            "Lyl xyp lqa tzqmt Faqta tqlxh mapmebml Mtdpma"
+        )
+        # Nicht-ASCII-Text verwendet weiterhin die bisherige Wiederherstellung
+        self.assertEqual(self.cipher.encrypt_lowercase("Grüße aus Köln, 3x!"), "YtgdmI smW vlnU, 3I")
+    
+    def test_lowercase_allocations(self):
+        """Test: encrypt_lowercase legt nur wenige Kopien des Textes an"""
+        letters_only = "diesisteingeheimnis" * 5000
+        with_spaces = "Dies ist ein Geheimnis, " * 8000
+        self.cipher.encrypt_lowercase("warmup")
+        
+        for text, max_bytes_per_char in ((letters_only, 5), (with_spaces, 12)):
+            tracemalloc.start()
+            try:
+                self.cipher.encrypt_lowercase(text)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, max_bytes_per_char * len(text))
+    
+    def test_key_longer_than_text(self):
+        """Test: Schlüssel länger als der Text"""
+        cipher = VigenereCipher("VERYLONGKEY")
+        self.assertEqual(cipher.decrypt(cipher.encrypt("HI!")), "HI!")
+        self.assertEqual(cipher.encrypt(""), "")
+
+
+@unittest.skipUnless(np, "NumPy nicht installiert")
+class TestVigenereNumpy(unittest.TestCase):
+    """Testsuite für die vektorisierte NumPy-Chiffre"""
+    
+    def test_array_matches_cipher(self):
+        """Test: encrypt_array liefert dasselbe wie VigenereCipher.encrypt"""
+        indices = vigenere_numpy.text_to_indices("DIESISTEINGEHEIMNIS")
+        encrypted = vigenere_numpy.encrypt_array(indices, "SCHLUESSEL")
+        self.assertEqual(
+            vigenere_numpy.indices_to_text(encrypted),
+            VigenereCipher("SCHLUESSEL").encrypt("DIESISTEINGEHEIMNIS")
+        )
+        decrypted = vigenere_numpy.decrypt_array(encrypted, "SCHLUESSEL")
+        self.assertTrue((decrypted == indices).all())
+    
+    def test_key_batches_order(self):
+        """Test: Schlüssel-Batches entsprechen der itertools.product-Reihenfolge"""
+        keys = np.concatenate(list(vigenere_numpy.iter_key_batches(2, batch_size=100)))
+        strings = vigenere_numpy.keys_to_strings(keys)
+        self.assertEqual(len(strings), 26 ** 2)
+        self.assertEqual(strings[:3], ["aa", "ab", "ac"])
+        self.assertEqual(strings[-1], "zz")
+    
+    def test_key_batches_range(self):
+        """Test: start/stop liefert genau den Ausschnitt der vollständigen Reihenfolge"""
+        keys = np.concatenate(list(vigenere_numpy.iter_key_batches(3, batch_size=64, start=700, stop=900)))
+        strings = vigenere_numpy.keys_to_strings(keys)
+        everything = vigenere_numpy.keys_to_strings(next(vigenere_numpy.iter_key_batches(3, batch_size=26 ** 3)))
+        self.assertEqual(strings, everything[700:900])
+    
+    def test_buffer_matches_bytes(self):
+        """Test: encrypt_buffer/decrypt_buffer entsprechen encrypt_bytes/decrypt_bytes (auch mit Offset)"""
+        data = "Hallo, Welt! Grüße 123 xyz\n".encode("utf-8") * 5
+        cipher = VigenereCipher("SCHLUESSEL")
+        for offset in (0, 3, 17):
+            target = bytearray(len(data))
+            count = vigenere_numpy.encrypt_buffer(data, target, "SCHLUESSEL", offset)
+            self.assertEqual(bytes(target), cipher.encrypt_bytes(data, offset))
+            self.assertEqual(count, sum(c.isalpha() for c in data.decode("utf-8") if c.isascii()))
+            
+            restored = bytearray(len(data))
+            vigenere_numpy.decrypt_buffer(bytes(target), restored, "SCHLUESSEL", offset)
+            self.assertEqual(bytes(restored), data)
+    
+    def test_decrypt_batch_matches_decrypt_lowercase(self):
+        """Test: Batch-Entschlüsselung erhält Groß-/Kleinschreibung und Sonderzeichen"""
+        text = "Guten Morgen, Welt!"
+        keys = next(vigenere_numpy.iter_key_batches(3, batch_size=500))
+        plaintexts = vigenere_numpy.decrypt_batch(text, keys)
+        for key, plaintext in zip(vigenere_numpy.keys_to_strings(keys), plaintexts):
+            self.assertEqual(plaintext, VigenereCipher(key).decrypt_lowercase(text))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,43 @@
+"""
+Unittest für den Aho-Corasick-Wortmatcher
+"""
+
+import random
+import unittest
+
+from wordmatch import WordMatcher
+
+
+class TestWordMatcher(unittest.TestCase):
+    """Testsuite für die WordMatcher-Klasse"""
+    
+    def test_finds_overlapping_matches(self):
+        """Test: Überlappende und verschachtelte Wörter werden alle gefunden"""
+        matcher = WordMatcher(["he", "she", "his", "hers"])
+        found = {(end, matcher.words[word_id]) for end, word_id in matcher.iter_matches("ushers")}
+        self.assertEqual(found, {(4, "she"), (4, "he"), (6, "hers")})
+    
+    def test_count_matches_str_count(self):
+        """Test: count entspricht str.count für jedes Wort (nicht überlappend)"""
+        rng = random.Random(5)
+        words = {''.join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(60)}
+        matcher = WordMatcher(words)
+        for _ in range(200):
+            text = ''.join(rng.choices("abcd", k=rng.randint(0, 30)))
+            expected = {w: text.count(w) for w in words if w in text}
+            self.assertEqual(matcher.count(text), expected)
+    
+    def test_repeated_word(self):
+        """Test: 'aa' kommt in 'aaaa' zweimal vor (wie str.count)"""
+        self.assertEqual(WordMatcher(["aa"]).count("aaaa"), {"aa": 2})
+    
+    def test_empty_inputs(self):
+        """Test: Leere Wörter und leere Texte"""
+        matcher = WordMatcher(["", "ab"])
+        self.assertEqual(len(matcher), 1)
+        self.assertEqual(matcher.count(""), {})
+        self.assertEqual(WordMatcher([]).count("abc"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Blocktransposition
+Vorkompilierte Permutationspläne für permute_text / inverse_permute_text
+"""
+
+from functools import lru_cache
+
+
+def validate_code(code: str) -> bool:
+    # Nur die Ziffern 1-9: eine 0 hätte keine Position im Block
+    if not code or not set(code) <= set("123456789"):
+        return False
+    digits = [int(c) for c in code]
+    n = max(digits)
+    return all(i in digits for i in range(1, n + 1))
+
+
+def _gather_blocks(text: str, sources: list, stride: int, count: int) -> str:
+    """
+    Sammelt `count` Blöcke ein: Ausgabeblock k besteht aus
+    text[k * stride + s] für alle s in `sources`.
+
+    Jede Quellposition wird als eine Spalte (Slice mit Schrittweite `stride`)
+    übernommen, es gibt also keine Schleife über einzelne Zeichen.
+    """
+    width = len(sources)
+    end = count * stride
+
+    if text.isascii():
+        data = text.encode("ascii")
+        result = bytearray(count * width)
+        for column, source in enumerate(sources):
+            result[column::width] = data[source:end:stride]
+        return result.decode("ascii")
+
+    result = [''] * (count * width)
+    for column, source in enumerate(sources):
+        result[column::width] = text[source:end:stride]
+    return ''.join(result)
+
+
+class TranspositionPlan:
+    """
+    Aus einem Code kompilierter Transpositionsplan.
+
+    Enthält die Indexmuster für volle Blöcke und für jede mögliche Länge des
+    letzten (kürzeren) Blocks, sodass permute/inverse einen ganzen Text mit
+    wenigen Slice-Operationen umordnen.
+    """
+
+    def __init__(self, code: str):
+        """
+        Args:
+            code: Transpositions-Code (alle Zahlen von 1 bis zur größten Ziffer)
+
+        Raises:
+            ValueError: Wenn der Code ungültig ist
+        """
+        if not code or not validate_code(code):
+            raise ValueError("Ungültiger Code! Er muss alle Zahlen von 1 bis zur größten Ziffer mindestens einmal enthalten.")
+
+        self.code = code
+        self.indices = [int(c) - 1 for c in code]
+        self.block_size = max(self.indices) + 1
+        self.produced_full = len(self.indices)
+
+        # Vorwärts: Blocklänge b -> gelesene Positionen in Ausgabereihenfolge
+        self.forward_tails = {
+            b: [idx for idx in self.indices if idx < b]
+            for b in range(1, self.block_size)
+        }
+
+        # Rückwärts (volle Blöcke): Originalposition -> Position im permutierten Block
+        # (bei mehrfachen Ziffern gewinnt das letzte Vorkommen)
+        source = {}
+        for pos, idx in enumerate(self.indices):
+            source[idx] = pos
+        self.inverse_full = [source[idx] for idx in range(self.block_size)]
+
+        # Rückwärts: Länge des Restblocks -> Positionen im Restblock
+        self.inverse_tails = {
+            remaining: self._inverse_tail(remaining)
+            for remaining in range(1, self.produced_full)
+        }
+
+    def _inverse_tail(self, remaining: int) -> list:
+        """
+        Bestimmt die Originallänge des letzten Blocks durch Probieren
+        (b in 1..block_size mit produced(b) == remaining) und liefert die
+        Positionen im Restblock in Originalreihenfolge.
+        """
+        for b in range(1, self.block_size + 1):
+            positions = [idx for idx in self.indices if idx < b]
+            if len(positions) == remaining:
+                source = [None] * b
+                for pos, idx in enumerate(positions):
+                    source[idx] = pos
+                return [pos for pos in source if pos is not None]
+
+        # Kein passendes b: Zeichen der Reihe nach auf die Positionen verteilen
+        b = min(self.block_size, remaining)
+        source = [None] * b
+        pos = 0
+        for idx in self.indices:
+            if idx < b and pos < remaining:
+                source[idx] = pos
+                pos += 1
+        return [pos for pos in source if pos is not None]
+
+    def permute(self, text: str) -> str:
+        """
+        Entfernt Leerzeichen und permutiert den Text blockweise.
+
+        Args:
+            text: Der Klartext
+
+        Returns:
+            Der permutierte Text
+        """
+        text = text.replace(" ", "")
+        full_blocks = len(text) // self.block_size
+        result = _gather_blocks(text, self.indices, self.block_size, full_blocks)
+
+        tail = text[full_blocks * self.block_size:]
+        if tail:
+            result += ''.join(map(tail.__getitem__, self.forward_tails[len(tail)]))
+        return result
+
+    def inverse(self, text: str) -> str:
+        """
+        Macht permute rückgängig.
+
+        Args:
+            text: Der permutierte Text
+
+        Returns:
+            Der ursprüngliche Text (ohne Leerzeichen)
+        """
+        full_blocks = len(text) // self.produced_full
+        result = _gather_blocks(text, self.inverse_full, self.produced_full, full_blocks)
+
+        tail = text[full_blocks * self.produced_full:]
+        if tail:
+            result += ''.join(map(tail.__getitem__, self.inverse_tails[len(tail)]))
+        return result
+
+    def inverse_order(self, length: int) -> list:
+        """
+        Positionen, aus denen inverse einen Text der Länge `length` zusammensetzt,
+        d.h. inverse(text) == ''.join(text[i] for i in inverse_order(len(text))).
+
+        Damit lässt sich die Umordnung auch auf Arrays (z.B. NumPy) anwenden.
+        """
+        full_blocks = length // self.produced_full
+        order = [
+            block * self.produced_full + pos
+            for block in range(full_blocks)
+            for pos in self.inverse_full
+        ]
+
+        remaining = length - full_blocks * self.produced_full
+        if remaining:
+            start = full_blocks * self.produced_full
+            order.extend(start + pos for pos in self.inverse_tails[remaining])
+        return order
+
+
+@lru_cache(maxsize=1024)
+def get_plan(code: str) -> TranspositionPlan:
+    """
+    Liefert den (zwischengespeicherten) Plan für einen Code.
+
+    Args:
+        code: Transpositions-Code
+
+    Returns:
+        Der kompilierte TranspositionPlan
+    """
+    return TranspositionPlan(code)
@@ -3,10 +3,311 @@ Erweiterte Kryptoanalyse-Tools für Vigenere-Chiffre
 Funktionen zum Brechen und Analysieren der Vigenere-Verschlüsselung
 """
 
+import re
+import time
 from collections import Counter
-from math import gcd
-from functools import reduce
-from vigenere_cipher import VigenereCipher
+from functools import lru_cache
+from vigenere_cipher import VigenereCipher, ALPHABET
+from ngram import get_model
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional
+    np = None
+
+# Alles außer A-Z (nach upper())
+_NON_LETTERS = re.compile("[^A-Z]+")
+
+# Byte-Übersetzung 'A'..'Z' -> 0..25
+_INDEX_TABLE = bytes.maketrans(ALPHABET.encode("ascii"), bytes(range(26)))
+
+
+def _letters(text: str) -> str:
+    """Nur die Buchstaben A-Z des Textes (großgeschrieben)"""
+    return _NON_LETTERS.sub("", text.upper())
+
+
+def _repeat_distances(letters: bytes, min_repeat: int = 3) -> list:
+    """
+    Abstände wiederholter Sequenzen (Kasiski) in linearer Zeit: Jedes N-Gramm
+    der Länge min_repeat wird mit seinen Positionen in einem Dict abgelegt,
+    Abstände ergeben sich aus aufeinanderfolgenden Positionen. Längere
+    Wiederholungen werden nur einmal gezählt (an ihrem Anfang).
+
+    Mit NumPy werden die N-Gramm-Codes stabil sortiert statt in ein Dict
+    gelegt; gleiche Codes stehen dann mit aufsteigenden Positionen nebeneinander.
+
+    Args:
+        letters: Buchstabenindizes 0..25 (AnalysisContext.indices)
+        min_repeat: Minimale Länge einer wiederholten Sequenz
+    """
+    if np is not None:
+        indices = np.frombuffer(letters, dtype=np.uint8).astype(np.int64)
+        count = len(indices) - min_repeat + 1
+        if count < 2:
+            return []
+        codes = np.zeros(count, dtype=np.int64)
+        for offset in range(min_repeat):
+            codes = codes * 26 + indices[offset:offset + count]
+
+        order = np.argsort(codes, kind="stable")
+        same = codes[order[1:]] == codes[order[:-1]]
+        first, second = order[:-1][same], order[1:][same]
+        # Fortsetzungen bereits gezählter längerer Wiederholungen auslassen
+        continued = (first > 0) & (indices[first - 1] == indices[second - 1])
+        return (second - first)[~continued].tolist()
+
+    positions = {}
+    for i in range(len(letters) - min_repeat + 1):
+        positions.setdefault(letters[i:i + min_repeat], []).append(i)
+
+    distances = []
+    for occurrences in positions.values():
+        for i, j in zip(occurrences, occurrences[1:]):
+            # Fortsetzung einer bereits gezählten längeren Wiederholung?
+            if i > 0 and letters[i - 1] == letters[j - 1]:
+                continue
+            distances.append(j - i)
+    return distances
+
+
+# Gewichte der drei Verfahren in rank_key_lengths
+KEY_LENGTH_WEIGHTS = {"ioc": 1.0, "kasiski": 0.5, "friedman": 0.25}
+# Abzug pro Schlüssellänge (Vielfache der richtigen Länge haben denselben IC)
+KEY_LENGTH_PENALTY = 0.01
+
+
+# solve: Anzahl der (nach rank_key_lengths) besten Schlüssellängen, die probiert werden
+SOLVE_KEY_LENGTHS = 3
+# solve: beste Buchstaben pro Spalte (Chi-Quadrat), die in der Verfeinerung probiert werden
+SOLVE_ALTERNATIVES = 3
+# solve: Anzahl der zurückgegebenen Kandidaten
+SOLVE_TOP = 10
+
+
+def _minimal_period(key: str) -> str:
+    """Kürzt einen Schlüssel auf seine kleinste Periode ("ABCABC" -> "ABC")"""
+    length = len(key)
+    for period in range(1, length):
+        if length % period == 0 and key == key[:period] * (length // period):
+            return key[:period]
+    return key
+
+
+# Buchstaben pro Block in ioc_profile (begrenzt den Speicher für Länge x Block)
+_PROFILE_BLOCK = 1 << 14
+
+
+@lru_cache(maxsize=8)
+def _profile_layout(max_length: int):
+    """
+    Tabellenaufbau für ioc_profile: Längen 1..max_length, erste Zeile jeder
+    Länge und die Bin-Basis (Zeile * 26) aller Positionen eines Blocks.
+    """
+    lengths = np.arange(1, max_length + 1)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    bins = ((np.arange(_PROFILE_BLOCK) % lengths[:, None] + starts[:, None]) * 26).astype(np.int32)
+    return lengths, starts, bins
+
+
+# Zirkulante Indizes: _CIRCULANT[s, p] = (p + s) % 26
+_CIRCULANT = (np.arange(26)[:, None] + np.arange(26)[None, :]) % 26 if np is not None else None
+
+
+def chi_squared_matrix(histograms, expected_freq: dict):
+    """
+    Chi-Quadrat-Statistik aller 26 Verschiebungen für viele Spalten in einer
+    Matrixoperation (benötigt NumPy).
+
+    Aus jedem Histogramm h wird die 26x26-Zirkulante C[s, p] = h[(p + s) % 26]
+    gebildet (Zeile s = Häufigkeiten nach Entschlüsselung mit Shift s) und
+    gegen die erwartete Verteilung gewertet. Fehlende Buchstaben zählen wie
+    in chi_squared_test mit 0.1 %, Werte <= 0 werden übersprungen.
+
+    Args:
+        histograms: Array (26,) bzw. (K, 26) mit Buchstabenhäufigkeiten
+        expected_freq: Erwartete Häufigkeitsverteilung in Prozent
+
+    Returns:
+        float-Array (26,) bzw. (K, 26), Index = Schlüsselbuchstabe
+    """
+    histograms = np.asarray(histograms, dtype=np.float64)
+    totals = histograms.sum(axis=-1, keepdims=True)
+    observed = histograms / np.where(totals > 0, totals, 1) * 100
+
+    expected = np.array([expected_freq.get(letter, 0.1) for letter in ALPHABET], dtype=np.float64)
+    weights = np.divide(1.0, expected, out=np.zeros(26), where=expected > 0)
+
+    deviation = observed[..., _CIRCULANT] - expected
+    return (deviation * deviation) @ weights
+
+
+class AnalysisContext:
+    """
+    Einmal normalisierter Text für die Kryptoanalyse.
+
+    Beim Anlegen wird der Text auf die Buchstaben A-Z reduziert und als
+    Byte-Array mit Indizes 0..25 abgelegt. Histogramme (26 Häufigkeiten)
+    werden pro (Schlüssellänge, Spalte) einmal gezählt und zwischengespeichert;
+    IC, Häufigkeitstabellen und Chi-Quadrat-Werte aller 26 Verschiebungen
+    werden daraus abgeleitet, ohne den Text erneut zu durchlaufen.
+    """
+
+    def __init__(self, text: str):
+        """
+        Args:
+            text: Der zu analysierende Text
+        """
+        self.letters = _letters(text)
+        self.indices = self.letters.encode("ascii").translate(_INDEX_TABLE)
+        self._histograms = {}
+        # Schlüssellänge -> NumPy-Array (Länge, 26) aller Spaltenhistogramme (aus ioc_profile)
+        self._column_counts = {}
+
+    @classmethod
+    def of(cls, text) -> "AnalysisContext":
+        """Liefert `text` selbst, falls es schon ein AnalysisContext ist, sonst einen neuen"""
+        return text if isinstance(text, cls) else cls(text)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def histogram(self, key_length: int = 1, column: int = 0) -> list:
+        """
+        Häufigkeiten der Buchstaben in einer Spalte (jeder key_length-te
+        Buchstabe ab `column`); key_length=1 ist der ganze Text.
+
+        Returns:
+            Liste mit 26 Häufigkeiten (Index 0 = 'A')
+        """
+        histogram = self._histograms.get((key_length, column))
+        if histogram is None:
+            if key_length in self._column_counts:
+                histogram = self._column_counts[key_length][column].tolist()
+            else:
+                data = self.indices[column::key_length]
+                histogram = [data.count(i) for i in range(26)]
+            self._histograms[key_length, column] = histogram
+        return histogram
+
+    def histograms(self, key_length: int) -> list:
+        """Die Histogramme aller Spalten für eine Schlüssellänge"""
+        return [self.histogram(key_length, column) for column in range(key_length)]
+
+    def frequencies(self, key_length: int = 1, column: int = 0) -> dict:
+        """Häufigkeiten in Prozent (nur vorkommende Buchstaben, alphabetisch)"""
+        histogram = self.histogram(key_length, column)
+        total = sum(histogram)
+        return {
+            ALPHABET[i]: count / total * 100
+            for i, count in enumerate(histogram) if count
+        }
+
+    def index_of_coincidence(self, key_length: int = 1, column: int = 0) -> float:
+        """Index of Coincidence einer Spalte (0.0 bei weniger als 2 Buchstaben)"""
+        histogram = self.histogram(key_length, column)
+        n = sum(histogram)
+        if n <= 1:
+            return 0.0
+        return sum(count * (count - 1) for count in histogram) / (n * (n - 1))
+
+    def mean_index_of_coincidence(self, key_length: int) -> float:
+        """Mittlerer IC der Spalten bei gegebener Schlüssellänge"""
+        return sum(self.index_of_coincidence(key_length, column) for column in range(key_length)) / key_length
+
+    def ioc_profile(self, max_length: int) -> list:
+        """
+        Mittlerer Spalten-IC für jede Schlüssellänge 1..max_length.
+
+        Mit NumPy werden die Spalten aller Längen in einem Durchlauf über den
+        Text gezählt: Jeder Buchstabe landet für jede Länge L im Bin
+        (Spalte position % L, Buchstabe), alles in einem bincount. Die
+        Histogramme landen im Cache und stehen danach für den
+        Chi-Quadrat-Test bereit.
+
+        Returns:
+            Liste von (Länge, mittlerer IC), nach Länge sortiert
+
+        Raises:
+            ValueError: Wenn max_length kleiner als 1 ist
+        """
+        if max_length < 1:
+            raise ValueError(f"Die maximale Schlüssellänge muss mindestens 1 sein, nicht {max_length}")
+        if np is None:
+            return [(length, self.mean_index_of_coincidence(length)) for length in range(1, max_length + 1)]
+
+        lengths, starts, bins = _profile_layout(max_length)
+        rows = int(lengths.sum())
+
+        indices = np.frombuffer(self.indices, dtype=np.uint8)
+        counts = np.zeros(rows * 26, dtype=np.int64)
+        for start in range(0, len(indices), _PROFILE_BLOCK):
+            block = indices[start:start + _PROFILE_BLOCK]
+            # Bin = (erste Zeile der Länge + Position % Länge) * 26, Blockanfang mitgedreht
+            if start:
+                columns = (np.arange(start, start + len(block)) % lengths[:, None] + starts[:, None]) * 26
+            else:
+                columns = bins[:, :len(block)]
+            counts += np.bincount((columns + block).ravel(), minlength=rows * 26)
+        counts = counts.reshape(rows, 26)
+
+        n = counts.sum(axis=1)
+        pairs = n * (n - 1)
+        coincidences = (counts * (counts - 1)).sum(axis=1)
+        ic = np.divide(coincidences, pairs, out=np.zeros(rows), where=pairs > 0)
+        means = np.add.reduceat(ic, starts) / lengths
+
+        for length, start in zip(lengths.tolist(), starts.tolist()):
+            self._column_counts.setdefault(length, counts[start:start + length])
+        return list(zip(lengths.tolist(), means.tolist()))
+
+    def chi_squared_shifts(self, key_length: int, column: int, expected_freq: dict) -> list:
+        """
+        Chi-Quadrat-Statistik der Spalte für alle 26 Verschiebungen.
+
+        Die Entschlüsselung mit Shift s ist nur eine Rotation des Histogramms
+        (Klartextbuchstabe p stammt aus Geheimtextbuchstabe p + s), es wird
+        also nichts neu entschlüsselt oder gezählt.
+
+        Returns:
+            Liste mit 26 Chi-Quadrat-Werten (Index = Schlüsselbuchstabe, 0 = 'A')
+        """
+        histogram = self.histogram(key_length, column)
+        total = sum(histogram) or 1
+        observed = [count / total * 100 for count in histogram]
+
+        # wie chi_squared_test: fehlende Buchstaben mit 0.1 %, Werte <= 0 überspringen
+        expected = [(p, expected_freq.get(letter, 0.1)) for p, letter in enumerate(ALPHABET)]
+        expected = [(p, exp) for p, exp in expected if exp > 0]
+
+        return [
+            sum((observed[(p + shift) % 26] - exp) ** 2 / exp for p, exp in expected)
+            for shift in range(26)
+        ]
+
+    def rank_shifts(self, key_length: int, column: int, expected_freq: dict) -> list:
+        """Alle 26 Schlüsselbuchstaben der Spalte als (Buchstabe, Chi-Quadrat), beste zuerst"""
+        chi_squared = self.chi_squared_shifts(key_length, column, expected_freq)
+        return sorted(zip(ALPHABET, chi_squared), key=lambda item: item[1])
+
+    def rank_columns(self, key_length: int, expected_freq: dict) -> list:
+        """
+        Wie rank_shifts für alle Spalten einer Schlüssellänge. Mit NumPy
+        werden alle Spalten in einer Matrixoperation bewertet.
+
+        Returns:
+            Pro Spalte eine Liste von (Buchstabe, Chi-Quadrat), beste zuerst
+        """
+        if np is None:
+            return [self.rank_shifts(key_length, column, expected_freq) for column in range(key_length)]
+
+        counts = self._column_counts.get(key_length)
+        chi_squared = chi_squared_matrix(self.histograms(key_length) if counts is None else counts, expected_freq)
+        order = np.argsort(chi_squared, axis=1, kind="stable")
+        return [
+            [(ALPHABET[shift], values[shift]) for shift in ranks]
+            for values, ranks in zip(chi_squared.tolist(), order.tolist())
+        ]
 
 
 class VigenereAnalysis:
@@ -18,23 +319,12 @@ class VigenereAnalysis:
         Führt eine Häufigkeitsanalyse durch.
         
         Args:
-            text: Der zu analysierende Text
+            text: Der zu analysierende Text (oder ein AnalysisContext)
             
         Returns:
             Ein Dictionary mit Buchstaten und ihren Häufigkeiten
         """
-        text = text.upper().replace(" ", "").replace("\n", "")
-        text = ''.join(c for c in text if c.isalpha())
-        
-        letter_count = Counter(text)
-        total = len(text)
-        
-        frequency = {
-            letter: (count / total * 100)
-            for letter, count in sorted(letter_count.items())
-        }
-        
-        return frequency
+        return AnalysisContext.of(text).frequencies()
     
     @staticmethod
     def index_of_coincidence(text: str) -> float:
@@ -43,60 +333,56 @@ class VigenereAnalysis:
         Der IC hilft bei der Bestimmung der Schlüssellänge.
         
         Args:
-            text: Der zu analysierende Text
+            text: Der zu analysierende Text (oder ein AnalysisContext)
             
         Returns:
             Der Index of Coincidence (Wert zwischen 0 und 1)
         """
-        text = text.upper().replace(" ", "").replace("\n", "")
-        text = ''.join(c for c in text if c.isalpha())
-        
-        if len(text) <= 1:
-            return 0.0
-        
-        letter_count = Counter(text)
-        n = len(text)
-        
-        ic = sum(count * (count - 1) for count in letter_count.values()) / (n * (n - 1))
-        return ic
+        return AnalysisContext.of(text).index_of_coincidence()
     
+    @staticmethod
+    def kasiski_examination(ciphertext: str, max_length: int = 20, min_repeat: int = 3) -> list:
+        """
+        Kasiski-Test über einen Index aller N-Gramme (siehe _repeat_distances).
+        Für jeden Abstand wird jede mögliche Schlüssellänge 2..max_length
+        gezählt, die ihn teilt.
+
+        Args:
+            ciphertext: Der verschlüsselte Text (oder ein AnalysisContext)
+            max_length: Maximale zu testende Schlüssellänge
+            min_repeat: Minimale Länge einer wiederholten Sequenz
+
+        Returns:
+            Liste von (Schlüssellänge, Anzahl teilbarer Abstände), sortiert
+            nach dem Überschuss gegenüber zufälligen Abständen
+            (Anzahl - Abstände / Länge), beste zuerst
+        """
+        distances = _repeat_distances(AnalysisContext.of(ciphertext).indices, min_repeat)
+        if not distances:
+            return []
+
+        counts = Counter()
+        for distance in distances:
+            for length in range(2, min(distance, max_length) + 1):
+                if distance % length == 0:
+                    counts[length] += 1
+
+        total = len(distances)
+        return sorted(counts.items(), key=lambda item: (-(item[1] - total / item[0]), item[0]))
+
     @staticmethod
     def find_key_length(ciphertext: str, max_length: int = 20) -> list:
         """
         Versucht, die Schlüssellänge mit der Kasiski-Methode zu bestimmen.
         
         Args:
-            ciphertext: Der verschlüsselte Text
+            ciphertext: Der verschlüsselte Text (oder ein AnalysisContext)
             max_length: Maximale zu testende Schlüssellänge
             
         Returns:
-            Eine Liste mit wahrscheinlichen Schlüssellängen
+            Eine Liste mit wahrscheinlichen Schlüssellängen (wahrscheinlichste zuerst)
         """
-        ciphertext = ciphertext.upper().replace(" ", "").replace("\n", "")
-        
-        # Suche nach wiederholten Sequenzen (3er und 4er)
-        distances = []
-        
-        for seq_len in [3, 4]:
-            for i in range(len(ciphertext) - seq_len):
-                seq = ciphertext[i:i+seq_len]
-                for j in range(i + seq_len, len(ciphertext) - seq_len + 1):
-                    if ciphertext[j:j+seq_len] == seq:
-                        distances.append(j - i)
-        
-        if not distances:
-            return []
-        
-        # Berechne GCD aller Distanzen
-        common_divisor = reduce(gcd, distances)
-        
-        # Finde alle Teiler des GCD
-        divisors = []
-        for i in range(2, min(common_divisor + 1, max_length + 1)):
-            if common_divisor % i == 0:
-                divisors.append(i)
-        
-        return sorted(divisors)
+        return [length for length, count in VigenereAnalysis.kasiski_examination(ciphertext, max_length)]
     
     @staticmethod
     def chi_squared_test(observed: dict, expected: dict) -> float:
@@ -134,41 +420,218 @@ class VigenereAnalysis:
         Returns:
             Der wahrscheinlichste Schlüsselbuchstabe
         """
-        ciphertext = ciphertext.upper()
-        
-        # Extrahiere alle Zeichen an Position (position mod Schlüssellänge)
-        subset = ""
-        idx = position
-        while idx < len(ciphertext):
-            if ciphertext[idx].isalpha():
-                subset += ciphertext[idx]
-            idx += 1
-        
-        if not subset:
+        # Alle Buchstaben ab `position`, ein Histogramm für alle 26 Shifts
+        context = AnalysisContext(ciphertext[position:])
+        if not len(context):
             return ""
         
-        best_key = None
-        best_chi_squared = float('inf')
-        
-        # Probiere alle möglichen Schlüsselbuchstaben (A-Z)
-        for shift in range(26):
-            # Entschlüsseln mit diesem Shift
-            decrypted = ""
-            for char in subset:
-                decrypted += chr((ord(char) - ord('A') - shift) % 26 + ord('A'))
-            
-            # Häufigkeitsanalyse
-            freq = VigenereAnalysis.frequency_analysis(decrypted)
-            
-            # Chi-Quadrat-Test
-            chi_sq = VigenereAnalysis.chi_squared_test(freq, expected_freq)
-            
-            if chi_sq < best_chi_squared:
-                best_chi_squared = chi_sq
-                best_key = chr(shift + ord('A'))
-        
-        return best_key
-    
+        chi_squared = context.chi_squared_shifts(1, 0, expected_freq)
+        return ALPHABET[min(range(26), key=chi_squared.__getitem__)]
+
+    @staticmethod
+    def friedman_test(ciphertext: str, expected_freq: dict = None):
+        """
+        Friedman-Schätzung der Schlüssellänge aus dem IC des ganzen Textes:
+
+            L = n (κp - κr) / ((n - 1) κo - n κr + κp)
+
+        mit κo = beobachteter IC, κp = IC der Sprache (aus expected_freq)
+        und κr = 1/26 (Zufallstext).
+
+        Args:
+            ciphertext: Der verschlüsselte Text (oder ein AnalysisContext)
+            expected_freq: Erwartete Häufigkeitsverteilung (Standard: Deutsch)
+
+        Returns:
+            Die geschätzte (nicht ganzzahlige) Länge, oder None, wenn der Text
+            zu kurz oder nicht von Zufall zu unterscheiden ist
+        """
+        context = AnalysisContext.of(ciphertext)
+        n = len(context)
+        if n <= 1:
+            return None
+
+        kappa_p = _language_ic(expected_freq or GERMAN_FREQUENCY)
+        kappa_r = 1 / 26
+        denominator = (n - 1) * context.index_of_coincidence() - n * kappa_r + kappa_p
+        if denominator <= 0:
+            return None
+        return n * (kappa_p - kappa_r) / denominator
+
+    @staticmethod
+    def rank_key_lengths(ciphertext: str, max_length: int = 20, expected_freq: dict = None) -> list:
+        """
+        Bewertet die Schlüssellängen 1..max_length mit allen drei Verfahren:
+
+        - IC-Profil: mittlerer Spalten-IC, skaliert auf 0 (Zufall) .. 1 (Sprache)
+          und bei 1 abgeschnitten (kurze Spalten erreichen sonst IC-Werte bis 1)
+        - Kasiski: Überschuss der teilbaren Abstände, skaliert auf 0 .. 1
+        - Friedman: Nähe zur geschätzten Länge, 0 .. 1
+
+        Vielfache der richtigen Länge haben denselben IC; sie verlieren
+        gegen die Grundlänge über Kasiski und einen kleinen Abzug pro Länge.
+
+        Args:
+            ciphertext: Der verschlüsselte Text (oder ein AnalysisContext)
+            max_length: Maximale zu testende Schlüssellänge
+            expected_freq: Erwartete Häufigkeitsverteilung (Standard: Deutsch)
+
+        Returns:
+            Liste von (Länge, Score), beste zuerst
+
+        Raises:
+            ValueError: Wenn max_length kleiner als 1 ist
+        """
+        context = AnalysisContext.of(ciphertext)
+        max_length = min(max_length, max(len(context) // 2, 1))
+
+        kappa_p = _language_ic(expected_freq or GERMAN_FREQUENCY)
+        kappa_r = 1 / 26
+
+        # zuerst das Profil: es füllt auch das Histogramm für die Friedman-Schätzung
+        profile = context.ioc_profile(max_length)
+        friedman = VigenereAnalysis.friedman_test(context, expected_freq)
+
+        # Kasiski: Überschuss gegenüber zufälligen Abständen, relativ zum besten
+        distances = _repeat_distances(context.indices)
+        lengths = range(1, max_length + 1)
+        if np is not None and distances:
+            divisible = (np.array(distances) % np.arange(1, max_length + 1)[:, None] == 0).sum(axis=1).tolist()
+        else:
+            counts = Counter(distances)
+            divisible = [sum(n for distance, n in counts.items() if distance % length == 0) for length in lengths]
+        excess = {length: count - len(distances) / length for length, count in zip(lengths, divisible)}
+        best_excess = max([value for length, value in excess.items() if length > 1] + [0])
+
+        ranking = []
+        for length, ic in profile:
+            score = KEY_LENGTH_WEIGHTS["ioc"] * min(max(ic - kappa_r, 0) / (kappa_p - kappa_r), 1.0)
+            if best_excess > 0 and length > 1:
+                score += KEY_LENGTH_WEIGHTS["kasiski"] * max(excess[length], 0) / best_excess
+            if friedman:
+                score += KEY_LENGTH_WEIGHTS["friedman"] / (1 + abs(length - friedman) / friedman)
+            score -= KEY_LENGTH_PENALTY * length
+            ranking.append((length, score))
+
+        ranking.sort(key=lambda item: item[1], reverse=True)
+        return ranking
+
+    @staticmethod
+    def rank_key_letters(ciphertext: str, key_length: int, expected_freq: dict) -> list:
+        """
+        Bewertet für jede Schlüsselposition alle 26 Buchstaben per Chi-Quadrat-Test
+        (26 * Länge Tests statt 26 ^ Länge Schlüssel).
+
+        Args:
+            ciphertext: Der verschlüsselte Text (oder ein AnalysisContext)
+            key_length: Die angenommene Schlüssellänge
+            expected_freq: Erwartete Häufigkeitsverteilung (z.B. Deutsch)
+
+        Returns:
+            Pro Spalte eine Liste von (Buchstabe, Chi-Quadrat), beste zuerst
+        """
+        return AnalysisContext.of(ciphertext).rank_columns(key_length, expected_freq)
+
+    @staticmethod
+    def _key_fitness(context: AnalysisContext, model, keys: list) -> list:
+        """
+        N-Gramm-Score des Klartexts für jeden Schlüssel (alle gleich lang).
+        Mit NumPy werden alle Schlüssel in einer Matrix entschlüsselt und bewertet.
+        """
+        if np is None:
+            return [model.score(VigenereCipher(key).decrypt(context.letters)) for key in keys]
+
+        indices = np.frombuffer(context.indices, dtype=np.uint8).astype(np.int16)
+        shifts = np.frombuffer(''.join(keys).encode("ascii").translate(_INDEX_TABLE), dtype=np.uint8)
+        shifts = shifts.reshape(len(keys), -1).astype(np.int16)
+        positions = np.arange(len(indices)) % shifts.shape[1]
+        return model.score_indices((indices - shifts[:, positions]) % 26).tolist()
+
+    @staticmethod
+    def solve(ciphertext: str, language: str = "de", max_key_length: int = 20,
+              time_budget: float = None, key_lengths: int = SOLVE_KEY_LENGTHS, top: int = SOLVE_TOP) -> list:
+        """
+        Bricht die Vigenere-Chiffre ohne Schlüssel.
+
+        Für die besten Schlüssellängen (rank_key_lengths) wird jede Spalte
+        per Chi-Quadrat bewertet; der Schlüssel aus den besten Buchstaben wird
+        danach per N-Gramm-Score verfeinert: In jeder Runde werden für alle
+        Positionen die nächstbesten Buchstaben probiert und die beste
+        Verbesserung übernommen, bis keine mehr möglich ist.
+
+        Args:
+            ciphertext: Der verschlüsselte Text
+            language: "de" oder "en" (Häufigkeiten und N-Gramm-Modell)
+            max_key_length: Maximale zu testende Schlüssellänge
+            time_budget: Maximale Laufzeit in Sekunden (None = unbegrenzt);
+                der erste Schlüssel wird immer bewertet
+            key_lengths: Anzahl der probierten Schlüssellängen
+            top: Anzahl der zurückgegebenen Kandidaten
+
+        Returns:
+            Liste von (Schlüssel, Klartext, Score), beste zuerst; Score ist die
+            Summe der N-Gramm-Log-Wahrscheinlichkeiten (höher = besser)
+
+        Raises:
+            ValueError: Wenn die Sprache unbekannt oder max_key_length kleiner als 1 ist
+        """
+        if language not in LANGUAGE_FREQUENCIES:
+            raise ValueError(f"Unbekannte Sprache: {language} (verfügbar: {', '.join(LANGUAGE_FREQUENCIES)})")
+        if max_key_length < 1:
+            raise ValueError(f"Die maximale Schlüssellänge muss mindestens 1 sein, nicht {max_key_length}")
+
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        context = AnalysisContext(ciphertext)
+        if not len(context):
+            return []
+
+        expected_freq = LANGUAGE_FREQUENCIES[language]
+        model = get_model(language)
+        scores = {}
+
+        ranking = VigenereAnalysis.rank_key_lengths(context, max_key_length, expected_freq)
+        tried = []
+        for length, _ in ranking[:key_lengths]:
+            if scores and deadline is not None and time.perf_counter() >= deadline:
+                break
+            # Vielfache einer probierten Länge liefern nur deren Schlüssel wiederholt -
+            # außer der Spalten-IC steigt, dann war die kürzere Länge nur eine Teilperiode
+            # (z.B. "SECRET" mit der Länge 3: die Spalte E/E passt schon)
+            ic = context.mean_index_of_coincidence(length)
+            if any(length % shorter == 0 and ic <= context.mean_index_of_coincidence(shorter)
+                   for shorter in tried):
+                continue
+            tried.append(length)
+
+            columns = context.rank_columns(length, expected_freq)
+            key = ''.join(column[0][0] for column in columns)
+            best = scores[key] = VigenereAnalysis._key_fitness(context, model, [key])[0]
+
+            while deadline is None or time.perf_counter() < deadline:
+                trials = [
+                    key[:position] + letter + key[position + 1:]
+                    for position, column in enumerate(columns)
+                    for letter, _ in column[:SOLVE_ALTERNATIVES]
+                    if letter != key[position]
+                ]
+                if not trials:
+                    break
+                trial_scores = VigenereAnalysis._key_fitness(context, model, trials)
+                scores.update(zip(trials, trial_scores))
+
+                score, trial = max(zip(trial_scores, trials))
+                if score <= best:
+                    break
+                key, best = trial, score
+
+        # Schlüssel mit kürzerer Periode (z.B. "ABAB" = "AB") nur einmal, mit dem besten Score
+        results = {}
+        for key, score in sorted(scores.items(), key=lambda item: item[1], reverse=True):
+            results.setdefault(_minimal_period(key), score)
+            if len(results) == top:
+                break
+        return [(key, VigenereCipher(key).decrypt(ciphertext), score) for key, score in results.items()]
+
     @staticmethod
     def analyze_text(text: str):
         """
@@ -179,6 +642,9 @@ class VigenereAnalysis:
         """
         print("\n=== VIGENERE-ANALYSE ===\n")
         
+        # Text nur einmal normalisieren und zählen
+        text = AnalysisContext.of(text)
+        
         # Index of Coincidence
         ic = VigenereAnalysis.index_of_coincidence(text)
         print(f"Index of Coincidence: {ic:.4f}")
@@ -197,6 +663,19 @@ class VigenereAnalysis:
             print(f"Wahrscheinliche Schlüssellängen: {key_lengths[:5]}")
         else:
             print("Keine wiederholten Sequenzen gefunden")
+        
+        # Schlüssellänge aus IC-Profil, Kasiski und Friedman
+        print("\n--- Schlüssellänge ---")
+        friedman = VigenereAnalysis.friedman_test(text)
+        print(f"Friedman-Schätzung: {friedman:.1f}" if friedman else "Friedman-Schätzung: -")
+        ranking = VigenereAnalysis.rank_key_lengths(text)
+        print("Bewertete Schlüssellängen: " + ", ".join(f"{length} ({score:.2f})" for length, score in ranking[:5]))
+
+
+def _language_ic(expected_freq: dict) -> float:
+    """Erwarteter IC einer Sprache aus ihrer Häufigkeitsverteilung (in Prozent)"""
+    total = sum(expected_freq.values())
+    return sum((freq / total) ** 2 for freq in expected_freq.values())
 
 
 # Standard-Häufigkeitsverteilung für Deutsch
@@ -216,3 +695,9 @@ ENGLISH_FREQUENCY = {
     'S': 6.33, 'T': 9.06, 'U': 2.76, 'V': 0.98, 'W': 2.36, 'X': 0.15,
     'Y': 1.97, 'Z': 0.07
 }
+
+# Sprachen für solve: erwartete Häufigkeiten (das N-Gramm-Modell kommt aus ngram.get_model)
+LANGUAGE_FREQUENCIES = {
+    "de": GERMAN_FREQUENCY,
+    "en": ENGLISH_FREQUENCY,
+}
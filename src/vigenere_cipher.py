@@ -3,6 +3,206 @@ Vigenere Cipher Implementation
 Eine klassische polyalphabetische Substitutionsverschlüsselung
 """
 
+import string
+from itertools import accumulate, chain
+
+ALPHABET = string.ascii_uppercase
+
+
+# -------------------------------------------------
+# Übersetzungstabellen (einmalig beim Import erzeugt)
+# -------------------------------------------------
+
+class _ShiftTable(dict):
+    """
+    str.translate-Tabelle für eine feste Caesar-Verschiebung.
+
+    ASCII-Buchstaben sind vorberechnet, Groß- und Kleinbuchstaben bleiben
+    dabei erhalten. Andere Buchstaben (z.B. Ä, Ö, Ü) werden wie bisher über
+    ihren Codepoint verschoben und beim ersten Auftreten in der Tabelle
+    zwischengespeichert.
+    """
+
+    def __init__(self, shift: int):
+        shifted = ALPHABET[shift:] + ALPHABET[:shift]
+        super().__init__(str.maketrans(ALPHABET + ALPHABET.lower(), shifted + shifted.lower()))
+        self.shift = shift
+
+    def __missing__(self, code: int) -> int:
+        if not chr(code).isalpha():
+            raise LookupError(code)
+        value = (code - ord('A') + self.shift) % 26 + ord('A')
+        self[code] = value
+        return value
+
+
+_KEEP = object()
+
+
+class _LetterTable(dict):
+    """
+    str.translate-Tabelle, die Buchstaben auf `letter` und alle anderen
+    Zeichen auf `other` abbildet (None = entfernen, _KEEP = beibehalten).
+    """
+
+    def __init__(self, letter, other):
+        super().__init__()
+        self.letter = letter
+        self.other = other
+        for code in range(128):
+            self[code]
+
+    def __missing__(self, code: int):
+        value = self.letter if chr(code).isalpha() else self.other
+        if value is _KEEP:
+            value = code
+        self[code] = value
+        return value
+
+
+_SHIFT_TABLES = [_ShiftTable(shift) for shift in range(26)]
+
+# Buchstabenstrom bzw. Nicht-Buchstaben eines Textes
+_LETTERS_ONLY = _LetterTable(_KEEP, None)
+_NON_LETTERS_ONLY = _LetterTable(None, _KEEP)
+
+# Maske: Buchstaben bleiben als 'L' stehen, alles andere wird zu '.'
+_LETTER_MASK = _LetterTable('L', '.')
+
+# Abschnittsgröße beim Zusammenführen von Buchstaben und Nicht-Buchstaben
+_MERGE_WINDOW = 1 << 14
+
+# Standard-Abschnittsgröße (Zeichen) für die Stream-Verarbeitung
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _shift_letters(letters: str, shifts: tuple) -> str:
+    """
+    Verschiebt einen reinen Buchstabenstrom mit dem periodischen Schlüssel.
+
+    Jede Schlüsselposition bildet eine Spalte (letters[i::len(shifts)]),
+    die mit einem einzigen translate-Aufruf verschoben wird.
+    """
+    period = len(shifts)
+    if period == 1:
+        return letters.translate(_SHIFT_TABLES[shifts[0]])
+
+    # Verschobene Buchstaben liegen immer in A-Z, daher reicht ASCII
+    result = bytearray(len(letters))
+    for column, shift in enumerate(shifts):
+        result[column::period] = letters[column::period].translate(_SHIFT_TABLES[shift]).encode('ascii')
+    return result.decode('ascii')
+
+
+def _merge_window(window: str, letters: str, offset: int) -> tuple:
+    """
+    Setzt letters[offset:] an die Buchstabenpositionen von `window`.
+
+    Returns:
+        (zusammengeführter Abschnitt, neuer Offset im Buchstabenstrom)
+    """
+    # Zwischen je zwei Nicht-Buchstaben liegt genau ein (evtl. leerer) Buchstabenlauf
+    runs = window.translate(_LETTER_MASK).split('.')
+    ends = list(accumulate(chain((offset,), map(len, runs))))
+
+    pieces = [None] * (2 * len(runs) - 1)
+    pieces[0::2] = map(letters.__getitem__, map(slice, ends, ends[1:]))
+    pieces[1::2] = window.translate(_NON_LETTERS_ONLY)
+    return ''.join(pieces), ends[-1]
+
+
+def _merge_letters(text: str, letters: str) -> str:
+    """
+    Setzt einen Buchstabenstrom wieder an die Buchstabenpositionen von `text`.
+    Nicht-Buchstaben werden unverändert aus `text` übernommen.
+
+    Lange Texte werden in Abschnitten von _MERGE_WINDOW Zeichen verarbeitet,
+    damit die Zwischenlisten unabhängig von der Textlänge klein bleiben.
+    """
+    if len(text) <= _MERGE_WINDOW:
+        return _merge_window(text, letters, 0)[0]
+
+    merged = []
+    offset = 0
+    for start in range(0, len(text), _MERGE_WINDOW):
+        piece, offset = _merge_window(text[start:start + _MERGE_WINDOW], letters, offset)
+        merged.append(piece)
+
+    return ''.join(merged)
+
+
+# -------------------------------------------------
+# Byte-Variante (Dateien, mmap) - nur ASCII-Buchstaben werden verschoben
+# -------------------------------------------------
+
+_ASCII_LETTERS = (ALPHABET + ALPHABET.lower()).encode('ascii')
+
+_BYTE_SHIFT_TABLES = [
+    bytes.maketrans(_ASCII_LETTERS, _ASCII_LETTERS[shift:26] + _ASCII_LETTERS[:shift]
+                    + _ASCII_LETTERS[26 + shift:] + _ASCII_LETTERS[26:26 + shift])
+    for shift in range(26)
+]
+
+_BYTE_NON_LETTERS = bytes(code for code in range(256) if code not in _ASCII_LETTERS)
+_BYTE_LETTER_MASK = bytes.maketrans(
+    bytes(range(256)),
+    bytes(ord('L') if code in _ASCII_LETTERS else ord('.') for code in range(256))
+)
+_SINGLE_BYTES = [bytes((code,)) for code in range(256)]
+
+
+def _apply_byte_shifts(data: bytes, shifts: tuple) -> tuple:
+    """
+    Byte-Gegenstück zu VigenereCipher._apply_shifts. Alle Bytes außer
+    A-Z/a-z (auch UTF-8-Folgebytes) bleiben unverändert.
+
+    Returns:
+        (verschobene Bytes, Anzahl der verschobenen Buchstaben)
+    """
+    letters = data.translate(None, _BYTE_NON_LETTERS)
+
+    period = len(shifts)
+    shifted = bytearray(len(letters))
+    for column, shift in enumerate(shifts):
+        shifted[column::period] = letters[column::period].translate(_BYTE_SHIFT_TABLES[shift])
+
+    if len(letters) == len(data):
+        return bytes(shifted), len(letters)
+
+    # Zusammenführen wie in _merge_window, Nicht-Buchstaben sind einzelne Bytes
+    runs = data.translate(_BYTE_LETTER_MASK).split(b'.')
+    ends = list(accumulate(chain((0,), map(len, runs))))
+
+    pieces = [None] * (2 * len(runs) - 1)
+    pieces[0::2] = map(shifted.__getitem__, map(slice, ends, ends[1:]))
+    pieces[1::2] = map(_SINGLE_BYTES.__getitem__, data.translate(None, _ASCII_LETTERS))
+    return b''.join(pieces), len(letters)
+
+
+def _rotate(shifts: tuple, offset: int) -> tuple:
+    """Beginnt die Schlüsselfolge an Position `offset`"""
+    offset %= len(shifts)
+    return shifts[offset:] + shifts[:offset]
+
+
+def read_chunks(reader, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Liest ein Text- oder Binärobjekt in Abschnitten fester Größe.
+
+    Args:
+        reader: Objekt mit read(size)-Methode
+        chunk_size: Größe eines Abschnitts
+
+    Yields:
+        Die gelesenen Abschnitte (der letzte ggf. kürzer)
+    """
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
 class VigenereCipher:
     """
     Implementierung der Vigenere-Verschlüsselung.
@@ -25,6 +225,10 @@ class VigenereCipher:
             raise ValueError("Der Schlüssel muss aus Buchstaben bestehen und darf nicht leer sein")
         
         self.key = key.upper()
+
+        # Verschiebungen pro Schlüsselposition (A=0, B=1, ..., Z=25)
+        self._shifts = tuple((ord(char) - ord('A')) % 26 for char in self.key)
+        self._inverse_shifts = tuple((26 - shift) % 26 for shift in self._shifts)
     
     def _expand_key(self, text: str) -> str:
         """
@@ -50,6 +254,43 @@ class VigenereCipher:
         
         return ''.join(expanded_key)
     
+    def _apply_shifts(self, text: str, shifts: tuple, offset: int = 0) -> tuple:
+        """
+        Wendet die periodischen Verschiebungen auf alle Buchstaben an.
+        ASCII-Buchstaben behalten dabei ihre Schreibweise.
+
+        Args:
+            text: Der zu verschiebende Text
+            shifts: Verschiebung pro Schlüsselposition
+            offset: Schlüsselposition des ersten Buchstabens
+
+        Returns:
+            (verschobener Text, Anzahl der verschobenen Buchstaben)
+        """
+        shifts = _rotate(shifts, offset)
+
+        letters = text.translate(_LETTERS_ONLY)
+        shifted = _shift_letters(letters, shifts)
+
+        if len(letters) == len(text):
+            return shifted, len(letters)
+        return _merge_letters(text, shifted), len(letters)
+
+    def _apply_shifts_preserving_case(self, text: str, shifts: tuple, offset: int = 0) -> tuple:
+        """
+        Wie _apply_shifts, stellt aber auch bei Nicht-ASCII-Text die
+        ursprüngliche Groß-/Kleinschreibung wieder her.
+
+        Returns:
+            (verschobener Text, Anzahl der verschobenen Buchstaben)
+        """
+        if text.isascii():
+            # Die Tabellen erhalten die Schreibweise -> ein einziger Durchlauf
+            return self._apply_shifts(text, shifts, offset)
+
+        shifted, count = self._apply_shifts(text.upper(), shifts, offset)
+        return self._restore_case(text, shifted), count
+
     def encrypt(self, plaintext: str) -> str:
         """
         Verschlüsselt einen Text mit der Vigenere-Chiffre.
@@ -60,23 +301,7 @@ class VigenereCipher:
         Returns:
             Der verschlüsselte Text
         """
-        plaintext = plaintext.upper()
-        expanded_key = self._expand_key(plaintext)
-        ciphertext = []
-        
-        for plain_char, key_char in zip(plaintext, expanded_key):
-            if plain_char.isalpha():
-                # Shift-Wert aus dem Schlüssel (A=0, B=1, ..., Z=25)
-                shift = ord(key_char) - ord('A')
-                
-                # Verschlüsselter Buchstabe
-                encrypted_char = chr((ord(plain_char) - ord('A') + shift) % 26 + ord('A'))
-                ciphertext.append(encrypted_char)
-            else:
-                # Nicht-Buchstaben bleiben unverändert
-                ciphertext.append(plain_char)
-        
-        return ''.join(ciphertext)
+        return self._apply_shifts(plaintext.upper(), self._shifts)[0]
     
     def decrypt(self, ciphertext: str) -> str:
         """
@@ -88,23 +313,7 @@ class VigenereCipher:
         Returns:
             Der entschlüsselte (ursprüngliche) Text
         """
-        ciphertext = ciphertext.upper()
-        expanded_key = self._expand_key(ciphertext)
-        plaintext = []
-        
-        for cipher_char, key_char in zip(ciphertext, expanded_key):
-            if cipher_char.isalpha():
-                # Shift-Wert aus dem Schlüssel
-                shift = ord(key_char) - ord('A')
-                
-                # Entschlüsselter Buchstabe (inverse Operation)
-                decrypted_char = chr((ord(cipher_char) - ord('A') - shift) % 26 + ord('A'))
-                plaintext.append(decrypted_char)
-            else:
-                # Nicht-Buchstaben bleiben unverändert
-                plaintext.append(cipher_char)
-        
-        return ''.join(plaintext)
+        return self._apply_shifts(ciphertext.upper(), self._inverse_shifts)[0]
     
     def encrypt_lowercase(self, plaintext: str) -> str:
         """
@@ -116,18 +325,7 @@ class VigenereCipher:
         Returns:
             Der verschlüsselte Text mit beibehaltener Groß-/Kleinschreibung
         """
-        plaintext_upper = plaintext.upper()
-        encrypted = self.encrypt(plaintext_upper)
-        
-        # Wiederherstellen der ursprünglichen Groß-/Kleinschreibung
-        result = []
-        for original, encrypted_char in zip(plaintext, encrypted):
-            if original.islower() and encrypted_char.isalpha():
-                result.append(encrypted_char.lower())
-            else:
-                result.append(encrypted_char)
-        
-        return ''.join(result)
+        return self._apply_shifts_preserving_case(plaintext, self._shifts)[0]
     
     def decrypt_lowercase(self, ciphertext: str) -> str:
         """
@@ -139,15 +337,119 @@ class VigenereCipher:
         Returns:
             Der entschlüsselte Text mit beibehaltener Groß-/Kleinschreibung
         """
-        ciphertext_upper = ciphertext.upper()
-        decrypted = self.decrypt(ciphertext_upper)
+        return self._apply_shifts_preserving_case(ciphertext, self._inverse_shifts)[0]
+    
+    def encrypt_bytes(self, data: bytes, offset: int = 0) -> bytes:
+        """
+        Verschlüsselt Bytes direkt, ohne sie als Text zu dekodieren.
+        Nur ASCII-Buchstaben werden verschlüsselt (Schreibweise bleibt erhalten),
+        alle anderen Bytes bleiben unverändert.
+        
+        Args:
+            data: Die zu verschlüsselnden Bytes
+            offset: Schlüsselposition des ersten Buchstabens
+            
+        Returns:
+            Die verschlüsselten Bytes
+        """
+        return _apply_byte_shifts(bytes(data), _rotate(self._shifts, offset))[0]
+    
+    def decrypt_bytes(self, data: bytes, offset: int = 0) -> bytes:
+        """
+        Entschlüsselt Bytes direkt (Gegenstück zu encrypt_bytes).
+        
+        Args:
+            data: Die zu entschlüsselnden Bytes
+            offset: Schlüsselposition des ersten Buchstabens
+            
+        Returns:
+            Die entschlüsselten Bytes
+        """
+        return _apply_byte_shifts(bytes(data), _rotate(self._inverse_shifts, offset))[0]
+    
+    def _process_chunks(self, chunks, shifts: tuple):
+        """
+        Verschiebt eine Folge von Text- oder Byteabschnitten, wobei die
+        Schlüsselposition über die Abschnittsgrenzen hinweg fortgeführt wird.
+        """
+        offset = 0
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                result, count = self._apply_shifts_preserving_case(chunk, shifts, offset)
+            else:
+                result, count = _apply_byte_shifts(bytes(chunk), _rotate(shifts, offset))
+            offset += count
+            yield result
+    
+    def encrypt_chunks(self, chunks):
+        """
+        Verschlüsselt eine Folge von Text- oder Byteabschnitten wie einen
+        einzigen Text (mit beibehaltener Groß-/Kleinschreibung).
+        
+        Args:
+            chunks: Iterierbare Folge von Abschnitten (str oder bytes)
+            
+        Yields:
+            Die verschlüsselten Abschnitte
+        """
+        return self._process_chunks(chunks, self._shifts)
+    
+    def decrypt_chunks(self, chunks):
+        """
+        Entschlüsselt eine Folge von Text- oder Byteabschnitten wie einen
+        einzigen Text (mit beibehaltener Groß-/Kleinschreibung).
+        
+        Args:
+            chunks: Iterierbare Folge von Abschnitten (str oder bytes)
+            
+        Yields:
+            Die entschlüsselten Abschnitte
+        """
+        return self._process_chunks(chunks, self._inverse_shifts)
+    
+    def stream_encrypt(self, reader, writer, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Verschlüsselt einen Textstrom abschnittsweise mit konstantem Speicherbedarf.
         
-        # Wiederherstellen der ursprünglichen Groß-/Kleinschreibung
+        Args:
+            reader: Lesbares Text- oder Binärobjekt (z.B. geöffnete Datei)
+            writer: Schreibbares Objekt desselben Typs
+            chunk_size: Anzahl Zeichen bzw. Bytes pro gelesenem Abschnitt
+        """
+        for chunk in self.encrypt_chunks(read_chunks(reader, chunk_size)):
+            writer.write(chunk)
+    
+    def stream_decrypt(self, reader, writer, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Entschlüsselt einen Textstrom abschnittsweise mit konstantem Speicherbedarf.
+        
+        Args:
+            reader: Lesbares Text- oder Binärobjekt (z.B. geöffnete Datei)
+            writer: Schreibbares Objekt desselben Typs
+            chunk_size: Anzahl Zeichen bzw. Bytes pro gelesenem Abschnitt
+        """
+        for chunk in self.decrypt_chunks(read_chunks(reader, chunk_size)):
+            writer.write(chunk)
+    
+    @staticmethod
+    def _restore_case(original: str, processed: str) -> str:
+        """
+        Überträgt die Kleinschreibung von `original` auf `processed`.
+        Wird nur für Nicht-ASCII-Texte benötigt, bei denen upper() die
+        Textlänge verändern kann (z.B. ß -> SS).
+        
+        Args:
+            original: Der ursprüngliche Text
+            processed: Der ver- bzw. entschlüsselte Text (Großbuchstaben)
+            
+        Returns:
+            Der Text mit wiederhergestellter Groß-/Kleinschreibung
+        """
         result = []
-        for original, decrypted_char in zip(ciphertext, decrypted):
-            if original.islower() and decrypted_char.isalpha():
-                result.append(decrypted_char.lower())
+        for original_char, processed_char in zip(original, processed):
+            if original_char.islower() and processed_char.isalpha():
+                result.append(processed_char.lower())
             else:
-                result.append(decrypted_char)
+                result.append(processed_char)
         
         return ''.join(result)
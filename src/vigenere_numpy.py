@@ -0,0 +1,262 @@
+"""
+NumPy-Beschleunigung für die Vigenere-Chiffre
+Vektorisierte Ver- und Entschlüsselung von Buchstabenindizes (A=0, ..., Z=25),
+auch für viele Schlüssel gleichzeitig (Brute Force, große Dateien)
+"""
+
+import numpy as np
+
+# ASCII-Codes
+_UPPER_A = ord('A')
+_LOWER_A = ord('a')
+_CASE_BIT = 0x20
+
+DEFAULT_BATCH_SIZE = 4096
+
+
+# -------------------------------------------------
+# Umwandlung Text <-> Indizes
+# -------------------------------------------------
+
+def text_to_indices(text: str) -> np.ndarray:
+    """
+    Wandelt die ASCII-Buchstaben eines Textes in Indizes um.
+    Alle anderen Zeichen werden ignoriert.
+
+    Args:
+        text: Der umzuwandelnde Text
+
+    Returns:
+        uint8-Array mit Werten 0..25
+    """
+    data = np.frombuffer(text.encode('ascii', 'ignore'), dtype=np.uint8)
+    folded = data | _CASE_BIT
+    mask = (folded >= _LOWER_A) & (folded <= ord('z'))
+    return folded[mask] - _LOWER_A
+
+
+def indices_to_text(indices: np.ndarray, lowercase: bool = False) -> str:
+    """
+    Wandelt ein 1-D-Array von Buchstabenindizes zurück in Text.
+
+    Args:
+        indices: uint8-Array mit Werten 0..25
+        lowercase: Kleinbuchstaben statt Großbuchstaben ausgeben
+
+    Returns:
+        Der Text
+    """
+    base = _LOWER_A if lowercase else _UPPER_A
+    return (np.asarray(indices, dtype=np.uint8) + base).tobytes().decode('ascii')
+
+
+def key_to_indices(key) -> np.ndarray:
+    """
+    Normalisiert einen Schlüssel zu einem uint8-Indexarray.
+
+    Args:
+        key: Schlüssel als String, 1-D-Array (L,) oder 2-D-Array (K, L)
+
+    Returns:
+        uint8-Array der Form (L,) bzw. (K, L)
+
+    Raises:
+        ValueError: Wenn der Schlüssel leer oder ungültig ist
+    """
+    if isinstance(key, str):
+        if not key or not key.isascii() or not key.isalpha():
+            raise ValueError("Der Schlüssel muss aus Buchstaben A-Z bestehen und darf nicht leer sein")
+        return text_to_indices(key)
+
+    key = np.asarray(key, dtype=np.uint8)
+    if key.ndim not in (1, 2) or key.shape[-1] == 0:
+        raise ValueError("Der Schlüssel muss die Form (L,) oder (K, L) haben")
+    return key
+
+
+def keys_to_strings(keys: np.ndarray) -> list:
+    """
+    Wandelt ein (K, L)-Schlüsselarray in eine Liste von Kleinbuchstaben-Schlüsseln um.
+    """
+    keys = np.asarray(keys, dtype=np.uint8)
+    length = keys.shape[1]
+    joined = indices_to_text(keys.ravel(), lowercase=True)
+    return [joined[i:i + length] for i in range(0, len(joined), length)]
+
+
+# -------------------------------------------------
+# Vektorisierte Chiffre
+# -------------------------------------------------
+
+def _key_stream(key: np.ndarray, n: int) -> np.ndarray:
+    """Wiederholt den Schlüssel (bzw. jede Zeile eines Schlüssel-Batches) auf Länge n"""
+    if key.ndim == 1:
+        return np.resize(key, n)
+    return key[:, np.arange(n) % key.shape[1]]
+
+
+def encrypt_array(indices: np.ndarray, key) -> np.ndarray:
+    """
+    Verschlüsselt Buchstabenindizes mit einem oder vielen Schlüsseln.
+
+    Args:
+        indices: uint8-Array (n,) bzw. (K, n) mit Werten 0..25
+        key: Schlüssel als String, (L,)- oder (K, L)-Array
+
+    Returns:
+        uint8-Array der Form (n,) bzw. (K, n)
+    """
+    indices = np.asarray(indices, dtype=np.uint8)
+    key = key_to_indices(key)
+    return (indices + _key_stream(key, indices.shape[-1])) % 26
+
+
+def decrypt_array(indices: np.ndarray, key) -> np.ndarray:
+    """
+    Entschlüsselt Buchstabenindizes mit einem oder vielen Schlüsseln.
+
+    Args:
+        indices: uint8-Array (n,) bzw. (K, n) mit Werten 0..25
+        key: Schlüssel als String, (L,)- oder (K, L)-Array
+
+    Returns:
+        uint8-Array der Form (n,) bzw. (K, n)
+    """
+    indices = np.asarray(indices, dtype=np.uint8)
+    key = key_to_indices(key)
+    # +26 verhindert den uint8-Unterlauf bei der Subtraktion
+    return (indices + 26 - _key_stream(key, indices.shape[-1])) % 26
+
+
+# -------------------------------------------------
+# Batch-Entschlüsselung für Brute Force
+# -------------------------------------------------
+
+def iter_key_batches(length: int, batch_size: int = DEFAULT_BATCH_SIZE, start: int = 0, stop: int = None):
+    """
+    Erzeugt alle 26^length Schlüssel als (K, length)-Arrays in Blöcken.
+    Die Reihenfolge entspricht itertools.product(ascii_lowercase, repeat=length).
+
+    Args:
+        length: Schlüssellänge
+        batch_size: Maximale Anzahl Schlüssel pro Block
+        start: Nummer des ersten Schlüssels (in obiger Reihenfolge)
+        stop: Nummer hinter dem letzten Schlüssel (Standard: 26^length)
+
+    Yields:
+        uint8-Arrays der Form (K, length) mit K <= batch_size
+    """
+    total = 26 ** length if stop is None else stop
+    powers = 26 ** np.arange(length - 1, -1, -1, dtype=np.int64)
+    for first in range(start, total, batch_size):
+        numbers = np.arange(first, min(first + batch_size, total), dtype=np.int64)
+        yield ((numbers[:, None] // powers) % 26).astype(np.uint8)
+
+
+def decrypt_batch(text: str, keys) -> list:
+    """
+    Entschlüsselt einen ASCII-Text mit vielen Schlüsseln in einem Aufruf.
+
+    Groß-/Kleinschreibung und Nicht-Buchstaben bleiben erhalten, d.h. das
+    Ergebnis entspricht VigenereCipher(key).decrypt_lowercase(text) für
+    jeden Schlüssel.
+
+    Args:
+        text: Der zu entschlüsselnde Text (nur ASCII)
+        keys: Schlüssel-Batch als (K, L)-Array
+
+    Returns:
+        Liste mit K Klartexten
+    """
+    keys = key_to_indices(keys)
+    if keys.ndim == 1:
+        keys = keys[None, :]
+
+    data = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    folded = data | _CASE_BIT
+    mask = (folded >= _LOWER_A) & (folded <= ord('z'))
+    case_base = np.where(data[mask] >= _LOWER_A, _LOWER_A, _UPPER_A).astype(np.uint8)
+
+    decrypted = decrypt_array(folded[mask] - _LOWER_A, keys)
+
+    output = np.repeat(data[None, :], len(keys), axis=0)
+    output[:, mask] = decrypted + case_base
+
+    n = len(data)
+    joined = output.tobytes().decode('ascii')
+    return [joined[i:i + n] for i in range(0, len(joined), n)] if n else [''] * len(keys)
+
+
+# -------------------------------------------------
+# Byte-Puffer (mmap)
+# -------------------------------------------------
+
+def _byte_shift_tables() -> np.ndarray:
+    """(26, 256)-Tabelle: Zeile s verschiebt A-Z/a-z um s, alle anderen Bytes bleiben"""
+    tables = np.tile(np.arange(256, dtype=np.uint8), (26, 1))
+    rotated = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+    tables[:, _UPPER_A:_UPPER_A + 26] = rotated + _UPPER_A
+    tables[:, _LOWER_A:_LOWER_A + 26] = rotated + _LOWER_A
+    return tables
+
+
+_BYTE_SHIFT_TABLES = _byte_shift_tables()
+
+
+def _shift_buffer(source, target, shifts: np.ndarray, offset: int) -> int:
+    """
+    Verschiebt die ASCII-Buchstaben von `source` nach `target` (gleich große
+    Byte-Puffer, z.B. Slices zweier mmaps); alle anderen Bytes werden
+    unverändert kopiert.
+    """
+    data = np.frombuffer(source, dtype=np.uint8)
+    output = np.frombuffer(target, dtype=np.uint8)
+    output[:] = data
+
+    folded = data | _CASE_BIT
+    mask = (folded >= _LOWER_A) & (folded <= ord('z'))
+    letters = data[mask]
+
+    # Die Schlüsselposition eines Buchstabens ist die Anzahl der Buchstaben davor
+    # (cumsum der Maske) plus offset. Nach dem Herausziehen ist das einfach die
+    # laufende Nummer: als (m, period)-Matrix hat jede Spalte einen festen Shift
+    # und wird mit einer 256-Byte-Tabelle übersetzt.
+    period = len(shifts)
+    rolled = np.roll(shifts, -(offset % period)).tolist()
+    full = len(letters) // period * period
+    columns = letters[:full].reshape(-1, period)
+    for column, shift in enumerate(rolled):
+        columns[:, column] = _BYTE_SHIFT_TABLES[shift][columns[:, column]]
+    tail = letters[full:]
+    tail[:] = _BYTE_SHIFT_TABLES[rolled[:len(tail)], tail]
+
+    output[mask] = letters
+    return len(letters)
+
+
+def encrypt_buffer(source, target, key, offset: int = 0) -> int:
+    """
+    Verschlüsselt einen Byte-Puffer direkt in einen gleich großen Zielpuffer
+    (Ergebnis wie VigenereCipher.encrypt_bytes).
+
+    Args:
+        source: Lesbarer Puffer (bytes, memoryview, mmap)
+        target: Beschreibbarer Puffer gleicher Größe
+        key: Schlüssel als String oder (L,)-Array
+        offset: Schlüsselposition des ersten Buchstabens
+
+    Returns:
+        Anzahl der verschlüsselten Buchstaben
+    """
+    return _shift_buffer(source, target, key_to_indices(key), offset)
+
+
+def decrypt_buffer(source, target, key, offset: int = 0) -> int:
+    """
+    Entschlüsselt einen Byte-Puffer direkt in einen gleich großen Zielpuffer
+    (Gegenstück zu encrypt_buffer).
+
+    Returns:
+        Anzahl der entschlüsselten Buchstaben
+    """
+    return _shift_buffer(source, target, (26 - key_to_indices(key)) % 26, offset)
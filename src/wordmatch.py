@@ -0,0 +1,104 @@
+"""
+Mehrfach-Mustersuche für die Wortlisten-Bewertung
+Aho-Corasick-Automat: findet alle Wordlist-Wörter in einem einzigen
+linearen Durchlauf über den Text
+"""
+
+
+class WordMatcher:
+    """
+    Aus einer Wortliste kompilierter Aho-Corasick-Automat.
+
+    Der Automat wird einmal aufgebaut und kann danach beliebig viele
+    Kandidatentexte durchsuchen; die Laufzeit pro Text hängt nur von der
+    Textlänge und der Anzahl der Treffer ab, nicht von der Größe der Wortliste.
+    """
+
+    def __init__(self, words):
+        """
+        Args:
+            words: Iterable mit Wörtern (leere Wörter werden ignoriert)
+        """
+        self.words = sorted({w for w in words if w})
+        self.lengths = [len(w) for w in self.words]
+
+        # Trie: Zustand -> {Zeichen: Folgezustand}
+        self._goto = [{}]
+        terminal = [()]
+        for word_id, word in enumerate(self.words):
+            state = 0
+            for char in word:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    terminal.append(())
+                state = next_state
+            terminal[state] = (word_id,)
+
+        # Fehlerlinks in Breitensuche; die Ausgabe eines Zustands enthält
+        # auch alle Wörter, die Suffix seines Präfixes sind
+        self._fail = [0] * len(self._goto)
+        self._out = list(terminal)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = terminal[next_state] + self._out[self._fail[next_state]]
+
+    def __len__(self):
+        return len(self.words)
+
+    def iter_matches(self, text: str):
+        """
+        Liefert alle (auch überlappenden) Vorkommen.
+
+        Args:
+            text: Der zu durchsuchende Text
+
+        Yields:
+            (end, word_id) mit end = Index hinter dem letzten Zeichen des Treffers,
+            aufsteigend nach end
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for word_id in out[state]:
+                yield end, word_id
+
+    def count(self, text: str) -> dict:
+        """
+        Zählt die Vorkommen aller Wörter mit derselben Semantik wie
+        str.count (nicht überlappend, von links nach rechts).
+
+        Args:
+            text: Der zu durchsuchende Text
+
+        Returns:
+            Dict {Wort: Anzahl} für alle gefundenen Wörter (in Reihenfolge des ersten Treffers)
+        """
+        lengths = self.lengths
+        counts = {}
+        next_free = {}
+
+        for end, word_id in self.iter_matches(text):
+            # Ein Treffer zählt nur, wenn er nicht mit dem vorigen Treffer
+            # desselben Wortes überlappt (wie bei str.count)
+            if end - lengths[word_id] >= next_free.get(word_id, 0):
+                counts[word_id] = counts.get(word_id, 0) + 1
+                next_free[word_id] = end
+
+        words = self.words
+        return {words[word_id]: n for word_id, n in counts.items()}